@@ -5,32 +5,269 @@ d = { 'settings': { 'branch': 'main',
                 'doc_host': 'https://cooper-richason.github.io',
                 'git_url': 'https://github.com/cooper-richason/cu_api',
                 'lib_path': 'cu_api'},
-  'syms': { 'cu_api.companies': { 'cu_api.companies.Query': ('API/companies.html#query', 'cu_api/companies.py'),
+  'syms': { 'cu_api.arrow': { 'cu_api.arrow.ParquetSink': ('API/arrow.html#parquetsink', 'cu_api/arrow.py'),
+                              'cu_api.arrow.ParquetSink.__enter__': ('API/arrow.html#parquetsink.__enter__', 'cu_api/arrow.py'),
+                              'cu_api.arrow.ParquetSink.__exit__': ('API/arrow.html#parquetsink.__exit__', 'cu_api/arrow.py'),
+                              'cu_api.arrow.ParquetSink.__init__': ('API/arrow.html#parquetsink.__init__', 'cu_api/arrow.py'),
+                              'cu_api.arrow.ParquetSink.__repr__': ('API/arrow.html#parquetsink.__repr__', 'cu_api/arrow.py'),
+                              'cu_api.arrow.ParquetSink.close': ('API/arrow.html#parquetsink.close', 'cu_api/arrow.py'),
+                              'cu_api.arrow.ParquetSink.flush': ('API/arrow.html#parquetsink.flush', 'cu_api/arrow.py'),
+                              'cu_api.arrow.ParquetSink.write': ('API/arrow.html#parquetsink.write', 'cu_api/arrow.py'),
+                              'cu_api.arrow._array': ('API/arrow.html#_array', 'cu_api/arrow.py'),
+                              'cu_api.arrow._cf_type': ('API/arrow.html#_cf_type', 'cu_api/arrow.py'),
+                              'cu_api.arrow._convert': ('API/arrow.html#_convert', 'cu_api/arrow.py'),
+                              'cu_api.arrow._native_fields': ('API/arrow.html#_native_fields', 'cu_api/arrow.py'),
+                              'cu_api.arrow._option_name': ('API/arrow.html#_option_name', 'cu_api/arrow.py'),
+                              'cu_api.arrow._require_pyarrow': ('API/arrow.html#_require_pyarrow', 'cu_api/arrow.py'),
+                              'cu_api.arrow._timestamp_type': ('API/arrow.html#_timestamp_type', 'cu_api/arrow.py'),
+                              'cu_api.arrow._wanted_fields': ('API/arrow.html#_wanted_fields', 'cu_api/arrow.py'),
+                              'cu_api.arrow.iter_tables': ('API/arrow.html#iter_tables', 'cu_api/arrow.py'),
+                              'cu_api.arrow.page_table': ('API/arrow.html#page_table', 'cu_api/arrow.py'),
+                              'cu_api.arrow.schema': ('API/arrow.html#schema', 'cu_api/arrow.py'),
+                              'cu_api.arrow.to_arrow': ('API/arrow.html#to_arrow', 'cu_api/arrow.py')},
+            'cu_api.benchmark': { 'cu_api.benchmark._measure': ('API/benchmark.html#_measure', 'cu_api/benchmark.py'),
+                                  'cu_api.benchmark._offline': ('API/benchmark.html#_offline', 'cu_api/benchmark.py'),
+                                  'cu_api.benchmark._percentiles': ('API/benchmark.html#_percentiles', 'cu_api/benchmark.py'),
+                                  'cu_api.benchmark._row': ('API/benchmark.html#_row', 'cu_api/benchmark.py'),
+                                  'cu_api.benchmark._server_latencies': ('API/benchmark.html#_server_latencies', 'cu_api/benchmark.py'),
+                                  'cu_api.benchmark._update_values': ('API/benchmark.html#_update_values', 'cu_api/benchmark.py'),
+                                  'cu_api.benchmark.bench_clean': ('API/benchmark.html#bench_clean', 'cu_api/benchmark.py'),
+                                  'cu_api.benchmark.bench_search': ('API/benchmark.html#bench_search', 'cu_api/benchmark.py'),
+                                  'cu_api.benchmark.bench_update': ('API/benchmark.html#bench_update', 'cu_api/benchmark.py'),
+                                  'cu_api.benchmark.run_benchmarks': ('API/benchmark.html#run_benchmarks', 'cu_api/benchmark.py')},
+            'cu_api.clean': { 'cu_api.clean._clean_date': ('API/clean.html#_clean_date', 'cu_api/clean.py'),
+                              'cu_api.clean._clean_dates': ('API/clean.html#_clean_dates', 'cu_api/clean.py'),
+                              'cu_api.clean._is_timestamp': ('API/clean.html#_is_timestamp', 'cu_api/clean.py'),
+                              'cu_api.clean._merge_by_id': ('API/clean.html#_merge_by_id', 'cu_api/clean.py'),
+                              'cu_api.clean._option_names': ('API/clean.html#_option_names', 'cu_api/clean.py'),
+                              'cu_api.clean._timezone': ('API/clean.html#_timezone', 'cu_api/clean.py'),
+                              'cu_api.clean.clean_custom_fields': ('API/clean.html#clean_custom_fields', 'cu_api/clean.py'),
+                              'cu_api.clean.set_timezone': ('API/clean.html#set_timezone', 'cu_api/clean.py')},
+            'cu_api.companies': { 'cu_api.companies.Query': ('API/companies.html#query', 'cu_api/companies.py'),
                                   'cu_api.companies.RetryLogger': ('API/companies.html#retrylogger', 'cu_api/companies.py'),
                                   'cu_api.companies.RetryLogger.__init__': ( 'API/companies.html#retrylogger.__init__',
                                                                              'cu_api/companies.py'),
                                   'cu_api.companies.RetryLogger.log_retry': ( 'API/companies.html#retrylogger.log_retry',
                                                                               'cu_api/companies.py'),
+                                  'cu_api.companies.UpdateJournal': ('API/companies.html#updatejournal', 'cu_api/companies.py'),
+                                  'cu_api.companies.UpdateJournal.__init__': ( 'API/companies.html#updatejournal.__init__',
+                                                                               'cu_api/companies.py'),
+                                  'cu_api.companies.UpdateJournal.__repr__': ( 'API/companies.html#updatejournal.__repr__',
+                                                                               'cu_api/companies.py'),
+                                  'cu_api.companies.UpdateJournal._load': ('API/companies.html#updatejournal._load', 'cu_api/companies.py'),
+                                  'cu_api.companies.UpdateJournal.close': ('API/companies.html#updatejournal.close', 'cu_api/companies.py'),
+                                  'cu_api.companies.UpdateJournal.record': ( 'API/companies.html#updatejournal.record',
+                                                                             'cu_api/companies.py'),
+                                  'cu_api.companies.UpdateJournal.record_async': ( 'API/companies.html#updatejournal.record_async',
+                                                                                   'cu_api/companies.py'),
+                                  'cu_api.companies.__getattr__': ('API/companies.html#__getattr__', 'cu_api/companies.py'),
+                                  'cu_api.companies._baseline': ('API/companies.html#_baseline', 'cu_api/companies.py'),
+                                  'cu_api.companies._build_payloads': ('API/companies.html#_build_payloads', 'cu_api/companies.py'),
                                   'cu_api.companies._bulk_update': ('API/companies.html#_bulk_update', 'cu_api/companies.py'),
+                                  'cu_api.companies._bulk_update_url': ('API/companies.html#_bulk_update_url', 'cu_api/companies.py'),
+                                  'cu_api.companies._changed_cells': ('API/companies.html#_changed_cells', 'cu_api/companies.py'),
                                   'cu_api.companies._clean_dataframe': ('API/companies.html#_clean_dataframe', 'cu_api/companies.py'),
+                                  'cu_api.companies._clean_records': ('API/companies.html#_clean_records', 'cu_api/companies.py'),
                                   'cu_api.companies._clean_row': ('API/companies.html#_clean_row', 'cu_api/companies.py'),
+                                  'cu_api.companies._clean_rows': ('API/companies.html#_clean_rows', 'cu_api/companies.py'),
+                                  'cu_api.companies._closing_session': ('API/companies.html#_closing_session', 'cu_api/companies.py'),
+                                  'cu_api.companies._companies_to_send': ('API/companies.html#_companies_to_send', 'cu_api/companies.py'),
+                                  'cu_api.companies._comparable': ('API/companies.html#_comparable', 'cu_api/companies.py'),
+                                  'cu_api.companies._dead_letters': ('API/companies.html#_dead_letters', 'cu_api/companies.py'),
+                                  'cu_api.companies._payload_values': ('API/companies.html#_payload_values', 'cu_api/companies.py'),
+                                  'cu_api.companies._post_batch': ('API/companies.html#_post_batch', 'cu_api/companies.py'),
                                   'cu_api.companies._run_async': ('API/companies.html#_run_async', 'cu_api/companies.py'),
                                   'cu_api.companies.bulk_update_async': ('API/companies.html#bulk_update_async', 'cu_api/companies.py'),
                                   'cu_api.companies.create_query': ('API/companies.html#create_query', 'cu_api/companies.py'),
+                                  'cu_api.companies.iter_search': ('API/companies.html#iter_search', 'cu_api/companies.py'),
                                   'cu_api.companies.search': ('API/companies.html#search', 'cu_api/companies.py'),
+                                  'cu_api.companies.search_async': ('API/companies.html#search_async', 'cu_api/companies.py'),
                                   'cu_api.companies.search_old': ('API/companies.html#search_old', 'cu_api/companies.py'),
                                   'cu_api.companies.set_headers': ('API/companies.html#set_headers', 'cu_api/companies.py'),
                                   'cu_api.companies.update': ('API/companies.html#update', 'cu_api/companies.py'),
                                   'cu_api.companies.update_batch': ('API/companies.html#update_batch', 'cu_api/companies.py')},
             'cu_api.config': {},
-            'cu_api.core': { 'cu_api.core.cf_option_name': ('API/core.html#cf_option_name', 'cu_api/core.py'),
+            'cu_api.core': { 'cu_api.core.Cassette': ('API/core.html#cassette', 'cu_api/core.py'),
+                             'cu_api.core.Cassette.__enter__': ('API/core.html#cassette.__enter__', 'cu_api/core.py'),
+                             'cu_api.core.Cassette.__exit__': ('API/core.html#cassette.__exit__', 'cu_api/core.py'),
+                             'cu_api.core.Cassette.__init__': ('API/core.html#cassette.__init__', 'cu_api/core.py'),
+                             'cu_api.core.Cassette.__repr__': ('API/core.html#cassette.__repr__', 'cu_api/core.py'),
+                             'cu_api.core.Cassette.close': ('API/core.html#cassette.close', 'cu_api/core.py'),
+                             'cu_api.core.Cassette.play': ('API/core.html#cassette.play', 'cu_api/core.py'),
+                             'cu_api.core.Cassette.record': ('API/core.html#cassette.record', 'cu_api/core.py'),
+                             'cu_api.core._CassetteAdapter': ('API/core.html#_cassetteadapter', 'cu_api/core.py'),
+                             'cu_api.core._CassetteAdapter.__init__': ('API/core.html#_cassetteadapter.__init__', 'cu_api/core.py'),
+                             'cu_api.core._CassetteAdapter.send': ('API/core.html#_cassetteadapter.send', 'cu_api/core.py'),
+                             'cu_api.core._CassetteRequest': ('API/core.html#_cassetterequest', 'cu_api/core.py'),
+                             'cu_api.core._CassetteRequest.__aenter__': ('API/core.html#_cassetterequest.__aenter__', 'cu_api/core.py'),
+                             'cu_api.core._CassetteRequest.__aexit__': ('API/core.html#_cassetterequest.__aexit__', 'cu_api/core.py'),
+                             'cu_api.core._CassetteRequest.__init__': ('API/core.html#_cassetterequest.__init__', 'cu_api/core.py'),
+                             'cu_api.core._CassetteSession': ('API/core.html#_cassettesession', 'cu_api/core.py'),
+                             'cu_api.core._CassetteSession.__getattr__': ('API/core.html#_cassettesession.__getattr__', 'cu_api/core.py'),
+                             'cu_api.core._CassetteSession.__init__': ('API/core.html#_cassettesession.__init__', 'cu_api/core.py'),
+                             'cu_api.core._CassetteSession.get': ('API/core.html#_cassettesession.get', 'cu_api/core.py'),
+                             'cu_api.core._CassetteSession.post': ('API/core.html#_cassettesession.post', 'cu_api/core.py'),
+                             'cu_api.core._CassetteSession.put': ('API/core.html#_cassettesession.put', 'cu_api/core.py'),
+                             'cu_api.core._CassetteSession.request': ('API/core.html#_cassettesession.request', 'cu_api/core.py'),
+                             'cu_api.core._ReplayedResponse': ('API/core.html#_replayedresponse', 'cu_api/core.py'),
+                             'cu_api.core._ReplayedResponse.__init__': ('API/core.html#_replayedresponse.__init__', 'cu_api/core.py'),
+                             'cu_api.core._ReplayedResponse.json': ('API/core.html#_replayedresponse.json', 'cu_api/core.py'),
+                             'cu_api.core._ReplayedResponse.read': ('API/core.html#_replayedresponse.read', 'cu_api/core.py'),
+                             'cu_api.core._ReplayedResponse.release': ('API/core.html#_replayedresponse.release', 'cu_api/core.py'),
+                             'cu_api.core._ReplayedResponse.text': ('API/core.html#_replayedresponse.text', 'cu_api/core.py'),
+                             'cu_api.core._body_text': ('API/core.html#_body_text', 'cu_api/core.py'),
+                             'cu_api.core._cf_cache_path': ('API/core.html#_cf_cache_path', 'cu_api/core.py'),
+                             'cu_api.core._cf_is_fresh': ('API/core.html#_cf_is_fresh', 'cu_api/core.py'),
+                             'cu_api.core._endpoint': ('API/core.html#_endpoint', 'cu_api/core.py'),
+                             'cu_api.core._entry_key': ('API/core.html#_entry_key', 'cu_api/core.py'),
+                             'cu_api.core._is_fresh': ('API/core.html#_is_fresh', 'cu_api/core.py'),
+                             'cu_api.core._mount_cassette': ('API/core.html#_mount_cassette', 'cu_api/core.py'),
+                             'cu_api.core._pool_size': ('API/core.html#_pool_size', 'cu_api/core.py'),
+                             'cu_api.core._rate_limited': ('API/core.html#_rate_limited', 'cu_api/core.py'),
+                             'cu_api.core._read_cf_cache': ('API/core.html#_read_cf_cache', 'cu_api/core.py'),
+                             'cu_api.core._read_entries': ('API/core.html#_read_entries', 'cu_api/core.py'),
+                             'cu_api.core._read_json': ('API/core.html#_read_json', 'cu_api/core.py'),
+                             'cu_api.core._replaying': ('API/core.html#_replaying', 'cu_api/core.py'),
+                             'cu_api.core._request_failed': ('API/core.html#_request_failed', 'cu_api/core.py'),
+                             'cu_api.core._size': ('API/core.html#_size', 'cu_api/core.py'),
+                             'cu_api.core._write_cf_cache': ('API/core.html#_write_cf_cache', 'cu_api/core.py'),
+                             'cu_api.core._write_json': ('API/core.html#_write_json', 'cu_api/core.py'),
+                             'cu_api.core.api_url': ('API/core.html#api_url', 'cu_api/core.py'),
+                             'cu_api.core.async_session': ('API/core.html#async_session', 'cu_api/core.py'),
+                             'cu_api.core.cf_option_id': ('API/core.html#cf_option_id', 'cu_api/core.py'),
+                             'cu_api.core.cf_option_name': ('API/core.html#cf_option_name', 'cu_api/core.py'),
+                             'cu_api.core.close_async_session': ('API/core.html#close_async_session', 'cu_api/core.py'),
+                             'cu_api.core.get_async_session': ('API/core.html#get_async_session', 'cu_api/core.py'),
+                             'cu_api.core.get_cassette': ('API/core.html#get_cassette', 'cu_api/core.py'),
                              'cu_api.core.get_cf_info': ('API/core.html#get_cf_info', 'cu_api/core.py'),
+                             'cu_api.core.get_cf_option_ids': ('API/core.html#get_cf_option_ids', 'cu_api/core.py'),
                              'cu_api.core.get_cf_options': ('API/core.html#get_cf_options', 'cu_api/core.py'),
                              'cu_api.core.get_session': ('API/core.html#get_session', 'cu_api/core.py'),
                              'cu_api.core.prc_clean_cf_data': ('API/core.html#prc_clean_cf_data', 'cu_api/core.py'),
                              'cu_api.core.prc_get_cf_fields': ('API/core.html#prc_get_cf_fields', 'cu_api/core.py'),
                              'cu_api.core.prc_request_cf_data': ('API/core.html#prc_request_cf_data', 'cu_api/core.py'),
-                             'cu_api.core.set_headers': ('API/core.html#set_headers', 'cu_api/core.py')},
+                             'cu_api.core.refresh_custom_fields': ('API/core.html#refresh_custom_fields', 'cu_api/core.py'),
+                             'cu_api.core.request': ('API/core.html#request', 'cu_api/core.py'),
+                             'cu_api.core.request_async': ('API/core.html#request_async', 'cu_api/core.py'),
+                             'cu_api.core.set_base_url': ('API/core.html#set_base_url', 'cu_api/core.py'),
+                             'cu_api.core.set_cassette': ('API/core.html#set_cassette', 'cu_api/core.py'),
+                             'cu_api.core.set_cf_cache': ('API/core.html#set_cf_cache', 'cu_api/core.py'),
+                             'cu_api.core.set_headers': ('API/core.html#set_headers', 'cu_api/core.py'),
+                             'cu_api.core.set_pool_size': ('API/core.html#set_pool_size', 'cu_api/core.py'),
+                             'cu_api.core.with_cassette': ('API/core.html#with_cassette', 'cu_api/core.py')},
+            'cu_api.events': { 'cu_api.events.Profile': ('API/events.html#profile', 'cu_api/events.py'),
+                               'cu_api.events.Profile.__call__': ('API/events.html#profile.__call__', 'cu_api/events.py'),
+                               'cu_api.events.Profile.__enter__': ('API/events.html#profile.__enter__', 'cu_api/events.py'),
+                               'cu_api.events.Profile.__exit__': ('API/events.html#profile.__exit__', 'cu_api/events.py'),
+                               'cu_api.events.Profile.__init__': ('API/events.html#profile.__init__', 'cu_api/events.py'),
+                               'cu_api.events.Profile.__repr__': ('API/events.html#profile.__repr__', 'cu_api/events.py'),
+                               'cu_api.events.Profile.requests': ('API/events.html#profile.requests', 'cu_api/events.py'),
+                               'cu_api.events.Profile.summary': ('API/events.html#profile.summary', 'cu_api/events.py'),
+                               'cu_api.events.Stats': ('API/events.html#stats', 'cu_api/events.py'),
+                               'cu_api.events.Stats.__call__': ('API/events.html#stats.__call__', 'cu_api/events.py'),
+                               'cu_api.events.Stats.__init__': ('API/events.html#stats.__init__', 'cu_api/events.py'),
+                               'cu_api.events.Stats.__repr__': ('API/events.html#stats.__repr__', 'cu_api/events.py'),
+                               'cu_api.events.Stats.reset': ('API/events.html#stats.reset', 'cu_api/events.py'),
+                               'cu_api.events.Stats.summary': ('API/events.html#stats.summary', 'cu_api/events.py'),
+                               'cu_api.events._listeners': ('API/events.html#_listeners', 'cu_api/events.py'),
+                               'cu_api.events.collect_stats': ('API/events.html#collect_stats', 'cu_api/events.py'),
+                               'cu_api.events.emit': ('API/events.html#emit', 'cu_api/events.py'),
+                               'cu_api.events.listening': ('API/events.html#listening', 'cu_api/events.py'),
+                               'cu_api.events.off': ('API/events.html#off', 'cu_api/events.py'),
+                               'cu_api.events.on': ('API/events.html#on', 'cu_api/events.py'),
+                               'cu_api.events.request_id': ('API/events.html#request_id', 'cu_api/events.py')},
+            'cu_api.limiter': { 'cu_api.limiter.ConcurrencyController': ('API/limiter.html#concurrencycontroller', 'cu_api/limiter.py'),
+                                'cu_api.limiter.ConcurrencyController.__aenter__': ( 'API/limiter.html#concurrencycontroller.__aenter__',
+                                                                                     'cu_api/limiter.py'),
+                                'cu_api.limiter.ConcurrencyController.__aexit__': ( 'API/limiter.html#concurrencycontroller.__aexit__',
+                                                                                    'cu_api/limiter.py'),
+                                'cu_api.limiter.ConcurrencyController.__init__': ( 'API/limiter.html#concurrencycontroller.__init__',
+                                                                                   'cu_api/limiter.py'),
+                                'cu_api.limiter.ConcurrencyController.__repr__': ( 'API/limiter.html#concurrencycontroller.__repr__',
+                                                                                   'cu_api/limiter.py'),
+                                'cu_api.limiter.ConcurrencyController._cut': ( 'API/limiter.html#concurrencycontroller._cut',
+                                                                               'cu_api/limiter.py'),
+                                'cu_api.limiter.ConcurrencyController.batch_size': ( 'API/limiter.html#concurrencycontroller.batch_size',
+                                                                                     'cu_api/limiter.py'),
+                                'cu_api.limiter.ConcurrencyController.limit': ( 'API/limiter.html#concurrencycontroller.limit',
+                                                                                'cu_api/limiter.py'),
+                                'cu_api.limiter.ConcurrencyController.record': ( 'API/limiter.html#concurrencycontroller.record',
+                                                                                 'cu_api/limiter.py'),
+                                'cu_api.limiter.RateLimiter': ('API/limiter.html#ratelimiter', 'cu_api/limiter.py'),
+                                'cu_api.limiter.RateLimiter.__init__': ('API/limiter.html#ratelimiter.__init__', 'cu_api/limiter.py'),
+                                'cu_api.limiter.RateLimiter.__repr__': ('API/limiter.html#ratelimiter.__repr__', 'cu_api/limiter.py'),
+                                'cu_api.limiter.RateLimiter._adjust': ('API/limiter.html#ratelimiter._adjust', 'cu_api/limiter.py'),
+                                'cu_api.limiter.RateLimiter._now': ('API/limiter.html#ratelimiter._now', 'cu_api/limiter.py'),
+                                'cu_api.limiter.RateLimiter._off_loop': ('API/limiter.html#ratelimiter._off_loop', 'cu_api/limiter.py'),
+                                'cu_api.limiter.RateLimiter._take': ('API/limiter.html#ratelimiter._take', 'cu_api/limiter.py'),
+                                'cu_api.limiter.RateLimiter.acquire': ('API/limiter.html#ratelimiter.acquire', 'cu_api/limiter.py'),
+                                'cu_api.limiter.RateLimiter.acquire_async': ( 'API/limiter.html#ratelimiter.acquire_async',
+                                                                              'cu_api/limiter.py'),
+                                'cu_api.limiter.RateLimiter.on_response': ('API/limiter.html#ratelimiter.on_response', 'cu_api/limiter.py'),
+                                'cu_api.limiter.RateLimiter.on_response_async': ( 'API/limiter.html#ratelimiter.on_response_async',
+                                                                                  'cu_api/limiter.py'),
+                                'cu_api.limiter.RateLimiter.reserve': ('API/limiter.html#ratelimiter.reserve', 'cu_api/limiter.py'),
+                                'cu_api.limiter.SharedRateLimiter': ('API/limiter.html#sharedratelimiter', 'cu_api/limiter.py'),
+                                'cu_api.limiter.SharedRateLimiter.__init__': ( 'API/limiter.html#sharedratelimiter.__init__',
+                                                                               'cu_api/limiter.py'),
+                                'cu_api.limiter.SharedRateLimiter.__repr__': ( 'API/limiter.html#sharedratelimiter.__repr__',
+                                                                               'cu_api/limiter.py'),
+                                'cu_api.limiter.SharedRateLimiter._connect': ( 'API/limiter.html#sharedratelimiter._connect',
+                                                                               'cu_api/limiter.py'),
+                                'cu_api.limiter.SharedRateLimiter._now': ('API/limiter.html#sharedratelimiter._now', 'cu_api/limiter.py'),
+                                'cu_api.limiter.SharedRateLimiter._off_loop': ( 'API/limiter.html#sharedratelimiter._off_loop',
+                                                                                'cu_api/limiter.py'),
+                                'cu_api.limiter.SharedRateLimiter._transaction': ( 'API/limiter.html#sharedratelimiter._transaction',
+                                                                                   'cu_api/limiter.py'),
+                                'cu_api.limiter.SharedRateLimiter.on_response': ( 'API/limiter.html#sharedratelimiter.on_response',
+                                                                                  'cu_api/limiter.py'),
+                                'cu_api.limiter.SharedRateLimiter.reserve': ( 'API/limiter.html#sharedratelimiter.reserve',
+                                                                              'cu_api/limiter.py'),
+                                'cu_api.limiter._parse_retry_after': ('API/limiter.html#_parse_retry_after', 'cu_api/limiter.py'),
+                                'cu_api.limiter.get_limiter': ('API/limiter.html#get_limiter', 'cu_api/limiter.py'),
+                                'cu_api.limiter.set_rate_limit': ('API/limiter.html#set_rate_limit', 'cu_api/limiter.py')},
+            'cu_api.mirror': { 'cu_api.mirror.Mirror': ('API/mirror.html#mirror', 'cu_api/mirror.py'),
+                               'cu_api.mirror.Mirror.__init__': ('API/mirror.html#mirror.__init__', 'cu_api/mirror.py'),
+                               'cu_api.mirror.Mirror.__repr__': ('API/mirror.html#mirror.__repr__', 'cu_api/mirror.py'),
+                               'cu_api.mirror.Mirror._columns': ('API/mirror.html#mirror._columns', 'cu_api/mirror.py'),
+                               'cu_api.mirror.Mirror._index': ('API/mirror.html#mirror._index', 'cu_api/mirror.py'),
+                               'cu_api.mirror.Mirror._read': ('API/mirror.html#mirror._read', 'cu_api/mirror.py'),
+                               'cu_api.mirror.Mirror._write': ('API/mirror.html#mirror._write', 'cu_api/mirror.py'),
+                               'cu_api.mirror.Mirror.close': ('API/mirror.html#mirror.close', 'cu_api/mirror.py'),
+                               'cu_api.mirror.Mirror.query': ('API/mirror.html#mirror.query', 'cu_api/mirror.py'),
+                               'cu_api.mirror.Mirror.snapshot': ('API/mirror.html#mirror.snapshot', 'cu_api/mirror.py'),
+                               'cu_api.mirror.Mirror.sync': ('API/mirror.html#mirror.sync', 'cu_api/mirror.py'),
+                               'cu_api.mirror._check_resource': ('API/mirror.html#_check_resource', 'cu_api/mirror.py'),
+                               'cu_api.mirror._column_kind': ('API/mirror.html#_column_kind', 'cu_api/mirror.py'),
+                               'cu_api.mirror._filter': ('API/mirror.html#_filter', 'cu_api/mirror.py'),
+                               'cu_api.mirror._from_sql_values': ('API/mirror.html#_from_sql_values', 'cu_api/mirror.py'),
+                               'cu_api.mirror._parse_timestamps': ('API/mirror.html#_parse_timestamps', 'cu_api/mirror.py'),
+                               'cu_api.mirror._quote': ('API/mirror.html#_quote', 'cu_api/mirror.py'),
+                               'cu_api.mirror._to_sql_values': ('API/mirror.html#_to_sql_values', 'cu_api/mirror.py')},
+            'cu_api.mock': { 'cu_api.mock.MockCopper': ('API/mock.html#mockcopper', 'cu_api/mock.py'),
+                             'cu_api.mock.MockCopper.__enter__': ('API/mock.html#mockcopper.__enter__', 'cu_api/mock.py'),
+                             'cu_api.mock.MockCopper.__exit__': ('API/mock.html#mockcopper.__exit__', 'cu_api/mock.py'),
+                             'cu_api.mock.MockCopper.__init__': ('API/mock.html#mockcopper.__init__', 'cu_api/mock.py'),
+                             'cu_api.mock.MockCopper.__repr__': ('API/mock.html#mockcopper.__repr__', 'cu_api/mock.py'),
+                             'cu_api.mock.MockCopper._bulk_update': ('API/mock.html#mockcopper._bulk_update', 'cu_api/mock.py'),
+                             'cu_api.mock.MockCopper._matching': ('API/mock.html#mockcopper._matching', 'cu_api/mock.py'),
+                             'cu_api.mock.MockCopper._respond': ('API/mock.html#mockcopper._respond', 'cu_api/mock.py'),
+                             'cu_api.mock.MockCopper._search': ('API/mock.html#mockcopper._search', 'cu_api/mock.py'),
+                             'cu_api.mock.MockCopper._serve': ('API/mock.html#mockcopper._serve', 'cu_api/mock.py'),
+                             'cu_api.mock.MockCopper._stats': ('API/mock.html#mockcopper._stats', 'cu_api/mock.py'),
+                             'cu_api.mock.MockCopper._user': ('API/mock.html#mockcopper._user', 'cu_api/mock.py'),
+                             'cu_api.mock.MockCopper._users': ('API/mock.html#mockcopper._users', 'cu_api/mock.py'),
+                             'cu_api.mock.MockCopper.app': ('API/mock.html#mockcopper.app', 'cu_api/mock.py'),
+                             'cu_api.mock.MockCopper.record': ('API/mock.html#mockcopper.record', 'cu_api/mock.py'),
+                             'cu_api.mock.MockCopper.start': ('API/mock.html#mockcopper.start', 'cu_api/mock.py'),
+                             'cu_api.mock.MockCopper.stop': ('API/mock.html#mockcopper.stop', 'cu_api/mock.py'),
+                             'cu_api.mock.MockCopper.url': ('API/mock.html#mockcopper.url', 'cu_api/mock.py'),
+                             'cu_api.mock._field_value': ('API/mock.html#_field_value', 'cu_api/mock.py'),
+                             'cu_api.mock._fields_on': ('API/mock.html#_fields_on', 'cu_api/mock.py'),
+                             'cu_api.mock._free_port': ('API/mock.html#_free_port', 'cu_api/mock.py'),
+                             'cu_api.mock._generated_fields': ('API/mock.html#_generated_fields', 'cu_api/mock.py'),
+                             'cu_api.mock._matches': ('API/mock.html#_matches', 'cu_api/mock.py'),
+                             'cu_api.mock._mix': ('API/mock.html#_mix', 'cu_api/mock.py')},
             'cu_api.query': { 'cu_api.query.Query': ('API/query.html#query', 'cu_api/query.py'),
                               'cu_api.query.Query.__getitem__': ('API/query.html#query.__getitem__', 'cu_api/query.py'),
                               'cu_api.query.Query.__init__': ('API/query.html#query.__init__', 'cu_api/query.py'),
@@ -48,13 +285,69 @@ d = { 'settings': { 'branch': 'main',
                               'cu_api.query._check_key': ('API/query.html#_check_key', 'cu_api/query.py'),
                               'cu_api.query._check_value': ('API/query.html#_check_value', 'cu_api/query.py'),
                               'cu_api.query._process_query': ('API/query.html#_process_query', 'cu_api/query.py')},
-            'cu_api.search': { 'cu_api.search._search_loop': ('API/search.html#_search_loop', 'cu_api/search.py'),
+            'cu_api.search': { 'cu_api.search.SearchCache': ('API/search.html#searchcache', 'cu_api/search.py'),
+                               'cu_api.search.SearchCache.__init__': ('API/search.html#searchcache.__init__', 'cu_api/search.py'),
+                               'cu_api.search.SearchCache.__repr__': ('API/search.html#searchcache.__repr__', 'cu_api/search.py'),
+                               'cu_api.search.SearchCache._file': ('API/search.html#searchcache._file', 'cu_api/search.py'),
+                               'cu_api.search.SearchCache._remember': ('API/search.html#searchcache._remember', 'cu_api/search.py'),
+                               'cu_api.search.SearchCache.get': ('API/search.html#searchcache.get', 'cu_api/search.py'),
+                               'cu_api.search.SearchCache.invalidate': ('API/search.html#searchcache.invalidate', 'cu_api/search.py'),
+                               'cu_api.search.SearchCache.put': ('API/search.html#searchcache.put', 'cu_api/search.py'),
+                               'cu_api.search._account': ('API/search.html#_account', 'cu_api/search.py'),
+                               'cu_api.search._cache_key': ('API/search.html#_cache_key', 'cu_api/search.py'),
+                               'cu_api.search._canonical': ('API/search.html#_canonical', 'cu_api/search.py'),
+                               'cu_api.search._checkpoint_dir': ('API/search.html#_checkpoint_dir', 'cu_api/search.py'),
+                               'cu_api.search._field_queries': ('API/search.html#_field_queries', 'cu_api/search.py'),
+                               'cu_api.search._load_page': ('API/search.html#_load_page', 'cu_api/search.py'),
+                               'cu_api.search._modified_since': ('API/search.html#_modified_since', 'cu_api/search.py'),
+                               'cu_api.search._page_params': ('API/search.html#_page_params', 'cu_api/search.py'),
+                               'cu_api.search._page_path': ('API/search.html#_page_path', 'cu_api/search.py'),
+                               'cu_api.search._parse_page': ('API/search.html#_parse_page', 'cu_api/search.py'),
+                               'cu_api.search._query_key': ('API/search.html#_query_key', 'cu_api/search.py'),
+                               'cu_api.search._read_gz': ('API/search.html#_read_gz', 'cu_api/search.py'),
+                               'cu_api.search._request_page': ('API/search.html#_request_page', 'cu_api/search.py'),
+                               'cu_api.search._request_page_async': ('API/search.html#_request_page_async', 'cu_api/search.py'),
+                               'cu_api.search._save_page': ('API/search.html#_save_page', 'cu_api/search.py'),
+                               'cu_api.search._search_loop': ('API/search.html#_search_loop', 'cu_api/search.py'),
+                               'cu_api.search._search_options': ('API/search.html#_search_options', 'cu_api/search.py'),
+                               'cu_api.search._set_sync_mark': ('API/search.html#_set_sync_mark', 'cu_api/search.py'),
+                               'cu_api.search._sync_marks': ('API/search.html#_sync_marks', 'cu_api/search.py'),
+                               'cu_api.search._sync_marks_path': ('API/search.html#_sync_marks_path', 'cu_api/search.py'),
+                               'cu_api.search._unique_records': ('API/search.html#_unique_records', 'cu_api/search.py'),
+                               'cu_api.search._write_gz': ('API/search.html#_write_gz', 'cu_api/search.py'),
                                'cu_api.search.get_owners': ('API/search.html#get_owners', 'cu_api/search.py'),
-                               'cu_api.search.search_over_field': ('API/search.html#search_over_field', 'cu_api/search.py')},
+                               'cu_api.search.get_owners_async': ('API/search.html#get_owners_async', 'cu_api/search.py'),
+                               'cu_api.search.get_search_cache': ('API/search.html#get_search_cache', 'cu_api/search.py'),
+                               'cu_api.search.get_sync_mark': ('API/search.html#get_sync_mark', 'cu_api/search.py'),
+                               'cu_api.search.invalidate_search_cache': ('API/search.html#invalidate_search_cache', 'cu_api/search.py'),
+                               'cu_api.search.iter_search': ('API/search.html#iter_search', 'cu_api/search.py'),
+                               'cu_api.search.iter_search_over_field': ('API/search.html#iter_search_over_field', 'cu_api/search.py'),
+                               'cu_api.search.reset_sync_mark': ('API/search.html#reset_sync_mark', 'cu_api/search.py'),
+                               'cu_api.search.search_async': ('API/search.html#search_async', 'cu_api/search.py'),
+                               'cu_api.search.search_over_field': ('API/search.html#search_over_field', 'cu_api/search.py'),
+                               'cu_api.search.search_over_field_async': ('API/search.html#search_over_field_async', 'cu_api/search.py'),
+                               'cu_api.search.set_checkpoint_dir': ('API/search.html#set_checkpoint_dir', 'cu_api/search.py'),
+                               'cu_api.search.set_search_cache': ('API/search.html#set_search_cache', 'cu_api/search.py'),
+                               'cu_api.search.set_sync_marks': ('API/search.html#set_sync_marks', 'cu_api/search.py')},
             'cu_api.tasks': { 'cu_api.tasks.Query': ('tasks.html#query', 'cu_api/tasks.py'),
                               'cu_api.tasks._clean_dataframe': ('tasks.html#_clean_dataframe', 'cu_api/tasks.py'),
+                              'cu_api.tasks._clean_records': ('tasks.html#_clean_records', 'cu_api/tasks.py'),
                               'cu_api.tasks._clean_row': ('tasks.html#_clean_row', 'cu_api/tasks.py'),
+                              'cu_api.tasks._clean_rows': ('tasks.html#_clean_rows', 'cu_api/tasks.py'),
                               'cu_api.tasks.create_query': ('tasks.html#create_query', 'cu_api/tasks.py'),
+                              'cu_api.tasks.iter_search': ('tasks.html#iter_search', 'cu_api/tasks.py'),
                               'cu_api.tasks.search': ('tasks.html#search', 'cu_api/tasks.py'),
+                              'cu_api.tasks.search_async': ('tasks.html#search_async', 'cu_api/tasks.py'),
                               'cu_api.tasks.set_headers': ('tasks.html#set_headers', 'cu_api/tasks.py'),
-                              'cu_api.tasks.update': ('tasks.html#update', 'cu_api/tasks.py')}}}
+                              'cu_api.tasks.update': ('tasks.html#update', 'cu_api/tasks.py')},
+            'cu_api.users': { 'cu_api.users._add_users': ('API/users.html#_add_users', 'cu_api/users.py'),
+                              'cu_api.users._found_user': ('API/users.html#_found_user', 'cu_api/users.py'),
+                              'cu_api.users._from_disk': ('API/users.html#_from_disk', 'cu_api/users.py'),
+                              'cu_api.users._store_users': ('API/users.html#_store_users', 'cu_api/users.py'),
+                              'cu_api.users._user_cache_path': ('API/users.html#_user_cache_path', 'cu_api/users.py'),
+                              'cu_api.users._users_are_fresh': ('API/users.html#_users_are_fresh', 'cu_api/users.py'),
+                              'cu_api.users.get_user_names': ('API/users.html#get_user_names', 'cu_api/users.py'),
+                              'cu_api.users.get_user_names_async': ('API/users.html#get_user_names_async', 'cu_api/users.py'),
+                              'cu_api.users.load_users': ('API/users.html#load_users', 'cu_api/users.py'),
+                              'cu_api.users.load_users_async': ('API/users.html#load_users_async', 'cu_api/users.py'),
+                              'cu_api.users.set_user_cache': ('API/users.html#set_user_cache', 'cu_api/users.py')}}}
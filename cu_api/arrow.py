@@ -0,0 +1,212 @@
+"""Building pyarrow Tables and Parquet files from search results without going through pandas"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/arrow.ipynb.
+
+# %% auto 0
+__all__ = ['schema', 'page_table', 'iter_tables', 'ParquetSink', 'to_arrow']
+
+# %% ../nbs/API/arrow.ipynb 3
+import time, json
+from . import core, config, events
+from .clean import _timezone, _is_timestamp
+from .search import get_owners
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+# %% ../nbs/API/arrow.ipynb 5
+def _require_pyarrow():
+    if pa is None: raise ImportError("Arrow output needs pyarrow, install it with `pip install pyarrow`")
+
+def _timestamp_type():
+    tz = _timezone()
+    return pa.timestamp('s', tz=getattr(tz, 'zone', None) or str(tz))
+
+def _native_fields(resource:str)->list:
+    """(column, type, getter) for each native column of `resource`"""
+    get = lambda key: (lambda record: record.get(key))
+    address = lambda key: (lambda record: (record.get('address') or {}).get(key))
+    related = lambda key: (lambda record: (record.get('related_resource') or {}).get(key))
+    if resource == 'companies':
+        return [('id', pa.int64(), get('id')), ('name', pa.string(), get('name')),
+                ('assignee_id', pa.int64(), get('assignee_id')), ('contact_type_id', pa.int64(), get('contact_type_id'))] + \
+               [(key, pa.string(), address(key)) for key in ('street', 'city', 'state', 'postal_code', 'country')]
+    if resource == 'tasks':
+        return [('related_id', pa.int64(), related('id')), ('related_type', pa.string(), related('type'))] + \
+               [(key, _timestamp_type(), get(key)) for key in ('due_date', 'reminder_date', 'completed_date')] + \
+               [('id', pa.int64(), get('id')), ('name', pa.string(), get('name')),
+                ('assignee_id', pa.int64(), get('assignee_id')), ('tags', pa.list_(pa.string()), get('tags'))]
+    raise ValueError(f"Unknown resource {resource!r}, expected 'companies' or 'tasks'")
+
+def _cf_type(cf_info:dict):
+    data_type = cf_info.get('data_type')
+    if data_type == 'MultiSelect': return pa.list_(pa.string())
+    if 'options' in cf_info:       return pa.string()
+    if data_type == 'Date':        return _timestamp_type()
+    if data_type in ('Float', 'Currency', 'Percentage'): return pa.float64()
+    if data_type == 'Checkbox':    return pa.bool_()
+    return pa.string()
+
+def _wanted_fields(cf_fields:list)->list:
+    """Ids of the requested custom fields, in the order Copper lists them"""
+    core.prc_get_cf_fields()
+    return [cf_id for cf_id, cf_name in getattr(config, 'CUSTOM_FIELDS_DICT').items() if cf_name in cf_fields or cf_id in cf_fields]
+
+def schema(resource:str, # 'companies' or 'tasks'
+           cf_fields:list = [], # Custom fields to include, by name or id
+           drop:list = None, # Columns to leave out
+          )->'pa.Schema':
+    """Arrow schema of the tables built for a search"""
+    _require_pyarrow()
+    wanted = _wanted_fields(cf_fields)
+    custom_fields, names = getattr(config, 'CUSTOM_FIELDS'), getattr(config, 'CUSTOM_FIELDS_DICT')
+    fields = [(column, arrow_type) for column, arrow_type, _ in _native_fields(resource)]
+    fields += [(names[cf_id], _cf_type(custom_fields[cf_id])) for cf_id in wanted]
+    fields += [('Owned By', pa.string())]
+    return pa.schema([pa.field(column, arrow_type) for column, arrow_type in fields if column not in (drop or [])])
+
+# %% ../nbs/API/arrow.ipynb 8
+def _convert(value, arrow_type):
+    """A single value as `arrow_type`, or None when it doesn't fit"""
+    if value is None: return None
+    try:
+        if pa.types.is_timestamp(arrow_type): return value if _is_timestamp(value) else None
+        if pa.types.is_list(arrow_type):      return [None if item is None else str(item) for item in (value if isinstance(value, list) else [value])]
+        if pa.types.is_string(arrow_type):    return value if isinstance(value, str) else json.dumps(value)
+        if pa.types.is_boolean(arrow_type):   return value if isinstance(value, bool) else None
+        if pa.types.is_integer(arrow_type):   return int(value)
+        if pa.types.is_floating(arrow_type):  return float(value)
+    except (TypeError, ValueError):
+        pass
+    return None
+
+def _array(values:list, arrow_type)->'pa.Array':
+    """`values` as an Arrow array, converting them one by one only if they don't all fit"""
+    if pa.types.is_timestamp(arrow_type): values = [value if _is_timestamp(value) else None for value in values]
+    try:
+        return pa.array(values, type=arrow_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError, OverflowError):
+        return pa.array([_convert(value, arrow_type) for value in values], type=arrow_type)
+
+def _option_name(cf_info:dict):
+    options = cf_info['options']
+    if cf_info.get('data_type') == 'MultiSelect':
+        return lambda value: None if value is None else [options.get(item) for item in (value if isinstance(value, list) else [value])]
+    return lambda value: None if value is None else options.get(value)
+
+def page_table(records:list, # Raw records of one page
+               resource:str, # 'companies' or 'tasks'
+               table_schema:'pa.Schema', # Schema from `schema`
+               owners:dict = None, # assignee_id -> name, extended with any new owners
+              )->'pa.Table':
+    """Cleans one page of raw records into a table with `table_schema`"""
+    _require_pyarrow()
+    started = time.perf_counter()
+    if owners is None: owners = {}
+    custom_fields, cf_ids = getattr(config, 'CUSTOM_FIELDS'), getattr(config, 'CF_ID_LOOKUP')
+    natives = {column: getter for column, _, getter in _native_fields(resource)}
+    values = [{item['custom_field_definition_id']: item['value'] for item in record.get('custom_fields') or []} for record in records]
+
+    new_ids = {record.get('assignee_id') for record in records} - set(owners) - {None}
+    looked_up = 0.0
+    if new_ids:
+        looking_up = time.perf_counter()
+        found = get_owners([int(userid) for userid in new_ids])
+        owners.update({userid: found.get(int(userid)) for userid in new_ids})
+        looked_up = time.perf_counter() - looking_up
+        events.emit('stage', name='owners', seconds=looked_up)
+
+    arrays = []
+    for field in table_schema:
+        if field.name in natives:
+            column = [natives[field.name](record) for record in records]
+        elif field.name == 'Owned By':
+            column = [owners.get(record.get('assignee_id')) for record in records]
+        else:
+            cf_id = cf_ids[field.name]
+            column = [value.get(cf_id) for value in values]
+            if 'options' in custom_fields[cf_id]: column = list(map(_option_name(custom_fields[cf_id]), column))
+        arrays.append(_array(column, field.type))
+
+    table = pa.Table.from_arrays(arrays, schema=table_schema)
+    # The owners lookup is its own stage
+    events.emit('rows_cleaned', resource=resource, rows=len(records), seconds=time.perf_counter() - started - looked_up)
+    return table
+
+def iter_tables(pages, # Iterable of pages of raw records
+                resource:str, # 'companies' or 'tasks'
+                cf_fields:list = [], # Custom fields to include, by name or id
+                drop:list = None, # Columns to leave out
+               ):
+    """Yields a table for every non-empty page"""
+    table_schema, owners = schema(resource, cf_fields, drop), {}
+    for records in pages:
+        if records: yield page_table(records, resource, table_schema, owners)
+
+# %% ../nbs/API/arrow.ipynb 11
+class ParquetSink:
+    """Streams tables into a Parquet file, one row group every `row_group_size` rows"""
+    def __init__(self,
+                 path:str, # Parquet file to write
+                 row_group_size:int = 100_000, # Rows buffered before a row group is written
+                 **kwargs # Passed on to `pyarrow.parquet.ParquetWriter`, e.g. `compression='zstd'`
+                ):
+        _require_pyarrow()
+        self.path, self.row_group_size, self.kwargs = path, row_group_size, kwargs
+        self.rows, self.row_groups = 0, 0
+        self._writer, self._buffer, self._buffered = None, [], 0
+
+    def __repr__(self):
+        return f"ParquetSink({self.path!r}, {self.rows} rows in {self.row_groups} row groups)"
+
+    def write(self, table:'pa.Table'):
+        """Adds a table, writing a row group once enough rows are buffered"""
+        if self._writer is None: self._writer = pq.ParquetWriter(self.path, table.schema, **self.kwargs)
+        self._buffer.append(table)
+        self._buffered += table.num_rows
+        if self._buffered >= self.row_group_size: self.flush()
+
+    def flush(self):
+        """Writes whatever is buffered as a row group"""
+        if not self._buffered: return
+        self._writer.write_table(pa.concat_tables(self._buffer), row_group_size=self._buffered)
+        self.rows += self._buffered
+        self.row_groups += 1
+        self._buffer, self._buffered = [], 0
+
+    def close(self, schema:'pa.Schema' = None, # Schema for an empty file if nothing was written
+             ):
+        """Writes the last row group and finishes the file"""
+        if self._writer is None and schema is not None: self._writer = pq.ParquetWriter(self.path, schema, **self.kwargs)
+        if self._writer is None: return
+        self.flush()
+        self._writer.close()
+        self._writer = None
+
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
+
+def to_arrow(pages, # Iterable of pages of raw records
+             resource:str, # 'companies' or 'tasks'
+             cf_fields:list = [], # Custom fields to include, by name or id
+             drop:list = None, # Columns to leave out
+             sink = None, # Parquet file path or `ParquetSink` to stream the tables into
+            ):
+    """
+    One table with every page, or, with a `sink`, writes the pages to it as they arrive
+    and returns the closed `ParquetSink`.
+    """
+    table_schema = schema(resource, cf_fields, drop)
+    tables = iter_tables(pages, resource, cf_fields, drop)
+    if sink is None:
+        return pa.concat_tables([table_schema.empty_table(), *tables])
+
+    if not isinstance(sink, ParquetSink): sink = ParquetSink(sink)
+    try:
+        for table in tables: sink.write(table)
+    finally:
+        sink.close(table_schema)
+    return sink
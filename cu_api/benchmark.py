@@ -0,0 +1,138 @@
+"""Throughput, latency and memory of searching, cleaning and updating, measured against the mock server"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/benchmark.ipynb.
+
+# %% auto 0
+__all__ = ['bench_search', 'bench_clean', 'bench_update', 'run_benchmarks']
+
+# %% ../nbs/API/benchmark.ipynb 3
+import os, time, tracemalloc, contextlib
+import requests
+import numpy as np
+import pandas as pd
+from . import core, config, companies, limiter
+from .search import _search_loop
+from .mock import MockCopper
+
+# %% ../nbs/API/benchmark.ipynb 5
+def _percentiles(seconds:list)->dict:
+    """p50, p95 and p99 in milliseconds"""
+    if not len(seconds): return {'p50_ms': np.nan, 'p95_ms': np.nan, 'p99_ms': np.nan}
+    p50, p95, p99 = np.percentile(np.asarray(seconds) * 1000, [50, 95, 99])
+    return {'p50_ms': p50, 'p95_ms': p95, 'p99_ms': p99}
+
+def _measure(func, memory:bool = True):
+    """Runs `func()`, returns its result, the seconds it took and its peak allocation in MB"""
+    if memory: tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        result = func()
+        seconds = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1] / 1024 ** 2 if memory else np.nan
+    finally:
+        if memory: tracemalloc.stop()
+    return result, seconds, peak
+
+def _server_latencies(server:MockCopper, path:str)->list:
+    """Seconds the server spent on each request to `path` since the last call"""
+    log = requests.get(f"{server.url}/_mock/stats").json()
+    return [seconds for method, request_path, status, seconds in log if request_path == path]
+
+def _row(stage:str, records:int, seconds:float, peak:float, latencies:list)->dict:
+    return {'stage': stage, 'records': records, 'seconds': seconds, 'records_per_s': records / seconds if seconds else np.nan,
+            **_percentiles(latencies), 'peak_mb': peak}
+
+# %% ../nbs/API/benchmark.ipynb 7
+@contextlib.contextmanager
+def _offline(server:MockCopper,
+             rate:float, # Requests per second allowed by the client's limiter
+            ):
+    """Runs the block against `server` with a clean `config`, restoring everything afterwards"""
+    saved = {key: value for key, value in vars(config).items() if not key.startswith('__')}
+    environ = {key: os.environ.pop(key) for key in list(os.environ) if key.startswith('CU_API_')}
+    for key in saved: delattr(config, key)
+    try:
+        core.set_base_url(server.url)
+        core.set_headers('benchmark', 'benchmark@example.com')
+        limiter.set_rate_limit(rate, burst=max(1, int(rate)))
+        core.prc_get_cf_fields()
+        yield
+    finally:
+        if isinstance(getattr(config, 'SESSION', None), requests.Session): config.SESSION.close()
+        for key in [key for key in vars(config) if not key.startswith('__')]: delattr(config, key)
+        for key, value in saved.items(): setattr(config, key, value)
+        os.environ.update(environ)
+
+# %% ../nbs/API/benchmark.ipynb 9
+def bench_search(server:MockCopper, memory:bool = True, max_workers:int = 8)->tuple:
+    """Searches every company on `server`. Returns the benchmark row, the raw records and the custom fields"""
+    (records, Outputs), seconds, peak = _measure(lambda: _search_loop(companies.Query(), core.api_url('companies/search'),
+                                                                       max_workers=max_workers), memory)
+    return _row('search', len(records), seconds, peak, _server_latencies(server, '/companies/search')), records, Outputs
+
+def bench_clean(records:list, memory:bool = True, page_size:int = 100)->list:
+    """Cleans `records` page by page with both cleaners. Returns a benchmark row for each"""
+    cf_fields = list(getattr(config, 'CUSTOM_FIELDS_DICT'))
+    rows = []
+    for stage, clean in [('clean_rows',    lambda page: companies._clean_rows(page, cf_fields, progress=False)),
+                         ('clean_records', lambda page: companies._clean_records(page, cf_fields))]:
+        def run():
+            timings = []
+            for start in range(0, len(records), page_size):
+                started = time.perf_counter()
+                clean(records[start:start + page_size])
+                timings.append(time.perf_counter() - started)
+            return timings
+        timings, seconds, peak = _measure(run, memory)
+        rows.append(_row(stage, len(records), seconds, peak, timings))
+    return rows
+
+def _update_values(server:MockCopper, count:int)->pd.DataFrame:
+    """New values for a dropdown and a plain custom field on `count` companies"""
+    fields = [field for field in server.custom_fields if 'company' in field.get('available_on', [])]
+    dropdown = next((field for field in fields if 'options' in field), None)
+    plain = next((field for field in fields if field.get('data_type') in ('String', 'Text', 'Float')), None)
+    df = pd.DataFrame({'id': np.arange(1, count + 1)})
+    if dropdown is not None:
+        names = [option['name'] for option in dropdown['options']]
+        df[dropdown['name']] = [names[i % len(names)] for i in range(count)]
+    if plain is not None:
+        df[plain['name']] = np.arange(count) / 10 if plain['data_type'] == 'Float' else [f"Benchmark {i}" for i in range(count)]
+    return df
+
+def bench_update(server:MockCopper, count:int, memory:bool = True, batch_size:int = 10, **kwargs)->dict:
+    """Updates a dropdown and a plain custom field on `count` companies through `bulk_update_async`"""
+    df = _update_values(server, count)
+    fields = [column for column in df.columns if column != 'id']
+    headers = core.get_session().headers
+    dead, seconds, peak = _measure(lambda: companies._run_async(companies.bulk_update_async, df, fields, headers=headers,
+                                                                batch_size=batch_size, **kwargs), memory)
+    if len(dead): print(f"{len(dead)} companies were not updated during the benchmark.")
+    return _row('update', len(df), seconds, peak, _server_latencies(server, '/companies/bulk_update'))
+
+# %% ../nbs/API/benchmark.ipynb 10
+def run_benchmarks(sizes = (1_000, 50_000, 500_000), # Numbers of companies to benchmark with
+                   stages = ('search', 'clean', 'update'), # Stages to run, search always runs to get the records
+                   latency = 0.0, # Seconds the mock server adds to each response, or a (low, high) range
+                   rate_429:float = 0.0, # Share of requests the mock server rate limits
+                   rate:float = 1000, # Requests per second allowed by the client's limiter
+                   max_workers:int = 8, # Pages fetched at once while searching
+                   memory:bool = True, # Measure peak memory with tracemalloc
+                   custom_fields = None, # Passed on to `MockCopper`
+                  )->pd.DataFrame:
+    """
+    Runs each stage against a `MockCopper` of every size in `sizes` and returns one row per
+    stage and size with the seconds taken, records per second, latency percentiles and peak
+    memory. The server runs in a child process so it does not take from the measured code.
+    """
+    rows = []
+    for size in sizes:
+        server = MockCopper(companies=size, tasks=0, custom_fields=custom_fields, latency=latency, rate_429=rate_429, retry_after=0)
+        with server.start(process=True), _offline(server, rate):
+            print(f"Benchmarking {size:,} companies...")
+            row, records, Outputs = bench_search(server, memory, max_workers)
+            if 'search' in stages: rows.append(row)
+            if 'clean' in stages:  rows.extend(bench_clean(records, memory))
+            if 'update' in stages: rows.append(bench_update(server, len(records), memory))
+            del records
+    return pd.DataFrame(rows)
@@ -0,0 +1,102 @@
+"""Turning raw Copper records into DataFrames"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/clean.ipynb.
+
+# %% auto 0
+__all__ = ['set_timezone', 'clean_custom_fields']
+
+# %% ../nbs/API/clean.ipynb 3
+import pandas as pd
+import pytz
+from . import core, config
+
+# %% ../nbs/API/clean.ipynb 5
+def set_timezone(tz = 'US/Central', # Timezone name, or a pytz timezone
+                ):
+    """Sets the timezone that Unix timestamps are converted to when cleaning records"""
+    config.TIMEZONE = pytz.timezone(tz) if isinstance(tz, str) else tz
+
+def _timezone():
+    if getattr(config, 'TIMEZONE', None) is None: set_timezone()
+    return config.TIMEZONE
+
+def _is_timestamp(date)->bool:
+    # Integers with 6 to 10 characters are assumed to be Unix timestamps
+    return type(date) is int and (100000 <= date <= 9999999999 or -999999999 <= date <= -10000)
+
+def _clean_date(date):
+    """Converts a Unix timestamp to a datetime in the cleaning timezone, other values are returned as they are"""
+    try:
+        if _is_timestamp(date): return pd.to_datetime(date, unit='s',utc=True).tz_convert(_timezone())
+        else:                   return date
+    except Exception as e:
+        return date
+
+def _clean_dates(column:pd.Series)->pd.Series:
+    """Vectorized `_clean_date`: every Unix timestamp in the column is converted with one `to_datetime` call"""
+    is_int = column.map(type, na_action='ignore') == int
+    values = pd.to_numeric(column.where(is_int), errors='coerce')
+
+    # Same test as `_is_timestamp`: integers with 6 to 10 characters
+    is_timestamp = is_int & (values.between(100000, 9999999999) | values.between(-999999999, -10000))
+    if not is_timestamp.any(): return column
+
+    new_dates = pd.to_datetime(values[is_timestamp].astype('int64'), unit='s', utc=True).dt.tz_convert(_timezone())
+    if is_timestamp.all(): return new_dates
+
+    cleaned = column.astype(object).copy()
+    cleaned[is_timestamp] = new_dates.astype(object)
+    return cleaned
+
+def _option_names(options:dict):
+    """Returns a function mapping option ids (or lists of them, for multi-selects) to their names"""
+    def option_name(value):
+        if isinstance(value, list): return [options.get(item) for item in value]
+        return options.get(value)
+    return option_name
+
+def clean_custom_fields(records:list, # Raw records returned by a search
+                        cf_fields:list = [], # Custom fields to include, by name or id
+                       )->pd.DataFrame: # One column per custom field, one row per record
+    """Cleans the custom fields of every record at once"""
+
+    core.prc_get_cf_fields()
+    custom_fields = getattr(config,'CUSTOM_FIELDS')
+    custom_fields_dict = getattr(config,'CUSTOM_FIELDS_DICT')
+
+    wanted_ids = [cf_id for cf_id, cf_name in custom_fields_dict.items() if cf_name in cf_fields or cf_id in cf_fields]
+
+    # Flatten every record's custom fields into one long table
+    long_df = pd.DataFrame([(row, item['custom_field_definition_id'], item['value'])
+                            for row, record in enumerate(records) for item in record.get('custom_fields') or []],
+                           columns=['row','cf_id','value'], dtype=object)
+    long_df = long_df[long_df['cf_id'].isin(wanted_ids)].drop_duplicates(['row','cf_id'], keep='last')
+
+    if long_df.empty: return pd.DataFrame(index=range(len(records)))
+
+    # Pivot to one column per field, keeping the order the fields first appear in
+    cf_order = list(long_df['cf_id'].unique())
+    wide_df = long_df.pivot(index='row', columns='cf_id', values='value').reindex(index=range(len(records)), columns=cf_order)
+
+    output = {}
+    for cf_id in cf_order:
+        column = wide_df[cf_id]
+        cf_info = custom_fields[cf_id]
+
+        if 'options' in cf_info:
+            column = column.map(_option_names(cf_info['options']), na_action='ignore')
+        elif cf_info.get('data_type') == 'Date':
+            column = _clean_dates(column)
+
+        output[custom_fields_dict[cf_id]] = column
+
+    return pd.DataFrame(output).rename_axis(None).infer_objects()
+
+def _merge_by_id(previous:pd.DataFrame, # DataFrame returned by an earlier search
+                 changes:pd.DataFrame, # Records modified since then
+                )->pd.DataFrame:
+    """Replaces the rows of `previous` that have a newer version in `changes` and appends new records"""
+    if previous is None or previous.empty: return changes
+    if changes is None or changes.empty:   return previous
+    kept = previous[~previous['id'].isin(changes['id'])]
+    return pd.concat([kept, changes], ignore_index=True)
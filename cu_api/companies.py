@@ -3,19 +3,23 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/companies.ipynb.
 
 # %% auto 0
-__all__ = ['API_URL', 'semaphore', 'retry_logger', 'search', 'RetryLogger', 'update_batch', 'bulk_update_async', 'update']
+__all__ = ['retry_logger', 'search', 'iter_search', 'search_async', 'RetryLogger', 'UpdateJournal', 'update_batch',
+           'bulk_update_async', 'update']
 
 # %% ../nbs/API/companies.ipynb 3
-from . import core, config
+from . import core, config, events, arrow
 from .query import Query as _Query
 from .core import set_headers as _set_headers
-from .search import _search_loop, get_owners
+from .limiter import ConcurrencyController
+from .clean import clean_custom_fields, _clean_date, _option_names, _merge_by_id
+from .search import _search_loop, _search_options, invalidate_search_cache, get_owners, get_owners_async, search_async as _search_async, iter_search as _iter_search
 import pandas as pd
-import pytz
+import numpy as np
 from tqdm.autonotebook import tqdm
 import warnings
 from tqdm import TqdmExperimentalWarning
-import aiohttp, asyncio, ssl, certifi
+import asyncio, contextlib, itertools, time, json, os, threading
+from collections.abc import Hashable
 
 # %% ../nbs/API/companies.ipynb 5
 class Query(_Query):pass
@@ -34,18 +38,6 @@ def _clean_row(company_data:list, #Returned company data as list of dictionaries
     custom_fields = getattr(config,'CUSTOM_FIELDS')
     custom_fields_dict = getattr(config,'CUSTOM_FIELDS_DICT')
 
-    def clean_date(date):
-        try:
-            if date is None: return None  # Handle None values (empty rows)
-            if isinstance(date, int) and len(str(date)) >= 6 and len(str(date)) <= 10:
-                # If it's an integer with <= 10 digits, assume it's a Unix timestamp
-                ct_timezone = pytz.timezone('US/Central')
-                new_date = pd.to_datetime(date, unit='s',utc=True).tz_convert(ct_timezone)
-                return new_date
-            else: return date
-        except Exception as e:
-            return date
-
     native_items = ['id', 'name','assignee_id', 'contact_type_id']
     output_dict = {}
 
@@ -64,10 +56,11 @@ def _clean_row(company_data:list, #Returned company data as list of dictionaries
             continue
         elif item_name is not None and ('options' in list(custom_fields[item_id].keys())):
             item_value = dict_item['value']
-            value_name = core.cf_option_name(item_id,item_value)
+            # Multi-selects hold a list of option ids, mapped the same way as `clean_custom_fields` does
+            value_name = _option_names(core.get_cf_options(item_id))(item_value)
             output_dict[item_name] = value_name
         elif data_type == 'Date':
-            cleaned_date = clean_date(dict_item['value'])
+            cleaned_date = _clean_date(dict_item['value'])
             output_dict[item_name] = cleaned_date
         else:
             item_value = dict_item['value']
@@ -76,9 +69,12 @@ def _clean_row(company_data:list, #Returned company data as list of dictionaries
     return output_dict
 
 # %% ../nbs/API/companies.ipynb 9
-def _clean_dataframe(df):
-    list_assign_ids = list(df['assignee_id'].dropna().unique().astype(int))
-    assignee_dict = get_owners(list_assign_ids)
+def _clean_dataframe(df, assignee_dict:dict = None):
+    if assignee_dict is None:
+        started = time.perf_counter()
+        list_assign_ids = list(df['assignee_id'].dropna().unique().astype(int))
+        assignee_dict = get_owners(list_assign_ids)
+        events.emit('stage', name='owners', seconds=time.perf_counter() - started)
 
     df['Owned By'] = df['assignee_id'].apply(lambda value: assignee_dict.get(value))
     df.drop(columns=['assignee_id'])
@@ -92,9 +88,57 @@ def set_headers(AccessToken:str, #Access Token (API Key) provided by Copper
     
 
 # %% ../nbs/API/companies.ipynb 11
+def _clean_rows(combined_results:list, # Raw records returned by the search
+                Outputs:list, # Custom fields requested by the Query
+                progress:bool = True, # Whether to show a progress bar
+                **kwargs
+               )->list:
+    """Cleans each raw record with `_clean_row`"""
+
+    # Custom Fields
+    if 'cf_fields' in kwargs:     cf_fields = kwargs.get('cf_fields')
+    else:                         cf_fields = Outputs
+
+    # Processing Rows:
+    started = time.perf_counter()
+    cleaned_rows = []
+    for result in tqdm(combined_results,'Cleaning Data',total=len(combined_results),leave=False,disable=not progress):
+        cleaned_rows.append(_clean_row(result, cf_fields))
+    events.emit('rows_cleaned', resource='companies', rows=len(cleaned_rows), seconds=time.perf_counter() - started)
+    return cleaned_rows
+
+def _clean_records(combined_results:list, # Raw records returned by the search
+                   Outputs:list, # Custom fields requested by the Query
+                   **kwargs
+                  )->pd.DataFrame:
+    """Cleans every raw record at once, column by column. Gives the same DataFrame as `_clean_row` row by row"""
+
+    # Custom Fields
+    if 'cf_fields' in kwargs:     cf_fields = kwargs.get('cf_fields')
+    else:                         cf_fields = Outputs
+
+    started = time.perf_counter()
+    native_items = ['id', 'name','assignee_id', 'contact_type_id']
+    native_df = pd.DataFrame({item: [result.get(item, None) for result in combined_results] for item in native_items})
+    address_df = pd.DataFrame([result.get('address') or {} for result in combined_results], index=native_df.index)
+    cf_df = clean_custom_fields(combined_results, cf_fields)
+
+    assembling = time.perf_counter()
+    cleaning = assembling - started
+    cleaned = pd.concat([native_df, address_df, cf_df], axis=1)
+    events.emit('stage', name='dataframe', seconds=time.perf_counter() - assembling)
+    events.emit('rows_cleaned', resource='companies', rows=len(cleaned), seconds=cleaning)
+    return cleaned
+
 def search(search_query, # Instance of Query object
             clean_data:bool = True, # Whether to clean results or not
             drop:list = None, # Columns to drop from final dataframe
+            stream:bool = False, # Yield results page by page, see `iter_search`
+            incremental:bool = False, # Only fetch records modified since the last incremental search, see `search.get_sync_mark`
+            previous:pd.DataFrame = None, # Earlier results to merge the changes into, by `id`
+            profile:bool = False, # Also return an `events.Profile` of where the time went
+            output:str = 'pandas', # 'pandas' for a DataFrame, or 'arrow' for a pyarrow Table (always cleaned)
+            sink = None, # With output='arrow', a Parquet file path or `arrow.ParquetSink` to stream the pages into
             **kwargs
             )->pd.DataFrame:
     """Search for Company records in Copper!
@@ -102,27 +146,117 @@ def search(search_query, # Instance of Query object
     This function allows you to systematically search Copper for companies 
     that match the parameters specified in your `Query` and returns the 
     returns the data as a pandas dataframe
-    """
-    
-    combined_results, Outputs = _search_loop(search_query= search_query, url= 'https://api.copper.com/developer_api/v1/companies/search')
-    
-    # Custom Fields
-    if 'cf_fields' in kwargs:     cf_fields = kwargs.get('cf_fields')
-    else:                         cf_fields = Outputs
 
-    # Processing Rows:
-    cleaned_rows = []
-    for result in tqdm(combined_results,'Cleaning Data',total=len(combined_results),leave=False):
-        cleaned_rows.append(_clean_row(result, cf_fields))
+    With `incremental=True` only records modified since the last incremental run of the 
+    same query are requested. They are merged by `id` into `previous` when it is given, 
+    otherwise just the changed records are returned.
+
+    With `profile=True` the result comes back as `(df, profile)`, see `events.Profile`.
+
+    With `output='arrow'` the pages are cleaned straight into a `pyarrow.Table` with a schema 
+    derived from the custom field types, see `arrow.schema`. Given a `sink`, the tables are 
+    written to Parquet as they arrive and the closed `arrow.ParquetSink` is returned instead.
+    """
+    if profile:
+        if stream: raise ValueError("profile can't be used with stream, listen to `events` instead")
+        with events.Profile() as report:
+            df = search(search_query, clean_data, drop, stream, incremental, previous, output=output, sink=sink, **kwargs)
+        return df, report
+
+    if output not in ('pandas', 'arrow'): raise ValueError(f"output must be 'pandas' or 'arrow', not {output!r}")
+    if output == 'arrow' and previous is not None: raise ValueError("previous can only be merged into pandas output")
+    if previous is not None and not incremental: raise ValueError("previous needs incremental=True, only the changes are merged into it")
+    if previous is not None and (stream or not clean_data): raise ValueError("previous can only be merged into cleaned results, not streamed or raw ones")
+    if stream:
+        return iter_search(search_query, clean_data, drop, incremental, output=output, **kwargs)
+    if output == 'arrow':
+        pages, Outputs = _iter_search(search_query= search_query, url= core.api_url('companies/search'), incremental= incremental, **_search_options(kwargs))
+        return arrow.to_arrow(pages, 'companies', kwargs.get('cf_fields', Outputs), drop, sink)
+
+    combined_results, Outputs = _search_loop(search_query= search_query, url= core.api_url('companies/search'), incremental= incremental, **_search_options(kwargs))
     
     # To Clean, or not to Clean
     if not clean_data:
-        return cleaned_rows
+        return _clean_rows(combined_results, Outputs, **kwargs)
 
-    cleaned_rows_df = pd.DataFrame(cleaned_rows)
+    cleaned_rows_df = _clean_records(combined_results, Outputs, **kwargs)
     cleaned_data_df = _clean_dataframe(cleaned_rows_df)
+    if isinstance(drop,list):      cleaned_data_df = cleaned_data_df.drop(columns=drop)
 
-    if isinstance(drop,list):      return cleaned_data_df.drop(columns=drop,inplace=True)
+    if incremental:                return _merge_by_id(previous, cleaned_data_df)
+    else:                          return cleaned_data_df 
+
+def iter_search(search_query, # Instance of Query object
+                clean_data:bool = True, # Whether to clean results or not
+                drop:list = None, # Columns to drop from each dataframe
+                incremental:bool = False, # Only fetch records modified since the last incremental search
+                output:str = 'pandas', # 'pandas' for DataFrames, or 'arrow' for pyarrow Tables
+                **kwargs
+               ):
+    """Stream Company records from Copper one page at a time.
+
+    Yields a cleaned DataFrame for every page of results as it arrives (a `pyarrow.Table` 
+    with `output='arrow'`), or the cleaned rows one at a time when `clean_data` is False. 
+    Owners are only looked up the first time an assignee is seen, and memory stays flat 
+    however large the search is.
+    """
+
+    pages, Outputs = _iter_search(search_query= search_query, url= core.api_url('companies/search'), incremental= incremental, **_search_options(kwargs))
+
+    if output == 'arrow':
+        yield from arrow.iter_tables(pages, 'companies', kwargs.get('cf_fields', Outputs), drop)
+        return
+
+    assignee_dict = {}
+    for page_results in pages:
+        # To Clean, or not to Clean
+        if not clean_data:
+            yield from _clean_rows(page_results, Outputs, progress=False, **kwargs)
+            continue
+
+        if not page_results: continue
+
+        cleaned_rows_df = _clean_records(page_results, Outputs, **kwargs)
+        new_ids = [userid for userid in cleaned_rows_df['assignee_id'].dropna().unique().astype(int) if userid not in assignee_dict]
+        if new_ids:
+            started = time.perf_counter()
+            assignee_dict.update(get_owners(new_ids))
+            events.emit('stage', name='owners', seconds=time.perf_counter() - started)
+        cleaned_data_df = _clean_dataframe(cleaned_rows_df, assignee_dict)
+
+        if isinstance(drop,list):      yield cleaned_data_df.drop(columns=drop)
+        else:                          yield cleaned_data_df
+
+async def search_async(search_query, # Instance of Query object
+                       clean_data:bool = True, # Whether to clean results or not
+                       drop:list = None, # Columns to drop from final dataframe
+                       incremental:bool = False, # Only fetch records modified since the last incremental search
+                       previous:pd.DataFrame = None, # Earlier results to merge the changes into, by `id`
+                       **kwargs
+                      )->pd.DataFrame:
+    """Async version of `search` that can be awaited from inside your own event loop.
+
+    Pages and owners are requested through the pooled `aiohttp.ClientSession` from 
+    `core.get_async_session()`.
+    """
+    if previous is not None and not incremental: raise ValueError("previous needs incremental=True, only the changes are merged into it")
+    if previous is not None and not clean_data: raise ValueError("previous can only be merged into cleaned results, not raw ones")
+
+    combined_results, Outputs = await _search_async(search_query= search_query, url= core.api_url('companies/search'), incremental= incremental, **_search_options(kwargs))
+
+    # To Clean, or not to Clean
+    if not clean_data:
+        return _clean_rows(combined_results, Outputs, **kwargs)
+
+    cleaned_rows_df = _clean_records(combined_results, Outputs, **kwargs)
+    started = time.perf_counter()
+    list_assign_ids = list(cleaned_rows_df['assignee_id'].dropna().unique().astype(int))
+    assignee_dict = await get_owners_async(list_assign_ids)
+    events.emit('stage', name='owners', seconds=time.perf_counter() - started)
+    cleaned_data_df = _clean_dataframe(cleaned_rows_df, assignee_dict)
+    if isinstance(drop,list):      cleaned_data_df = cleaned_data_df.drop(columns=drop)
+
+    if incremental:                return _merge_by_id(previous, cleaned_data_df)
     else:                          return cleaned_data_df 
 
 # %% ../nbs/API/companies.ipynb 12
@@ -136,8 +270,6 @@ def search_old(search_params:dict={}, # search params for standard company field
     
     total_pages = page = 1
     combined_results = []
-    
-    Sess = core.get_session()
 
     while page <= total_pages:
         page_params = {
@@ -151,7 +283,7 @@ def search_old(search_params:dict={}, # search params for standard company field
             cf_addition = {"custom_fields":cf_search}
             page_params.update(cf_addition) 
 
-        result = Sess.post('https://api.copper.com/developer_api/v1/companies/search',json=page_params)
+        result = core.request('POST', core.api_url('companies/search'),json=page_params)
     
         if result.status_code == 200:
             total_pages = (int(result.headers['X-PW-TOTAL'])//100)+1
@@ -184,23 +316,163 @@ def search_old(search_params:dict={}, # search params for standard company field
     if isinstance(drop_cols,list):      return cleaned_data_df.drop(columns=drop_cols,inplace=True)
     else:                               return cleaned_data_df 
 
-# %% ../nbs/API/companies.ipynb 14
+# %% ../nbs/API/companies.ipynb 15
 def _run_async(func, *args, **kwargs):
     try:
-        return asyncio.run(func(*args, **kwargs))
+        return asyncio.run(_closing_session(func(*args, **kwargs)))
     except RuntimeError as e:
         if "asyncio.run() cannot be called" in str(e):
             loop = asyncio.get_event_loop()
-            return loop.run_until_complete(func(*args, **kwargs))
+            return loop.run_until_complete(_closing_session(func(*args, **kwargs)))
         raise
 
+async def _closing_session(coro):
+    """Awaits `coro`, then closes the pooled session it used before its loop ends"""
+    try:
+        return await coro
+    finally:
+        await core.close_async_session()
+
+
+def _comparable(column:pd.Series, # Values of one field
+                cf_id:int = None, # Custom field the values belong to
+               )->pd.Series:
+    """Puts values in one form so that the same value read from Copper and written to it compare equal"""
+    options = core.get_cf_options(cf_id) if cf_id is not None else None
+
+    def comparable(value):
+        if isinstance(value, (list, tuple, set)): return tuple(sorted(comparable(item) for item in value))
+        # Missing values compare like an empty multi-select
+        if value is None or (isinstance(value, float) and pd.isna(value)) or value is pd.NaT: return ()
+        if isinstance(value, pd.Timestamp): return int(value.timestamp())
+        if isinstance(value, float) and value.is_integer(): value = int(value)
+        if options and value in options: return options[value]
+        return value
+
+    return column.astype(object).map(comparable)
+
+def _changed_cells(df:pd.DataFrame, # Outgoing updates, with an 'id' column
+                   columns:list, # Columns being updated
+                   baseline:pd.DataFrame, # What Copper currently holds, with an 'id' column
+                  )->pd.DataFrame:
+    """
+    Boolean mask with the same index as `df` and one column per field, True where the 
+    outgoing value differs from the baseline. Records or fields missing from the baseline 
+    count as changed.
+    """
+    reverse_cf_lookup = getattr(config,'CF_ID_LOOKUP')
+    current = baseline.drop_duplicates('id', keep='last').set_index('id').reindex(df['id'])
+
+    changed = pd.DataFrame(True, index=df.index, columns=columns)
+    for col in columns:
+        if col not in current.columns: continue
+        cf_id = reverse_cf_lookup.get(col)
+        new = _comparable(df[col], cf_id).to_numpy()
+        old = _comparable(current[col], cf_id).to_numpy()
+        same = [a == b for a, b in zip(new, old)]
+        changed[col] = ~pd.Series(same, index=df.index, dtype=bool)
+
+    # Ids that aren't in the baseline always get every field sent
+    changed.loc[~df['id'].isin(baseline['id']).to_numpy()] = True
+    return changed
+
+def _baseline(df:pd.DataFrame, # Outgoing updates, with an 'id' column
+              columns:list, # Columns being updated
+              baseline, # DataFrame, an object with a `snapshot` method (like `mirror.Mirror`), or 'search'
+             )->pd.DataFrame:
+    """Resolves the `baseline` passed to `update` to a DataFrame"""
+    if isinstance(baseline, pd.DataFrame): return baseline
+    if hasattr(baseline, 'snapshot'):      return baseline.snapshot('companies', columns)
+    if baseline == 'search':
+        cf_fields = [col for col in columns if col in getattr(config,'CF_ID_LOOKUP')]
+        ids = [int(company_id) for company_id in df['id'].dropna().unique()]
+        found = []
+        # The ids are sent with every page request, so they go in chunks to keep payloads small
+        for start in range(0, len(ids), 1000):
+            query = Query()
+            query['ids'] = ids[start:start + 1000]
+            # Never from the search cache, a cached page can predate the last update
+            found.append(search(query, cf_fields=cf_fields, cache=False))
+        return pd.concat(found, ignore_index=True) if found else pd.DataFrame(columns=['id'] + columns)
+    raise ValueError("baseline must be a DataFrame, an object with a snapshot method (like a Mirror) or 'search'")
+
+def _payload_values(column:pd.Series, # Values of one field
+                    cf_id:int, # Custom field the values are for
+                   )->list:
+    """
+    Converts a whole column to the values the API expects: option names become option ids, 
+    timestamps become Unix seconds, missing values become null and numpy scalars plain Python.
+    """
+    missing = column.isna().tolist()
+    if isinstance(column.dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_any_dtype(column):
+        return [None if is_missing else int(value.timestamp()) for value, is_missing in zip(column.tolist(), missing)]
+
+    def plain(value):
+        if isinstance(value, pd.Timestamp): return int(value.timestamp())
+        if isinstance(value, np.generic):   return value.item()
+        return value
+    values = [None if is_missing else plain(value) for value, is_missing in zip(column.astype(object).tolist(), missing)]
+
+    option_ids = core.get_cf_option_ids(cf_id) if core.get_cf_options(cf_id) else None
+    if option_ids:
+        ignore_case = getattr(config, 'CF_OPTIONS_IGNORE_CASE', False)
+        valid_ids = set(core.get_cf_options(cf_id))
+
+        def option_id(value):
+            if value is None: return value
+            # Id columns holding NaN are promoted to float by pandas
+            if isinstance(value, float) and value.is_integer(): value = int(value)
+            if isinstance(value, Hashable):
+                if value in valid_ids: return value
+                key = value.lower() if ignore_case and isinstance(value, str) else value
+                if key in option_ids: return option_ids[key]
+            raise ValueError(f"'{value}' is not an option of '{config.CUSTOM_FIELDS_DICT.get(cf_id)}'")
+
+        # Each distinct value is looked up once, multi-selects map every item of their lists
+        lookup = {value: option_id(value) for value in set(value for value in values if isinstance(value, Hashable))}
+        values = [[option_id(item) for item in value] if isinstance(value, list) else
+                  lookup[value] if isinstance(value, Hashable) else option_id(value) for value in values]
+
+    return values
+
+def _build_payloads(df:pd.DataFrame, # Updates, with an 'id' column
+                    columns:list, # Columns to send
+                    cf_ids:list, # Custom field id of each column
+                    changed:pd.DataFrame = None, # Mask from `_changed_cells`, only True cells are sent
+                    batch_size = 10, # Companies per bulk_update request, or a callable returning it for each batch
+                   ):
+    """
+    Yields the `{"companies": [...]}` body of every bulk_update request. Values are converted 
+    in one pass over the columns, and each body is only built when it is asked for. Used by 
+    both `_bulk_update` and `bulk_update_async`.
+    """
+    ids = df['id'].astype('int64').tolist()
+    fields = [(cf_id, _payload_values(df[col], cf_id), changed[col].tolist() if changed is not None else None)
+              for cf_id, col in zip(cf_ids, columns)]
+
+    size = batch_size if callable(batch_size) else lambda: batch_size
+
+    payload = []
+    for row, comp_id in enumerate(ids):
+        custom_fields = [{'custom_field_definition_id': cf_id, 'value': values[row]}
+                         for cf_id, values, mask in fields if mask is None or mask[row]]
+        if custom_fields: payload.append({"id": comp_id, 'custom_fields': custom_fields})
+        if len(payload) >= size():
+            yield {"companies": payload}
+            payload = []
+
+    if payload: yield {"companies": payload}
+
+def _companies_to_send(df:pd.DataFrame, changed:pd.DataFrame = None)->int:
+    return len(df) if changed is None else int(changed.any(axis=1).sum())
 
-def _bulk_update(df: pd.DataFrame, columns: list, cf_ids: list = None):
+def _bulk_update(df: pd.DataFrame, columns: list, cf_ids: list = None, changed: pd.DataFrame = None, journal = None):
     """
     Function to update companies in copper using a pandas DataFrame with a column of 'id' to identify
     companies and a list of the columns you would like to update.
     
     Either pass in a list of custom field ids, or a list will be created using matching column names.
+    Returns the companies that could not be updated, see `_dead_letters`.
     """
 
     if 'id' not in df.columns:
@@ -210,53 +482,43 @@ def _bulk_update(df: pd.DataFrame, columns: list, cf_ids: list = None):
     reverse_cf_lookup = getattr(config,'CF_ID_LOOKUP')
 
     if cf_ids is None:
+        missing = [col for col in columns if col not in reverse_cf_lookup]
         cf_ids = [reverse_cf_lookup.get(col) for col in columns if col in reverse_cf_lookup]
         columns = [col for col in columns if col in reverse_cf_lookup]
-        missing = [col for col in columns if col not in reverse_cf_lookup]
         if missing:
             print(f"Warning: The following columns have no matching custom field IDs and will be skipped: {missing}")
 
-    df = df[columns + ['id']]
-    prepared_data = df.set_index('id').to_dict(orient='index')
-
-    total_companies = len(df['id'])
-    companies_updated = 0
-    max_size = 10
-    Sess = core.get_session()
-
-    progress_bar = tqdm(total=total_companies)
+    if changed is not None: changed = changed[columns]
+    progress_bar = tqdm(total=_companies_to_send(df, changed))
+    failures = []
 
-    while companies_updated < total_companies:
-        current_batch_size = min(max_size, total_companies - companies_updated)
-        payload = []
-
-        # Loop to make `payload`
-        for idx in range(companies_updated, companies_updated + current_batch_size):
-            comp_id = int(df['id'].iloc[idx])
-
-            cf_data_list = [{'custom_field_definition_id': cf_id, 'value': prepared_data[comp_id][col]}
-                            for cf_id, col in zip(cf_ids, columns)]
-
-            company_json = {"id": comp_id, 'custom_fields': cf_data_list}
-            payload.append(company_json)
-
-        json_data = {"companies": payload}
-        request_sent = Sess.post('https://api.copper.com/developer_api/v1/companies/bulk_update', json=json_data)
-
-        if request_sent.status_code != 200:
-            print(request_sent.text)
-            break
-        else:
-            companies_updated += current_batch_size
-            progress_bar.update(current_batch_size)  # Update the progress bar
+    for json_data in _build_payloads(df, columns, cf_ids, changed):
+        current_batch_size = len(json_data['companies'])
+        ids = [company['id'] for company in json_data['companies']]
+        started = time.perf_counter()
+        try:
+            request_sent = core.request('POST', _bulk_update_url(), json=json_data)
+            status, error = request_sent.status_code, (request_sent.text if request_sent.status_code != 200 else None)
+        except Exception as e:
+            status, error = None, repr(e)
+        events.emit('batch_updated', resource='companies', records=len(ids), status=status, ok=status == 200,
+                    seconds=time.perf_counter() - started, error=error)
+
+        if status != 200:
+            # Keep going, the failed companies are handed back so they can be retried on their own
+            tqdm.write(f"❌ Error {status}: {error}")
+            failures.extend({'id': comp_id, 'status': status, 'error': error} for comp_id in ids)
+        elif journal is not None:
+            journal.record(ids)
+        progress_bar.update(current_batch_size)  # Update the progress bar
 
     progress_bar.close()  # Close the progress bar when done
-    print('All companies updated.')
+    if failures: print(f"{len(failures)} companies could not be updated, they are in the returned DataFrame.")
+    else:        print('All companies updated.')
+    return _dead_letters(df, columns, failures)
 
-# %% ../nbs/API/companies.ipynb 15
-import time
+# %% ../nbs/API/companies.ipynb 16
 from collections import defaultdict
-from tqdm import tqdm
 
 class RetryLogger:
     def __init__(self):
@@ -272,39 +534,141 @@ class RetryLogger:
             self.retry_counts.clear()
             self.last_print = now
 
-# %% ../nbs/API/companies.ipynb 16
-API_URL = "https://api.copper.com/developer_api/v1/companies/bulk_update"
+class UpdateJournal:
+    """
+    Append-only file of the batches a bulk update has finished, one JSON line each. Resuming 
+    from it skips the companies that were already updated, so a rerun after a crash only 
+    sends the unfinished work.
+    """
+    def __init__(self,
+                 path:str, # File to keep the journal in
+                 columns:list, # Columns being updated, a journal only resumes the same update
+                 resume:bool = False, # Continue an existing journal instead of starting over
+                ):
+        self.path = path
+        self.columns = list(columns)
+        self.done = set()
+        self.batches = 0
+        self.lock = threading.Lock()
+
+        if resume and os.path.exists(path): self._load()
+        else:
+            with open(path, 'w') as f: f.write(json.dumps({'columns': self.columns, 'started': time.time()}) + '\n')
+        self.file = open(path, 'a')
+
+    def __repr__(self):
+        return f"UpdateJournal(path='{self.path}', batches={self.batches}, companies={len(self.done)})"
+
+    def _load(self):
+        with open(self.path) as f: text = f.read()
+        lines = text.splitlines()
+        header = json.loads(lines[0]) if lines else {}
+        if header.get('columns') != self.columns:
+            raise ValueError(f"Journal '{self.path}' is for columns {header.get('columns')}, not {self.columns}")
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue # Half written when the last run stopped
+            self.done.update(entry['ids'])
+            self.batches = max(self.batches, entry['batch'] + 1)
+        # Start on a new line if the last run stopped mid write
+        if not text.endswith('\n'):
+            with open(self.path, 'a') as f: f.write('\n')
+
+    def record(self,
+               ids:list, # Companies in a batch that was updated
+              ):
+        """Marks a batch as done, it is on disk before this returns"""
+        with self.lock:
+            self.file.write(json.dumps({'batch': self.batches, 'ids': ids}) + '\n')
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.done.update(ids)
+            self.batches += 1
+
+    async def record_async(self,
+                           ids:list, # Companies in a batch that was updated
+                          ):
+        """Async version of `record`, the fsync runs in a thread so it doesn't hold up the event loop"""
+        await asyncio.get_running_loop().run_in_executor(None, self.record, ids)
+
+    def close(self):
+        self.file.close()
+
+def _dead_letters(df:pd.DataFrame, # Updates that were being sent
+                  columns:list, # Columns that were being sent
+                  failures:list, # One {'id', 'status', 'error'} dict per company that failed
+                 )->pd.DataFrame:
+    """The failed companies with the values that were being sent and why they failed"""
+    failed = pd.DataFrame(failures, columns=['id', 'status', 'error'])
+    rows = df[['id'] + [col for col in columns if col in df.columns]].drop_duplicates('id', keep='last')
+    return rows.merge(failed, on='id', how='inner').reset_index(drop=True)
+
+# %% ../nbs/API/companies.ipynb 17
+def _bulk_update_url()->str:
+    """`API_URL` if it has been set on the module, otherwise the bulk_update url under `core.set_base_url`"""
+    return globals().get('API_URL') or core.api_url('companies/bulk_update')
 
-semaphore = asyncio.Semaphore(4) 
+def __getattr__(name):
+    # `API_URL` used to be a constant holding the production url, reading it still works
+    if name == 'API_URL':
+        warnings.warn("companies.API_URL is deprecated, use core.api_url('companies/bulk_update')", DeprecationWarning, stacklevel=2)
+        return core.api_url('companies/bulk_update')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 retry_logger = RetryLogger()
 
-async def update_batch(session, headers, payload, max_retries=3):
+async def update_batch(session, headers, payload, max_retries=3, semaphore=None, controller=None):
+    """Sends one bulk_update request, returns whether it succeeded"""
+    updated, _, _ = await _post_batch(session, headers, payload, max_retries, semaphore, controller)
+    return updated
+
+async def _post_batch(session, headers, payload, max_retries=3, semaphore=None, controller=None)->tuple:
+    """Sends one bulk_update request through `core.request_async`. Returns `(updated, status, error)`"""
     retry_count = 0
+    # Callers share a semaphore to cap requests in flight, it is created per call so it always belongs to the running loop.
+    # A ConcurrencyController takes the semaphore's place and is told how each request went.
+    if controller is not None: semaphore = controller
+    if semaphore is None:      semaphore = contextlib.nullcontext()
+    url = _bulk_update_url()
     for attempt in range(max_retries):
+        # Attempts are sent one at a time so the slot is given up while the limiter holds a retry back
         async with semaphore:
-            async with session.post(API_URL, json={"companies": payload}, headers=headers) as response:
-                if response.status == 429:
-                    retry_after = int(response.headers.get("Retry-After", 1))
-                    retry_count += 1
-                    retry_logger.log_retry(retry_after)
-                    await asyncio.sleep(retry_after)
-                    await asyncio.sleep(0.25)
-                    continue
-
-                elif response.status != 200:
-                    text = await response.text()
-                    tqdm.write(f"❌ Error {response.status}: {text}")
-                    return False
-
-                if retry_count:
-                    tqdm.write(f"✅ Batch succeeded after {retry_count} retries.")
-                return True
+            response = await core.request_async('POST', url, session=session, max_retries=1, json={"companies": payload}, headers=headers)
+            if controller is not None: controller.record(response.status, response.elapsed.total_seconds())
+
+        if response.status == 429:
+            # The limiter holds the next attempt back until Retry-After has passed
+            retry_count += 1
+            retry_logger.log_retry(response.headers.get("Retry-After", 1))
+            if attempt + 1 < max_retries: events.emit('retry', method='POST', url=url, attempt=attempt + 2, status=429)
+            continue
+
+        elif response.status != 200:
+            text = await response.text()
+            tqdm.write(f"❌ Error {response.status}: {text}")
+            return False, response.status, text
+
+        if retry_count:
+            tqdm.write(f"✅ Batch succeeded after {retry_count} retries.")
+        return True, 200, None
 
     tqdm.write("❌ Batch failed after max retries.")
-    return False
+    return False, 429, "Rate limit retries exhausted"
+
+async def bulk_update_async(df, columns, headers, batch_size=10, changed=None, workers=None, queue_size=None, adaptive=False, journal=None):
+    """
+    Sends the updates through a pool of workers fed from a bounded queue. Payloads are built 
+    only as fast as the workers take them, so memory stays flat however many batches there are.
 
-async def bulk_update_async(df, columns, headers, batch_size=10):
+    By default `workers` (default `config.UPDATE_WORKERS` or 4) requests of `batch_size` 
+    companies run at once. With `adaptive` a `limiter.ConcurrencyController` starting from 
+    `batch_size` decides how many requests are in flight (up to `workers`, default 16) and 
+    how many companies go in each batch.
+
+    Returns the companies that could not be updated, see `_dead_letters`.
+    """
     if 'id' not in df.columns:
         raise ValueError("DataFrame must contain an 'id' column.")
     
@@ -314,35 +678,67 @@ async def bulk_update_async(df, columns, headers, batch_size=10):
     cf_ids = [reverse_cf_lookup[col] for col in columns if col in reverse_cf_lookup]
     columns = [col for col in columns if col in reverse_cf_lookup]
 
-    df = df[columns + ['id']]
-    data = df.set_index('id').to_dict(orient='index')
-
-    tasks = []
-    ssl_context = ssl.create_default_context(cafile=certifi.where())
-
-    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=ssl_context)) as session:
-        for start in range(0, len(df), batch_size):
-            batch = df.iloc[start:start + batch_size]
-            payload = []
-
-            for _, row in batch.iterrows():
-                cid = int(row['id'])
-                custom_fields = [
-                    {"custom_field_definition_id": cf_id, "value": data[cid][col]}
-                    for cf_id, col in zip(cf_ids, columns)
-                ]
-                payload.append({"id": cid, "custom_fields": custom_fields})
-
-            tasks.append(update_batch(session, headers, payload))
+    if changed is not None: changed = changed[columns]
+    if adaptive:
+        max_concurrency = max(1, workers or 16)
+        controller = ConcurrencyController(concurrency=min(4, max_concurrency), max_concurrency=max_concurrency, batch_size=batch_size)
+        workers, semaphore, size = controller.max_concurrency, None, lambda: controller.batch_size
+    else:
+        if workers is None: workers = getattr(config, 'UPDATE_WORKERS', 4)
+        workers = max(1, workers)
+        controller, semaphore, size = None, asyncio.Semaphore(workers), batch_size
+
+    queue = asyncio.Queue(maxsize=queue_size or workers * 2)
+    results = []
+    failures = []
+
+    # The first payload converts every column, so a bad value raises before any worker starts
+    payloads = _build_payloads(df, columns, cf_ids, changed, size)
+    first = next(payloads, None)
+    if first is not None: payloads = itertools.chain([first], payloads)
+    progress_bar = tqdm(total=_companies_to_send(df, changed), desc="Async updating")
+
+    async def worker(session):
+        while True:
+            json_data = await queue.get()
+            if json_data is None: return
+            ids = [company['id'] for company in json_data['companies']]
+            started = time.perf_counter()
+            try:
+                updated, status, error = await _post_batch(session, headers, json_data['companies'], semaphore=semaphore, controller=controller)
+            except Exception as e:
+                tqdm.write(f"❌ Batch failed: {e!r}")
+                updated, status, error = False, None, repr(e)
+            events.emit('batch_updated', resource='companies', records=len(ids), status=status, ok=updated,
+                        seconds=time.perf_counter() - started, error=error)
+
+            results.append(updated)
+            if not updated:          failures.extend({'id': comp_id, 'status': status, 'error': error} for comp_id in ids)
+            elif journal is not None: await journal.record_async(ids)
+            progress_bar.update(len(ids))
+
+    # The pooled session is left open for the caller, `update` closes it once the loop is done
+    session = core.get_async_session()
+    pool = [asyncio.create_task(worker(session)) for _ in range(workers)]
 
-        results = []
-        for task in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Async updating"):
-            results.append(await task)
+    try:
+        # `put` waits while the queue is full, which holds back building the next payload
+        for json_data in payloads:
+            await queue.put(json_data)
+        for _ in pool: await queue.put(None)
+        await asyncio.gather(*pool)
+    finally:
+        # Workers still waiting on the queue after an error would otherwise never finish
+        for task in pool: task.cancel()
+        await asyncio.gather(*pool, return_exceptions=True)
+        progress_bar.close()
 
     print(f"{results.count(True)}/{len(results)} batches updated successfully.")
+    if controller is not None: print(f"Finished at {controller.limit} concurrent requests of {controller.batch_size} companies.")
+    return _dead_letters(df, columns, failures)
 
-# %% ../nbs/API/companies.ipynb 17
-def update(df, columns, session=None, async_mode=False, **kwargs):
+# %% ../nbs/API/companies.ipynb 18
+def update(df, columns, session=None, async_mode=False, baseline=None, journal=None, resume=False, **kwargs):
     """
     Bulk update Copper companies using a DataFrame.
     
@@ -351,12 +747,41 @@ def update(df, columns, session=None, async_mode=False, **kwargs):
         columns (list): Custom field names to update.
         session (requests.Session): Pre-authenticated Copper session.
         async_mode (bool): Use asynchronous requests.
+        baseline: Only send values that differ from this. A DataFrame of current records, 
+            a `mirror.Mirror`, or 'search' to look the companies up in Copper first.
+        journal (str): File recording each batch once it is updated, see `UpdateJournal`.
+        resume (bool): Skip the companies the journal says are already updated.
         kwargs: Additional options like batch_size.
+
+    Returns a DataFrame of the companies that could not be updated, with the values that 
+    were being sent and the `status` and `error` Copper answered with.
     """
-    if async_mode:
-        headers = core.get_session().headers
-        return _run_async(bulk_update_async, df, columns, headers=headers, **kwargs)
-    else:
-        if not session:
-            session = core.get_session()
-        return _bulk_update(df, columns, **kwargs)
+    if resume and journal is None:
+        raise ValueError("resume=True needs the journal the earlier run was recorded in, pass it as journal=")
+    if journal is not None:
+        journal = UpdateJournal(journal, columns, resume)
+        if journal.done:
+            print(f"Resuming: {df['id'].isin(journal.done).sum()} companies were already updated.")
+            df = df[~df['id'].isin(journal.done)]
+        kwargs['journal'] = journal
+
+    if baseline is not None:
+        if 'id' not in df.columns:
+            raise ValueError("DataFrame must contain an 'id' column to identify companies.")
+        core.prc_get_cf_fields()
+        changed = _changed_cells(df, columns, _baseline(df, columns, baseline))
+        print(f"{int(changed.to_numpy().sum())} of {changed.size} values changed across {int(changed.any(axis=1).sum())} of {len(df)} companies.")
+        kwargs['changed'] = changed
+
+    try:
+        if async_mode:
+            headers = core.get_session().headers
+            return _run_async(bulk_update_async, df, columns, headers=headers, **kwargs)
+        else:
+            if not session:
+                session = core.get_session()
+            return _bulk_update(df, columns, **kwargs)
+    finally:
+        if journal is not None: journal.close()
+        # Cached searches may hold the old values of the companies just updated
+        invalidate_search_cache()
@@ -3,12 +3,21 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/core.ipynb.
 
 # %% auto 0
-__all__ = ['session', 'set_headers', 'get_session', 'prc_request_cf_data', 'prc_clean_cf_data', 'prc_get_cf_fields',
-           'get_cf_info', 'get_cf_options', 'cf_option_name']
+__all__ = ['session', 'BASE_URL', 'set_headers', 'set_base_url', 'api_url', 'set_pool_size', 'get_session', 'get_async_session',
+           'close_async_session', 'async_session', 'request', 'request_async', 'Cassette', 'set_cassette',
+           'get_cassette', 'with_cassette', 'prc_request_cf_data', 'prc_clean_cf_data', 'set_cf_cache',
+           'prc_get_cf_fields', 'refresh_custom_fields', 'get_cf_info', 'get_cf_options', 'cf_option_name',
+           'get_cf_option_ids', 'cf_option_id']
 
 # %% ../nbs/API/core.ipynb 5
-import requests, json
-from . import config
+import requests, json, os, time, gzip, threading, contextlib
+import aiohttp, asyncio, ssl, certifi
+from datetime import timedelta
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from . import config, events
+from .limiter import get_limiter
 import pandas as pd
 from tqdm import tqdm
 
@@ -42,6 +51,33 @@ def set_headers(AccessToken:str, #Access Token (API Key) provided by Copper
 # %% ../nbs/API/core.ipynb 8
 session = None
 
+BASE_URL = 'https://api.copper.com/developer_api/v1'
+
+def set_base_url(url:str = None, # Root of the API, e.g. the url of a `mock.MockCopper` server. None for the real Copper API
+                ):
+    """Points every request at a different API root. The `CU_API_BASE_URL` environment variable works too."""
+    config.BASE_URL = url
+
+def api_url(path:str, # Endpoint path, e.g. 'companies/search'
+           )->str:
+    """Full url of an endpoint under the current API root"""
+    base = getattr(config, 'BASE_URL', None) or os.environ.get('CU_API_BASE_URL') or BASE_URL
+    return f"{base.rstrip('/')}/{path.lstrip('/')}"
+
+def set_pool_size(size:int = 32, # Connections the shared session keeps open to Copper
+                 ):
+    """
+    Sets how many connections the shared requests session keeps open. Searches fetch pages 
+    from several threads through the one session, and threads beyond the pool size open and 
+    throw away a connection per request ("Connection pool is full"), so keep it at least as 
+    large as the requests in flight at once.
+    """
+    config.HTTP_POOL_SIZE = max(1, size)
+    if isinstance(getattr(config, 'SESSION', None), requests.Session): _mount_cassette(config.SESSION, remount=True)
+
+def _pool_size()->int:
+    return getattr(config, 'HTTP_POOL_SIZE', 32)
+
 def get_session(**kwargs):
     """
     Function to get current session or create one if one doesn't exist. If both keyword 
@@ -60,25 +96,349 @@ def get_session(**kwargs):
     if 'AccessToken' in kwargs and 'UserEmail' in kwargs:
         set_headers(kwargs.get('AccessToken'), kwargs.get('UserEmail'))
     
-    if not hasattr(config, 'COPPER_HEADERS'):
+    if not hasattr(config, 'COPPER_HEADERS') and not _replaying():
         raise NameError("Header information is not set. Please use set_header() function to do so. \n\nSee ?set_headers for more information.")
     
     if not hasattr(config, 'SESSION') or not isinstance(config.SESSION, requests.Session):
         # No session exists or the global variable is not of type requests.Session, create a new session
         config.SESSION = requests.Session()
-        config.SESSION.headers.update(config.COPPER_HEADERS)  # Assuming config.COPPER_HEADERS is defined elsewhere
-    
+        config.SESSION.headers.update(getattr(config, 'COPPER_HEADERS', {}))  # Assuming config.COPPER_HEADERS is defined elsewhere
+
+    _mount_cassette(config.SESSION)
     return config.SESSION
 
-# %% ../nbs/API/core.ipynb 11
+def get_async_session(**kwargs):
+    """
+    Async version of get_session(). Returns a pooled aiohttp.ClientSession with the Copper 
+    headers set, creating one if none exists for the running event loop. Must be called 
+    from inside a running event loop, and closed with `await close_async_session()` before 
+    the loop ends. `async with async_session():` does both.
+
+    Takes the same optional keyword arguments as get_session().
+    """
+
+    if 'AccessToken' in kwargs and 'UserEmail' in kwargs:
+        set_headers(kwargs.get('AccessToken'), kwargs.get('UserEmail'))
+    
+    if not hasattr(config, 'COPPER_HEADERS') and not _replaying():
+        raise NameError("Header information is not set. Please use set_header() function to do so. \n\nSee ?set_headers for more information.")
+
+    loop = asyncio.get_running_loop()
+
+    # Sessions are bound to the loop they were created on, so make a new one if the loop has changed
+    if getattr(config, 'ASYNC_SESSION', None) is None or config.ASYNC_SESSION.closed or getattr(config, 'ASYNC_SESSION_LOOP', None) is not loop:
+        ssl_context = ssl.create_default_context(cafile=certifi.where())
+        config.ASYNC_SESSION = aiohttp.ClientSession(headers=getattr(config, 'COPPER_HEADERS', {}),
+                                                     connector=aiohttp.TCPConnector(ssl=ssl_context))
+        config.ASYNC_SESSION_LOOP = loop
+
+    return config.ASYNC_SESSION
+
+async def close_async_session():
+    """Closes the pooled aiohttp.ClientSession if one is open on the running event loop."""
+    session = getattr(config, 'ASYNC_SESSION', None)
+    # A session left open on a loop that has since stopped can't release its connections any more
+    if session is not None and not session.closed and getattr(config, 'ASYNC_SESSION_LOOP', None) is asyncio.get_running_loop():
+        await session.close()
+    config.ASYNC_SESSION = None
+
+@contextlib.asynccontextmanager
+async def async_session(**kwargs):
+    """
+    The pooled aiohttp.ClientSession for the length of an `async with` block, closed when 
+    the block ends. Takes the same optional keyword arguments as get_session().
+    """
+    session = get_async_session(**kwargs)
+    try:
+        yield session
+    finally:
+        await close_async_session()
+
+def request(method:str, # HTTP method, e.g. 'GET' or 'POST'
+            url:str, # Copper API url
+            max_retries:int = 5, # Maximum attempts while rate limited
+            retry_delay:float = None, # Seconds to wait after a 429 without a Retry-After header
+            **kwargs # Passed on to requests.Session.request
+           )->requests.Response:
+    """
+    Sends a request with the shared session. Every call waits on the shared rate limiter 
+    first, and 429 responses are retried once the limiter allows it. The last response 
+    is returned as is if Copper is still rate limiting after `max_retries` attempts.
+    Every attempt is reported to `events` listeners.
+    """
+    Sess = get_session()
+    limiter = get_limiter()
+
+    for attempt in range(1, max_retries + 1):
+        queued = time.perf_counter()
+        limiter.acquire()
+        request_id = events.request_id()
+        events.emit('request_start', request=request_id, method=method, url=url, attempt=attempt)
+        started = time.perf_counter()
+        try:
+            response = Sess.request(method, url, **kwargs)
+        except BaseException as e:
+            _request_failed(request_id, method, url, attempt, queued, started, kwargs, e)
+            raise
+        if events.listening('request_end'):
+            seconds = time.perf_counter() - started
+            first_byte = min(seconds, response.elapsed.total_seconds())
+            events.emit('request_end', request=request_id, method=method, url=url, attempt=attempt, status=response.status_code,
+                        seconds=seconds, throttled=started - queued, first_byte=first_byte, transfer=seconds - first_byte,
+                        bytes_sent=_size(response.request.body), bytes_received=len(response.content))
+        limiter.on_response(response.status_code, response.headers.get('Retry-After', retry_delay))
+        if response.status_code != 429: break
+        _rate_limited(method, url, attempt, max_retries, response.headers.get('Retry-After'))
+
+    return response
+
+def _size(body)->int:
+    """Bytes in a request body"""
+    if body is None: return 0
+    if isinstance(body, str): return len(body.encode('utf-8'))
+    if isinstance(body, bytes): return len(body)
+    return len(json.dumps(body))
+
+def _request_failed(request_id:int, method:str, url:str, attempt:int, queued:float, started:float, kwargs:dict, error:BaseException):
+    """Reports the `request_end` of a request that raised, so every `request_start` still has one"""
+    if not events.listening('request_end'): return
+    events.emit('request_end', request=request_id, method=method, url=url, attempt=attempt, status=None,
+                seconds=time.perf_counter() - started, throttled=started - queued, first_byte=None, transfer=None,
+                bytes_sent=_size(kwargs.get('json', kwargs.get('data'))), bytes_received=0, error=repr(error))
+
+def _rate_limited(method:str, url:str, attempt:int, max_retries:int, retry_after):
+    """Reports a 429, and the retry that follows it if there are attempts left"""
+    events.emit('rate_limited', method=method, url=url, attempt=attempt, retry_after=retry_after)
+    if attempt < max_retries: events.emit('retry', method=method, url=url, attempt=attempt + 1, status=429)
+
+async def request_async(method:str, # HTTP method, e.g. 'GET' or 'POST'
+                        url:str, # Copper API url
+                        session = None, # aiohttp.ClientSession to use, defaults to get_async_session()
+                        max_retries:int = 5, # Maximum attempts while rate limited
+                        retry_delay:float = None, # Seconds to wait after a 429 without a Retry-After header
+                        **kwargs # Passed on to aiohttp.ClientSession.request
+                       )->aiohttp.ClientResponse:
+    """
+    Async version of request(). The body is read before the response is returned, so 
+    `await response.json()` can be used after the connection has been released. Like 
+    `requests.Response.elapsed`, `response.elapsed` is how long the request took, not 
+    counting the time it waited on the limiter.
+    """
+    if session is None: session = get_async_session()
+    session = with_cassette(session)
+    limiter = get_limiter()
+
+    for attempt in range(1, max_retries + 1):
+        queued = time.perf_counter()
+        await limiter.acquire_async()
+        request_id = events.request_id()
+        events.emit('request_start', request=request_id, method=method, url=url, attempt=attempt)
+        started = time.perf_counter()
+        try:
+            async with session.request(method, url, **kwargs) as response:
+                first_byte = time.perf_counter() - started
+                content = await response.read()
+        except BaseException as e:
+            _request_failed(request_id, method, url, attempt, queued, started, kwargs, e)
+            raise
+        seconds = time.perf_counter() - started
+        response.elapsed = timedelta(seconds=seconds)
+        if events.listening('request_end'):
+            events.emit('request_end', request=request_id, method=method, url=url, attempt=attempt, status=response.status,
+                        seconds=seconds, throttled=started - queued, first_byte=first_byte, transfer=seconds - first_byte,
+                        bytes_sent=_size(kwargs.get('json', kwargs.get('data'))), bytes_received=len(content))
+        await limiter.on_response_async(response.status, response.headers.get('Retry-After', retry_delay))
+        if response.status != 429: break
+        _rate_limited(method, url, attempt, max_retries, response.headers.get('Retry-After'))
+
+    return response
+
+# %% ../nbs/API/core.ipynb 12
+class Cassette:
+    """
+    Archive of recorded responses, see `set_cassette`. In 'record' mode every response
+    is appended to `path` as it arrives; in 'replay' mode responses are served from it.
+    """
+    def __init__(self,
+                 path:str, # Gzipped JSON lines file
+                 mode:str = 'replay', # 'record' or 'replay'
+                 latency:bool = False, # When replaying, wait as long as each response originally took
+                ):
+        if mode not in ('record', 'replay'): raise ValueError(f"mode must be 'record' or 'replay', not {mode!r}")
+        self.path, self.mode, self.latency = path, mode, latency
+        self.lock = threading.Lock()
+        self.responses = {}
+        self._file = None
+        if mode == 'replay':
+            for entry in _read_entries(path):
+                self.responses.setdefault(_entry_key(entry['method'], entry['path'], entry['body']), []).append(entry)
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._file = gzip.open(path, 'wt')
+
+    def __repr__(self):
+        return f"Cassette({self.path!r}, mode={self.mode!r}, {sum(map(len, self.responses.values()))} responses)"
+
+    def record(self, method:str, url:str, body, status:int, headers, content:bytes, elapsed:float):
+        """Appends a response to the archive"""
+        if status == 429: return
+        entry = {'method': method.upper(), 'path': _endpoint(url), 'body': _body_text(body), 'status': status,
+                 'headers': {key: value for key, value in headers.items() if key.lower() != 'set-cookie'},
+                 'content': content.decode('utf-8', 'replace'), 'elapsed': round(elapsed, 4)}
+        with self.lock:
+            self._file.write(json.dumps(entry) + '\n')
+            self._file.flush()
+
+    def play(self, method:str, url:str, body)->dict:
+        """The next recorded response for a request. The last one is repeated once they run out"""
+        key = _entry_key(method.upper(), _endpoint(url), _body_text(body))
+        with self.lock:
+            recorded = self.responses.get(key)
+            if not recorded: raise LookupError(f"No recorded response for {method.upper()} {_endpoint(url)} in {self.path}")
+            return recorded.pop(0) if len(recorded) > 1 else recorded[0]
+
+    def close(self):
+        """Finishes writing the archive"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self): return self
+    def __exit__(self, *exc): set_cassette(None)
+
+def _endpoint(url:str)->str:
+    """Path of `url` below the API root, so recordings replay against any base url"""
+    path, root = urlsplit(url).path, urlsplit(api_url('')).path.rstrip('/')
+    return path[len(root):] if root and path.startswith(root + '/') else path
+
+def _body_text(body)->str:
+    """JSON request body in a canonical form"""
+    if body is None or body == b'' or body == '': return ''
+    if isinstance(body, (bytes, str)):
+        try:               body = json.loads(body)
+        except ValueError: return body.decode('utf-8', 'replace') if isinstance(body, bytes) else body
+    return json.dumps(body, sort_keys=True, separators=(',', ':'), default=str)
+
+def _entry_key(method:str, path:str, body:str)->tuple:
+    return (method, path, body)
+
+def _read_entries(path:str)->list:
+    """Entries of an archive. A recording that was cut off keeps every complete line"""
+    entries = []
+    try:
+        with gzip.open(path, 'rt') as f:
+            for line in f: entries.append(json.loads(line))
+    except (EOFError, ValueError):
+        pass
+    return entries
+
+def set_cassette(path:str = None, # Archive to record to or replay from, None to go back to Copper
+                 mode:str = 'replay', # 'record' or 'replay'
+                 latency:bool = False, # When replaying, wait as long as each response originally took
+                )->Cassette:
+    """
+    Records every request made through `request`, `request_async` and the bulk updates to
+    `path`, or serves them from it. Returns the `Cassette`, which also works in a `with`
+    block that switches it off at the end.
+    """
+    cassette = getattr(config, 'CASSETTE', None)
+    if cassette is not None: cassette.close()
+    config.CASSETTE = Cassette(path, mode, latency) if path else None
+    if isinstance(getattr(config, 'SESSION', None), requests.Session): _mount_cassette(config.SESSION)
+    return config.CASSETTE
+
+def get_cassette()->Cassette:
+    """The active cassette, if any"""
+    return getattr(config, 'CASSETTE', None)
+
+def _replaying()->bool:
+    cassette = get_cassette()
+    return cassette is not None and cassette.mode == 'replay'
+
+# %% ../nbs/API/core.ipynb 14
+class _CassetteAdapter(HTTPAdapter):
+    """Transport for the requests session that records or replays through the cassette"""
+    def __init__(self, cassette:Cassette, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        if self.cassette.mode == 'replay':
+            entry = self.cassette.play(request.method, request.url, request.body)
+            if self.cassette.latency: time.sleep(entry['elapsed'])
+            response = requests.Response()
+            response.status_code, response.url, response.request = entry['status'], request.url, request
+            response.headers = CaseInsensitiveDict(entry['headers'])
+            response._content, response.encoding = entry['content'].encode('utf-8'), 'utf-8'
+            response.elapsed = timedelta(seconds=entry['elapsed'])
+            return response
+        response = super().send(request, **kwargs)
+        self.cassette.record(request.method, request.url, request.body, response.status_code, response.headers,
+                             response.content, response.elapsed.total_seconds())
+        return response
+
+def _mount_cassette(session:requests.Session, remount:bool = False):
+    """Puts the active cassette (or the normal transport) in front of the session, with a pool of `set_pool_size` connections"""
+    cassette = get_cassette()
+    if not remount and hasattr(session, '_cassette') and session._cassette is cassette: return
+    pool = _pool_size()
+    for prefix in ('https://', 'http://'):
+        session.mount(prefix, _CassetteAdapter(cassette, pool_maxsize=pool) if cassette is not None else HTTPAdapter(pool_maxsize=pool))
+    session._cassette = cassette
+
+class _ReplayedResponse:
+    """Stands in for an aiohttp response read from the cassette"""
+    def __init__(self, entry:dict):
+        self.status, self.headers, self._content = entry['status'], CaseInsensitiveDict(entry['headers']), entry['content']
+    async def read(self)->bytes: return self._content.encode('utf-8')
+    async def text(self, *args, **kwargs)->str: return self._content
+    async def json(self, *args, **kwargs): return json.loads(self._content)
+    def release(self): pass
+
+class _CassetteRequest:
+    def __init__(self, session, cassette:Cassette, method:str, url:str, kwargs:dict):
+        self.session, self.cassette, self.method, self.url, self.kwargs = session, cassette, method, url, kwargs
+        self._request = None
+
+    async def __aenter__(self):
+        body = self.kwargs.get('json', self.kwargs.get('data'))
+        if self.cassette.mode == 'replay':
+            entry = self.cassette.play(self.method, self.url, body)
+            if self.cassette.latency: await asyncio.sleep(entry['elapsed'])
+            return _ReplayedResponse(entry)
+        started = time.perf_counter()
+        self._request = self.session.request(self.method, self.url, **self.kwargs)
+        response = await self._request.__aenter__()
+        content = await response.read()
+        self.cassette.record(self.method, self.url, body, response.status, response.headers, content, time.perf_counter() - started)
+        return response
+
+    async def __aexit__(self, *exc):
+        if self._request is not None: return await self._request.__aexit__(*exc)
+
+class _CassetteSession:
+    """Wraps an aiohttp.ClientSession so its requests go through the cassette"""
+    def __init__(self, session, cassette:Cassette):
+        self.session, self.cassette = session, cassette
+    def request(self, method:str, url:str, **kwargs): return _CassetteRequest(self.session, self.cassette, method, url, kwargs)
+    def get(self, url:str, **kwargs):  return self.request('GET', url, **kwargs)
+    def post(self, url:str, **kwargs): return self.request('POST', url, **kwargs)
+    def put(self, url:str, **kwargs):  return self.request('PUT', url, **kwargs)
+    def __getattr__(self, name): return getattr(self.session, name)
+
+def with_cassette(session):
+    """`session` (an aiohttp.ClientSession) routed through the active cassette, or as is without one"""
+    cassette = get_cassette()
+    if cassette is None or isinstance(session, _CassetteSession): return session
+    return _CassetteSession(session, cassette)
+
+# %% ../nbs/API/core.ipynb 17
 def prc_request_cf_data():
     """
     Helpter function to request the custom field data.
     """
-    Sess = get_session()
-
     try:
-        cf_request = Sess.get('https://api.copper.com/developer_api/v1/custom_field_definitions')
+        cf_request = request('GET', api_url('custom_field_definitions'))
         cf_request.raise_for_status()
     except requests.exceptions.HTTPError as err:
         raise Exception(f"Failed to fetch custom field data: {err}") from err
@@ -103,49 +463,117 @@ def prc_clean_cf_data(data:json):
 
         if 'options' in item:
             item_options = {}
+            option_ids = {}
+            option_ids_lower = {}
             for sub_item in item['options']:
                 sub_item_name = sub_item['name']
                 sub_item_id = sub_item['id']
 
                 item_options[sub_item_id] = sub_item_name
+
+                # Reverse indexes (Name -> ID), the first option wins if names repeat
+                option_ids.setdefault(sub_item_name, sub_item_id)
+                if isinstance(sub_item_name, str): option_ids_lower.setdefault(sub_item_name.lower(), sub_item_id)
         
             item_dict['options'] = item_options
+            item_dict['option_ids'] = option_ids
+            item_dict['option_ids_lower'] = option_ids_lower
         
         item_id = item['id']
         output_dict[item_id] = item_dict
 
     return output_dict
 
-# %% ../nbs/API/core.ipynb 13
-def prc_get_cf_fields():
+# %% ../nbs/API/core.ipynb 19
+def set_cf_cache(path:str = None, # JSON file to keep custom field definitions in between runs
+                 ttl:float = 3600, # Seconds before definitions are fetched again, None to never expire
+                ):
     """
-    Checks if custom_fields has been set and creates it if it hasn't been set. 
-    Called by all Custom Field Functions.
+    Configures how custom field definitions are cached. Definitions are always kept in 
+    memory; with a `path` they are also saved to disk so new processes can skip the request 
+    while the file is younger than `ttl`. The `CU_API_CF_CACHE` environment variable can 
+    be used to set the path instead.
     """
+    config.CF_CACHE_PATH = path
+    config.CF_CACHE_TTL = ttl
 
-    if  not hasattr(config,"CUSTOM_FIELDS") or not hasattr(config,"CUSTOM_FIELDS_DICT") or not hasattr(config,"CF_ID_LOOKUP"):
-        
-        raw_cf_data = prc_request_cf_data()
-        custom_fields = prc_clean_cf_data(raw_cf_data)
-    
-        # Setup Items:
+def _cf_cache_path():
+    return getattr(config, 'CF_CACHE_PATH', None) or os.environ.get('CU_API_CF_CACHE')
+
+def _is_fresh(fetched_at:float, ttl:float)->bool:
+    if fetched_at is None: return False
+    return ttl is None or time.time() - fetched_at < ttl
+
+def _read_json(path:str):
+    if not path or not os.path.exists(path): return None
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_json(path:str, data):
+    """Writes `data` to `path` through a temporary file so readers never see a partial file"""
+    if not path: return
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+def _cf_is_fresh(fetched_at:float)->bool:
+    return _is_fresh(fetched_at, getattr(config, 'CF_CACHE_TTL', 3600))
+
+def _read_cf_cache()->dict:
+    return _read_json(_cf_cache_path())
+
+def _write_cf_cache(cache:dict):
+    _write_json(_cf_cache_path(), cache)
+
+def prc_get_cf_fields(refresh:bool = False, # Fetch definitions from Copper even if the cache is fresh
+                     ):
+    """
+    Checks if custom_fields has been set and creates it if it hasn't been set or has
+    expired. Definitions come from the on-disk cache when it is fresh (see set_cf_cache), 
+    otherwise from Copper. Called by all Custom Field Functions.
+    """
 
-        custom_fields_dict = {}
-        reverse_id_lookup = {}
+    loaded = hasattr(config,"CUSTOM_FIELDS") and hasattr(config,"CUSTOM_FIELDS_DICT") and hasattr(config,"CF_ID_LOOKUP")
+    fetched_at = getattr(config, 'CF_FETCHED_AT', None)
+    if loaded and not refresh and (fetched_at is None or _cf_is_fresh(fetched_at)): return
 
-        for key in custom_fields.keys():
-            item_name = custom_fields[key].get('name')
-            custom_fields_dict[key] = item_name
-            reverse_id_lookup[item_name] = key
+    started = time.perf_counter()
+    cache = None if refresh else _read_cf_cache()
+    if cache is None or not _cf_is_fresh(cache.get('fetched_at')):
+        cache = {'fetched_at': time.time(), 'data': prc_request_cf_data()}
+        _write_cf_cache(cache)
 
-        custom_fields_list = list(custom_fields_dict.values())
+    custom_fields = prc_clean_cf_data(cache['data'])
 
-        config.CUSTOM_FIELDS = custom_fields              # Full data in JSON form
-        config.CUSTOM_FIELDS_DICT = custom_fields_dict    # ID -> Name
-        config.LIST_CF_NAMES = custom_fields_list         # List of Names
-        config.CF_ID_LOOKUP = reverse_id_lookup           # Name -> ID
+    # Setup Items:
 
-# %% ../nbs/API/core.ipynb 15
+    custom_fields_dict = {}
+    reverse_id_lookup = {}
+
+    for key in custom_fields.keys():
+        item_name = custom_fields[key].get('name')
+        custom_fields_dict[key] = item_name
+        reverse_id_lookup[item_name] = key
+
+    custom_fields_list = list(custom_fields_dict.values())
+
+    config.CUSTOM_FIELDS = custom_fields              # Full data in JSON form
+    config.CUSTOM_FIELDS_DICT = custom_fields_dict    # ID -> Name
+    config.LIST_CF_NAMES = custom_fields_list         # List of Names
+    config.CF_ID_LOOKUP = reverse_id_lookup           # Name -> ID
+    config.CF_FETCHED_AT = cache['fetched_at']        # When the definitions were fetched from Copper
+    events.emit('stage', name='custom_fields', seconds=time.perf_counter() - started)
+
+def refresh_custom_fields():
+    """Fetches custom field definitions from Copper now, updating the memory and disk caches"""
+    prc_get_cf_fields(refresh=True)
+
+# %% ../nbs/API/core.ipynb 22
 def get_cf_info(cf_id:str,     # ID of custom field
                 cf_info:list = None,  # Designed information about field, list if multiple items
                )->list: #Returns list if cf_info is list. Otherwise, returns value
@@ -192,3 +620,20 @@ def cf_option_name(cf_id:int, #Coppper ID for custom field
                   )->str: #Returns name/value of option
     return get_cf_options(cf_id).get(option_id)
 
+def get_cf_option_ids(cf_id:int, #Coppper ID for custom field
+                      ignore_case:bool = None, #Match option names regardless of case, defaults to config.CF_OPTIONS_IGNORE_CASE
+    )->dict: # Returns dictionary of option name -> option id
+    if ignore_case is None: ignore_case = getattr(config, 'CF_OPTIONS_IGNORE_CASE', False)
+    if ignore_case: return config.CUSTOM_FIELDS.get(cf_id).get('option_ids_lower')
+    else:           return config.CUSTOM_FIELDS.get(cf_id).get('option_ids')
+
+def cf_option_id(cf_id:int, #Coppper ID for custom field
+                 option_name:str, #Name/value of option
+                 ignore_case:bool = None, #Match option names regardless of case, defaults to config.CF_OPTIONS_IGNORE_CASE
+                )->int: #Returns Coppper ID for option, None if there is no match
+    if ignore_case is None: ignore_case = getattr(config, 'CF_OPTIONS_IGNORE_CASE', False)
+    option_ids = get_cf_option_ids(cf_id, ignore_case)
+    if option_ids is None: return None
+    if ignore_case and isinstance(option_name, str): option_name = option_name.lower()
+    return option_ids.get(option_name)
+
@@ -0,0 +1,159 @@
+"""Hooks fired around every Copper request, page, cleaning pass and bulk update"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/events.ipynb.
+
+# %% auto 0
+__all__ = ['EVENTS', 'on', 'off', 'listening', 'emit', 'request_id', 'Stats', 'collect_stats', 'Profile']
+
+# %% ../nbs/API/events.ipynb 3
+import time, threading, itertools, contextvars
+from collections import defaultdict, Counter
+import numpy as np
+import pandas as pd
+from . import config
+
+# %% ../nbs/API/events.ipynb 5
+EVENTS = ('request_start', 'request_end', 'rate_limited', 'retry', 'page_parsed', 'rows_cleaned', 'batch_updated', 'stage')
+
+_request_ids = itertools.count(1)
+
+def _listeners()->dict:
+    if getattr(config, 'LISTENERS', None) is None: config.LISTENERS = defaultdict(list)
+    return config.LISTENERS
+
+def on(event:str, # One of `EVENTS`, or '*' for all of them
+       callback, # Called as `callback(event, data)`
+      ):
+    """Registers `callback` for `event` and returns it"""
+    if event != '*' and event not in EVENTS: raise ValueError(f"Unknown event {event!r}, expected one of {EVENTS} or '*'")
+    _listeners()[event].append(callback)
+    return callback
+
+def off(event:str = None, # Event to stop listening to, None for every event
+        callback = None, # Listener to remove, None for all listeners of `event`
+       ):
+    """Removes listeners"""
+    listeners = _listeners()
+    for name in ([event] if event else list(listeners)):
+        if callback is None: listeners.pop(name, None)
+        elif callback in listeners.get(name, []): listeners[name].remove(callback)
+
+def listening(event:str)->bool:
+    """Whether anything listens to `event`"""
+    listeners = getattr(config, 'LISTENERS', None)
+    return bool(listeners) and bool(listeners.get(event) or listeners.get('*'))
+
+def emit(event:str, **data):
+    """Sends `data` to every listener of `event`"""
+    if not listening(event): return
+    data['time'] = time.time()
+    for callback in config.LISTENERS.get(event, []) + config.LISTENERS.get('*', []):
+        try:
+            callback(event, data)
+        except Exception as e:
+            print(f"Listener {callback!r} failed on {event}: {e!r}")
+
+def request_id()->int:
+    """New id linking a `request_start` to its `request_end`"""
+    return next(_request_ids)
+
+# %% ../nbs/API/events.ipynb 10
+class Stats:
+    """In-memory collector of the timings, sizes and counts carried by events"""
+    MEASURES = ('seconds', 'throttled', 'first_byte', 'transfer', 'bytes_sent', 'bytes_received', 'bytes', 'records', 'rows')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def __repr__(self):
+        return f"Stats({sum(self.counts.values())} events)"
+
+    def reset(self):
+        """Forgets everything collected so far"""
+        with self.lock:
+            self.counts = Counter()
+            self.statuses = Counter()
+            self.values = defaultdict(list)
+
+    def __call__(self, event:str, data:dict):
+        with self.lock:
+            self.counts[event] += 1
+            if data.get('status') is not None: self.statuses[(event, data['status'])] += 1
+            for measure in self.MEASURES:
+                value = data.get(measure)
+                if value is not None: self.values[(event, measure)].append(value)
+
+    def summary(self)->pd.DataFrame:
+        """One row per event and measure with its count, total, mean, percentiles and maximum"""
+        rows = []
+        with self.lock:
+            for (event, measure), values in sorted(self.values.items()):
+                values = np.asarray(values, dtype=float)
+                p50, p95, p99 = np.percentile(values, [50, 95, 99])
+                rows.append({'event': event, 'measure': measure, 'count': len(values), 'total': values.sum(),
+                             'mean': values.mean(), 'p50': p50, 'p95': p95, 'p99': p99, 'max': values.max()})
+        return pd.DataFrame(rows, columns=['event', 'measure', 'count', 'total', 'mean', 'p50', 'p95', 'p99', 'max'])
+
+def collect_stats()->Stats:
+    """Starts collecting every event in a new `Stats` and returns it"""
+    return on('*', Stats())
+
+# %% ../nbs/API/events.ipynb 14
+_profiles = contextvars.ContextVar('profiles', default=())
+
+class Profile:
+    """Listener breaking the work done inside a `with` block down into stages"""
+    STAGES = ('custom_fields', 'query', 'throttled', 'first_byte', 'transfer', 'json_decode', 'cleaning', 'dataframe', 'owners')
+    REQUEST_FIELDS = ('method', 'url', 'attempt', 'status', 'throttled', 'first_byte', 'transfer', 'seconds', 'bytes_received', 'error')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.timings = defaultdict(list)
+        self._requests = []
+        self.seconds = None
+
+    def __repr__(self):
+        seconds = 'running' if self.seconds is None else f"{self.seconds:.3f}s"
+        return f"Profile({seconds})\n{self.summary().round(3).to_string(index=False)}"
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        self._token = _profiles.set(_profiles.get() + (self,))
+        on('*', self)
+        return self
+
+    def __exit__(self, *exc):
+        off('*', self)
+        _profiles.reset(self._token)
+        self.seconds = time.perf_counter() - self._started
+
+    def __call__(self, event:str, data:dict):
+        # Events emitted outside the block's context belong to someone else's work
+        if self not in _profiles.get(): return
+        with self.lock:
+            if event == 'request_end':
+                self._requests.append({field: data.get(field) for field in self.REQUEST_FIELDS})
+                for stage in ('throttled', 'first_byte', 'transfer'):
+                    if data.get(stage) is not None: self.timings[stage].append(data[stage])
+            elif event == 'page_parsed':  self.timings['json_decode'].append(data['seconds'])
+            elif event == 'rows_cleaned': self.timings['cleaning'].append(data['seconds'])
+            elif event == 'stage':        self.timings[data['name']].append(data['seconds'])
+
+    @property
+    def requests(self)->pd.DataFrame:
+        """One row per request with its status and timings"""
+        with self.lock:
+            return pd.DataFrame(self._requests, columns=list(self.REQUEST_FIELDS))
+
+    def summary(self)->pd.DataFrame:
+        """Seconds spent in each stage, with how often it ran and the mean, p95 and longest run in milliseconds"""
+        rows = []
+        with self.lock:
+            stages = list(self.STAGES) + sorted(set(self.timings) - set(self.STAGES))
+            for stage in stages:
+                values = np.asarray(self.timings.get(stage, []), dtype=float)
+                if not len(values): continue
+                rows.append({'stage': stage, 'count': len(values), 'seconds': values.sum(), 'mean_ms': values.mean() * 1000,
+                             'p95_ms': np.percentile(values, 95) * 1000, 'max_ms': values.max() * 1000})
+        return pd.DataFrame(rows, columns=['stage', 'count', 'seconds', 'mean_ms', 'p95_ms', 'max_ms'])
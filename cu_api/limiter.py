@@ -0,0 +1,306 @@
+"""Client-side rate limiting shared by every Copper request"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/limiter.ipynb.
+
+# %% auto 0
+__all__ = ['RateLimiter', 'SharedRateLimiter', 'set_rate_limit', 'get_limiter', 'ConcurrencyController']
+
+# %% ../nbs/API/limiter.ipynb 3
+import time, threading, asyncio, sqlite3, os
+from email.utils import parsedate_to_datetime
+from . import config
+
+# %% ../nbs/API/limiter.ipynb 5
+def _parse_retry_after(retry_after)->float:
+    """Converts a `Retry-After` value (seconds or an HTTP date) to seconds"""
+    if retry_after is None: return None
+    try:
+        return max(0.0, float(retry_after))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class RateLimiter:
+    """
+    Adaptive token bucket used to pace requests to the Copper API.
+
+    Works from threads and coroutines alike: callers reserve a token under a lock 
+    and then sleep (or await) outside of it until the token is theirs.
+    """
+    def __init__(self,
+                 rate:float = 3.0, # Requests per second to start at
+                 burst:int = 3, # Most requests that can be sent back to back
+                 min_rate:float = 0.25, # Slowest rate after backing off
+                 max_rate:float = None, # Fastest rate to climb back to, defaults to `rate`
+                 increase:float = 0.05, # Requests per second added after each success
+                 decrease:float = 0.5, # Multiplier applied to the rate after a 429
+                ):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate or rate
+        self.increase = increase
+        self.decrease = decrease
+
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return f"RateLimiter(rate={self.rate:.2f}/s, burst={self.burst}, max_rate={self.max_rate})"
+
+    def _now(self)->float:
+        return time.monotonic()
+
+    def _take(self)->float:
+        now = self._now()
+        # After a 429 `updated` is the end of the block, tokens only start refilling from there
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+        self.tokens -= 1
+        return max(0.0, self.updated - now - self.tokens / self.rate)
+
+    def _adjust(self, status, retry_after):
+        if status == 429:
+            now = self._now()
+            # Requests already in flight when we backed off shouldn't cut the rate again
+            if now >= self.blocked_until: self.rate = max(self.min_rate, self.rate * self.decrease)
+            delay = _parse_retry_after(retry_after)
+            if delay is None: delay = 1 / self.rate
+            self.blocked_until = max(self.blocked_until, now + delay)
+            # Requests queued during the block are released one at a time after it, not all at once
+            self.tokens = min(self.tokens, 0.0)
+            self.updated = max(self.updated, self.blocked_until)
+        elif status < 400:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def reserve(self)->float:
+        """Takes a token and returns the seconds to wait before it can be used"""
+        with self.lock:
+            return self._take()
+
+    def acquire(self):
+        """Blocks the current thread until a request can be sent"""
+        wait = self.reserve()
+        if wait: time.sleep(wait)
+
+    async def acquire_async(self):
+        """Waits without blocking the event loop until a request can be sent"""
+        wait = await self._off_loop(self.reserve)
+        if wait: await asyncio.sleep(wait)
+
+    def on_response(self,
+                    status:int, # HTTP status code of the response
+                    retry_after = None, # `Retry-After` header value, in seconds or as a date
+                   ):
+        """Adjusts the rate based on the response Copper sent back"""
+        with self.lock:
+            self._adjust(status, retry_after)
+
+    async def on_response_async(self,
+                                status:int, # HTTP status code of the response
+                                retry_after = None, # `Retry-After` header value, in seconds or as a date
+                               ):
+        """Async version of `on_response`"""
+        await self._off_loop(self.on_response, status, retry_after)
+
+    async def _off_loop(self, func, *args):
+        """Runs `func` for a coroutine. The in-memory bucket only holds its lock for a moment, so it runs right here"""
+        return func(*args)
+
+# %% ../nbs/API/limiter.ipynb 8
+class SharedRateLimiter(RateLimiter):
+    """
+    `RateLimiter` whose state lives in a SQLite file, so that every process on the host 
+    using the same `path` shares one request budget.
+    """
+    def __init__(self,
+                 path:str, # SQLite file holding the shared bucket
+                 rate:float = 3.0, # Requests per second to start at
+                 burst:int = 3, # Most requests that can be sent back to back
+                 **kwargs # Other `RateLimiter` options
+                ):
+        super().__init__(rate, burst, **kwargs)
+        self.path = str(path)
+        self.updated = self._now()
+
+        conn = self._connect()
+        try:
+            conn.execute("""CREATE TABLE IF NOT EXISTS bucket (id INTEGER PRIMARY KEY CHECK (id = 0),
+                            rate REAL, tokens REAL, updated REAL, blocked_until REAL)""")
+            conn.execute("INSERT OR IGNORE INTO bucket VALUES (0, ?, ?, ?, ?)", (self.rate, self.tokens, self.updated, self.blocked_until))
+        finally:
+            conn.close()
+
+    def __repr__(self):
+        return f"SharedRateLimiter(path='{self.path}', rate={self.rate:.2f}/s, burst={self.burst}, max_rate={self.max_rate})"
+
+    def _now(self)->float:
+        # Monotonic clocks aren't comparable between processes
+        return time.time()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def _transaction(self, func):
+        """Loads the shared state, runs `func` against it and writes it back in one locked transaction"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            self.rate, self.tokens, self.updated, self.blocked_until = conn.execute(
+                "SELECT rate, tokens, updated, blocked_until FROM bucket WHERE id = 0").fetchone()
+            result = func()
+            conn.execute("UPDATE bucket SET rate = ?, tokens = ?, updated = ?, blocked_until = ? WHERE id = 0",
+                         (self.rate, self.tokens, self.updated, self.blocked_until))
+            conn.execute("COMMIT")
+            return result
+        except Exception:
+            if conn.in_transaction: conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def reserve(self)->float:
+        """Takes a token from the shared bucket and returns the seconds to wait before it can be used"""
+        with self.lock:
+            return self._transaction(self._take)
+
+    def on_response(self,
+                    status:int, # HTTP status code of the response
+                    retry_after = None, # `Retry-After` header value, in seconds or as a date
+                   ):
+        """Adjusts the shared rate based on the response Copper sent back"""
+        with self.lock:
+            self._transaction(lambda: self._adjust(status, retry_after))
+
+    async def _off_loop(self, func, *args):
+        """Runs `func` in a thread, waiting on another process's lock (up to 30s) must not stall the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+# %% ../nbs/API/limiter.ipynb 11
+def set_rate_limit(rate:float = 3.0, # Requests per second
+                   burst:int = 3, # Most requests that can be sent back to back
+                   path:str = None, # SQLite file to share the budget with other processes
+                   **kwargs # Other `RateLimiter` options
+                  )->RateLimiter:
+    """Replaces the shared limiter used for every Copper request"""
+    if path: config.LIMITER = SharedRateLimiter(path, rate, burst, **kwargs)
+    else:    config.LIMITER = RateLimiter(rate, burst, **kwargs)
+    return config.LIMITER
+
+def get_limiter()->RateLimiter:
+    """
+    Returns the shared limiter, creating one with the default Copper limits if needed.
+    If the `CU_API_RATE_BUDGET` environment variable is set, the new limiter shares its 
+    budget with every other process using that SQLite file.
+
+    While a cassette is replaying (see `core.set_cassette`) nothing reaches Copper, so an
+    unlimited limiter is returned instead.
+    """
+    cassette = getattr(config, 'CASSETTE', None)
+    if cassette is not None and cassette.mode == 'replay':
+        if getattr(config, 'REPLAY_LIMITER', None) is None: config.REPLAY_LIMITER = RateLimiter(rate=1e9, burst=10**9)
+        return config.REPLAY_LIMITER
+    if not isinstance(getattr(config, 'LIMITER', None), RateLimiter):
+        set_rate_limit(path=os.environ.get('CU_API_RATE_BUDGET'))
+    return config.LIMITER
+
+# %% ../nbs/API/limiter.ipynb 13
+class ConcurrencyController:
+    """
+    AIMD controller for the number of concurrent requests and the records per request.
+    Use `async with controller:` around each request and report how it went with `record`.
+    """
+    def __init__(self,
+                 concurrency:float = 4, # Requests in flight to start at
+                 min_concurrency:int = 1, # Fewest requests in flight after backing off
+                 max_concurrency:int = 16, # Most requests in flight
+                 batch_size:float = 10, # Records per request to start at
+                 min_batch_size:int = 1, # Smallest batch after backing off
+                 max_batch_size:int = 100, # Largest batch, Copper accepts up to 100 records per bulk request
+                 latency_target:float = 5.0, # Seconds per request above which it always counts as slow
+                 spike_factor:float = 2.0, # A request this many times slower than the recent average is a spike
+                 decrease:float = 0.5, # Multiplier applied to concurrency and batch size after a 5xx
+                ):
+        self.concurrency = float(concurrency)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.batch = float(batch_size)
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self.latency_target = latency_target
+        self.spike_factor = spike_factor
+        self.decrease = decrease
+
+        self.latency = None # Moving average of request latency
+        self.cut_at = 0.0 # When concurrency was last cut
+        self.in_flight = 0
+        self.condition = None
+
+    def __repr__(self):
+        return f"ConcurrencyController(concurrency={self.limit}, batch_size={self.batch_size})"
+
+    @property
+    def limit(self)->int:
+        """Requests allowed in flight right now"""
+        return int(self.concurrency)
+
+    @property
+    def batch_size(self)->int:
+        """Records to put in the next request"""
+        return int(self.batch)
+
+    def record(self,
+               status:int, # HTTP status code of the response
+               latency:float, # Seconds the request took
+              ):
+        """
+        Adjusts concurrency and batch size based on how a request went. A 429 changes nothing, 
+        the shared `RateLimiter` backs off for it.
+        """
+        if status >= 500:
+            if self._cut(latency):
+                self.concurrency = max(self.min_concurrency, self.concurrency * self.decrease)
+                self.batch = max(self.min_batch_size, self.batch * self.decrease)
+            return
+        if status >= 400: return
+
+        spike = latency > self.latency_target or (self.latency is not None and latency > self.spike_factor * self.latency)
+        self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+
+        if spike:
+            if not self._cut(latency): return
+            self.concurrency = max(self.min_concurrency, self.concurrency * 0.75)
+            self.batch = max(self.min_batch_size, self.batch * 0.75)
+        else:
+            # About one more request in flight, and one more record per batch, for each round of successes
+            self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+            self.batch = min(self.max_batch_size, self.batch + 1 / max(1, self.limit))
+
+    def _cut(self, latency:float)->bool:
+        """
+        Whether a failed or slow request should cut the limits. Requests already in flight 
+        at the last cut report the same congestion, so only the first one sent after it does.
+        """
+        now = time.monotonic()
+        if now - latency < self.cut_at: return False
+        self.cut_at = now
+        return True
+
+    async def __aenter__(self):
+        # Created on first use so it belongs to the running event loop
+        if self.condition is None: self.condition = asyncio.Condition()
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        async with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
@@ -0,0 +1,257 @@
+"""Keeping a local SQLite copy of your Copper records"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/mirror.ipynb.
+
+# %% auto 0
+__all__ = ['RESOURCES', 'NATIVE_COLUMNS', 'Mirror']
+
+# %% ../nbs/API/mirror.ipynb 3
+import sqlite3, json, time
+import pandas as pd
+from fastcore.basics import patch
+from . import core, config, companies, tasks
+from .query import _process_query
+from .clean import _timezone
+
+# %% ../nbs/API/mirror.ipynb 5
+RESOURCES = {'companies': (companies, 'company'), 'tasks': (tasks, 'task')}
+
+# Native Query keys that map to a different column in the cleaned data
+NATIVE_COLUMNS = {'assignee_ids': 'assignee_id'}
+
+def _quote(name)->str:
+    """Quotes a table or column name for SQLite"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+def _column_kind(column:pd.Series)->str:
+    """How a column has to be stored: 'datetime', 'json' or None for values SQLite can hold as they are"""
+    if isinstance(column.dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_any_dtype(column): return 'datetime'
+    values = column.dropna()
+    if values.empty: return None
+    if values.map(lambda value: isinstance(value, pd.Timestamp)).any(): return 'datetime'
+    if values.map(lambda value: isinstance(value, (list, dict))).any(): return 'json'
+    return None
+
+def _to_sql_values(column:pd.Series, kind:str)->list:
+    """Converts a column to plain Python values SQLite can store"""
+    if kind == 'datetime': column = column.map(lambda value: value.isoformat() if isinstance(value, pd.Timestamp) else value)
+    elif kind == 'json':   column = column.map(lambda value: json.dumps(value) if isinstance(value, (list, dict)) else value)
+    column = column.astype(object)
+    return column.where(column.notna(), None).tolist()
+
+def _parse_timestamps(column:pd.Series)->pd.Series:
+    """Parses ISO 8601 strings, with or without fractions of a second, to UTC on any pandas version"""
+    try:
+        return pd.to_datetime(column, utc=True)
+    except (TypeError, ValueError):
+        # pandas 2 guesses one format from the first value and rejects values written differently
+        return pd.to_datetime(column.map(lambda value: pd.Timestamp(value) if isinstance(value, str) else value), utc=True)
+
+def _from_sql_values(column:pd.Series, kind:str)->pd.Series:
+    """Undoes `_to_sql_values`"""
+    if kind == 'datetime': return _parse_timestamps(column).dt.tz_convert(_timezone())
+    if kind == 'json':     return column.map(lambda value: json.loads(value) if isinstance(value, str) else value)
+    return column
+
+# %% ../nbs/API/mirror.ipynb 6
+class Mirror:
+    """
+    Local SQLite copy of Copper records that `Query` objects can be run against.
+    There is one table per resource ('companies' or 'tasks') keyed by record `id`.
+    """
+    def __init__(self,
+                 path:str = 'copper_mirror.sqlite', # SQLite file to keep the records in
+                ):
+        self.path = str(path)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS _columns (resource TEXT, name TEXT, kind TEXT, position INTEGER, PRIMARY KEY (resource, name))")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS _syncs (resource TEXT PRIMARY KEY, synced_at REAL, records INTEGER)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS _marks (key TEXT PRIMARY KEY, mark INTEGER)")
+        self.conn.commit()
+
+    def __repr__(self):
+        return f"Mirror(path='{self.path}')"
+
+    def close(self):
+        self.conn.close()
+
+    def _columns(self, resource:str)->dict:
+        """Stored columns of a resource, in order, and how they are encoded"""
+        rows = self.conn.execute("SELECT name, kind FROM _columns WHERE resource = ? ORDER BY position", (resource,)).fetchall()
+        return dict(rows)
+
+# %% ../nbs/API/mirror.ipynb 9
+def _check_resource(resource:str):
+    if resource not in RESOURCES:
+        raise ValueError(f"Resource '{resource}' is not supported. Use one of {list(RESOURCES)}")
+
+@patch
+def _write(self:Mirror,
+           resource:str, # 'companies' or 'tasks'
+           df:pd.DataFrame, # Cleaned records, must include an 'id' column
+          )->int: # Number of records written
+    """Upserts cleaned records into the resource's table"""
+    if df.empty: return 0
+
+    table = _quote(resource)
+    self.conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY)")
+
+    stored = self._columns(resource)
+    values = {}
+    for position, name in enumerate(df.columns, start=len(stored)):
+        kind = stored.get(name)
+        if kind is None:
+            # A column that was empty so far gets its kind from the first values it does have
+            kind = _column_kind(df[name])
+            if name in stored and kind is not None:
+                self.conn.execute("UPDATE _columns SET kind = ? WHERE resource = ? AND name = ?", (kind, resource, name))
+                stored[name] = kind
+        if name not in stored:
+            if name != 'id': self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {_quote(name)}")
+            self.conn.execute("INSERT INTO _columns VALUES (?, ?, ?, ?)", (resource, name, kind, position))
+            stored[name] = kind
+        values[name] = _to_sql_values(df[name], kind)
+
+    columns = list(values)
+    sql = (f"INSERT INTO {table} ({', '.join(_quote(name) for name in columns)}) VALUES ({', '.join('?' for _ in columns)}) "
+           f"ON CONFLICT(id) DO UPDATE SET {', '.join(f'{_quote(name)} = excluded.{_quote(name)}' for name in columns if name != 'id')}")
+    self.conn.executemany(sql, zip(*values.values()))
+    return len(df)
+
+# %% ../nbs/API/mirror.ipynb 10
+@patch
+def sync(self:Mirror,
+         resource:str = 'companies', # 'companies' or 'tasks'
+         search_query = None, # Only sync records matching this Query, defaults to every record
+         incremental:bool = False, # Only pull records modified since the last incremental sync of this query
+         **kwargs # Passed on to the resource's `iter_search`
+        )->int: # Number of records synced
+    """
+    Pulls records from Copper into the mirror, with a column for every custom field 
+    available on the resource. A full sync (no `search_query`) also removes records 
+    that no longer exist in Copper. Incremental syncs keep their high-water marks in 
+    the mirror itself and never remove records.
+    """
+    _check_resource(resource)
+    module, record_type = RESOURCES[resource]
+
+    core.prc_get_cf_fields()
+    cf_fields = [info['name'] for info in config.CUSTOM_FIELDS.values() if record_type in (info.get('available_on') or [])]
+    full_sync = search_query is None and not incremental
+    if search_query is None: search_query = module.Query()
+    marks = dict(self.conn.execute("SELECT key, mark FROM _marks").fetchall()) if incremental else None
+
+    records = 0
+    seen_ids = []
+    for chunk in module.iter_search(search_query, cf_fields=cf_fields, incremental=incremental, sync_marks=marks, **kwargs):
+        records += self._write(resource, chunk)
+        if full_sync: seen_ids.extend(int(record_id) for record_id in chunk['id'])
+
+    if full_sync and records:
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS _seen (id INTEGER PRIMARY KEY)")
+        self.conn.execute("DELETE FROM _seen")
+        self.conn.executemany("INSERT OR IGNORE INTO _seen VALUES (?)", ((record_id,) for record_id in seen_ids))
+        self.conn.execute(f"DELETE FROM {_quote(resource)} WHERE id NOT IN (SELECT id FROM _seen)")
+
+    if incremental: self.conn.executemany("INSERT OR REPLACE INTO _marks VALUES (?, ?)", marks.items())
+    self._index(resource)
+    self.conn.execute("INSERT OR REPLACE INTO _syncs VALUES (?, ?, ?)", (resource, time.time(), records))
+    self.conn.commit()
+    return records
+
+# %% ../nbs/API/mirror.ipynb 13
+@patch
+def _index(self:Mirror,
+           resource:str, # 'companies' or 'tasks'
+           columns:list = None, # Columns to index, defaults to the filterable fields
+          ):
+    """Creates any missing indexes on the columns Query filters use"""
+    stored = self._columns(resource)
+    if not stored: return
+
+    if columns is None:
+        filterable = [info['name'] for info in config.CUSTOM_FIELDS.values() if info.get('is_filterable')]
+        columns = [name for name in ['name', 'assignee_id', 'contact_type_id', 'city', 'state', 'postal_code', 'related_id'] + filterable if name in stored]
+
+    for name in columns:
+        self.conn.execute(f"CREATE INDEX IF NOT EXISTS {_quote(f'ix_{resource}_{name}')} ON {_quote(resource)} ({_quote(name)})")
+
+# %% ../nbs/API/mirror.ipynb 14
+def _filter(column:str, kind:str, values)->tuple:
+    """SQL condition and parameters matching any of `values` in a column"""
+    if isinstance(values, dict):
+        raise ValueError(f"Range filters on '{column}' can't be run against the mirror")
+    if not isinstance(values, (list, tuple, set)): values = [values]
+    values = list(values)
+    placeholders = ', '.join('?' for _ in values)
+
+    if kind == 'json':
+        return f"EXISTS (SELECT 1 FROM json_each({_quote(column)}) WHERE json_each.value IN ({placeholders}))", values
+    return f"{_quote(column)} IN ({placeholders})", values
+
+@patch
+def query(self:Mirror,
+          search_query, # Instance of Query object
+          resource:str = 'companies', # 'companies' or 'tasks'
+         )->pd.DataFrame:
+    """Runs a Query against the mirror instead of the live API"""
+    _check_resource(resource)
+    stored = self._columns(resource)
+    if not stored: raise ValueError(f"No {resource} in the mirror yet. Run Mirror.sync('{resource}') first.")
+
+    Native_Params, CF_Parms, Outputs  = _process_query(search_query)
+
+    conditions, params, filtered = [], [], []
+    for key, values in Native_Params.items():
+        column = NATIVE_COLUMNS.get(key, key)
+        if column not in stored: raise ValueError(f"'{key}' isn't stored in the mirror and can't be filtered locally")
+        condition, condition_params = _filter(column, stored[column], values)
+        conditions.append(condition); params.extend(condition_params); filtered.append(column)
+
+    for cf_param in CF_Parms:
+        cf_id = cf_param['custom_field_definition_id']
+        column = config.CUSTOM_FIELDS_DICT.get(cf_id)
+        if column not in stored: raise ValueError(f"Custom field '{column}' isn't stored in the mirror")
+        values = cf_param['value']
+        if core.get_cf_options(cf_id) is not None:
+            values = [core.cf_option_name(cf_id, value) for value in (values if isinstance(values, list) else [values])]
+        condition, condition_params = _filter(column, stored[column], values)
+        conditions.append(condition); params.extend(condition_params); filtered.append(column)
+
+    self._index(resource, filtered)
+
+    # Same columns as `search`: native fields plus the custom fields the Query asks for
+    cf_names = set(config.CUSTOM_FIELDS_DICT.values())
+    output_names = {config.CUSTOM_FIELDS_DICT.get(item, item) for item in Outputs}
+    columns = [name for name in stored if name not in cf_names or name in output_names]
+
+    return self._read(resource, columns, conditions, params)
+
+@patch
+def _read(self:Mirror,
+          resource:str, # 'companies' or 'tasks'
+          columns:list, # Stored columns to select
+          conditions:list = None, # SQL conditions, all of which have to match
+          params:list = None, # Parameters for the conditions
+         )->pd.DataFrame:
+    """Selects records from the mirror and decodes them back to the values `search` returns"""
+    stored = self._columns(resource)
+    sql = f"SELECT {', '.join(_quote(name) for name in columns)} FROM {_quote(resource)}"
+    if conditions: sql += " WHERE " + " AND ".join(conditions)
+    df = pd.read_sql_query(sql + " ORDER BY id", self.conn, params=params or [])
+
+    for name in columns:
+        if stored[name]: df[name] = _from_sql_values(df[name], stored[name])
+    return df
+
+@patch
+def snapshot(self:Mirror,
+             resource:str = 'companies', # 'companies' or 'tasks'
+             columns:list = None, # Columns to include besides 'id', defaults to all of them
+            )->pd.DataFrame:
+    """Every stored record of a resource, for example as the `baseline` of `companies.update`"""
+    _check_resource(resource)
+    stored = self._columns(resource)
+    if not stored: return pd.DataFrame(columns=['id'] + list(columns or []))
+    columns = list(stored) if columns is None else ['id'] + [name for name in columns if name in stored and name != 'id']
+    return self._read(resource, columns)
@@ -0,0 +1,286 @@
+"""A local stand-in for the Copper API, for trying changes and running benchmarks offline"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/mock.ipynb.
+
+# %% auto 0
+__all__ = ['BASE_DATE', 'CUSTOM_FIELDS', 'MockCopper']
+
+# %% ../nbs/API/mock.ipynb 3
+import asyncio, threading, multiprocessing, socket, random, time, json
+from aiohttp import web
+from fastcore.basics import patch
+
+# %% ../nbs/API/mock.ipynb 5
+BASE_DATE = 1700000000
+
+CUSTOM_FIELDS = [
+    {"id": 1, "name": "Status", "data_type": "Dropdown", "available_on": ["company"], "is_filterable": True,
+     "options": [{"id": 101, "name": "Live"}, {"id": 102, "name": "Paused"}, {"id": 103, "name": "Churned"}]},
+    {"id": 2, "name": "Region", "data_type": "Dropdown", "available_on": ["company", "task"], "is_filterable": True,
+     "options": [{"id": 201, "name": "North"}, {"id": 202, "name": "South"}, {"id": 203, "name": "East"}, {"id": 204, "name": "West"}]},
+    {"id": 3, "name": "Start Date", "data_type": "Date", "available_on": ["company", "task"], "is_filterable": True},
+    {"id": 4, "name": "Score", "data_type": "Float", "available_on": ["company"], "is_filterable": True},
+    {"id": 5, "name": "Active", "data_type": "Checkbox", "available_on": ["company"], "is_filterable": True},
+    {"id": 6, "name": "Notes", "data_type": "String", "available_on": ["company", "task"], "is_filterable": False},
+]
+
+_TYPES = ['Dropdown', 'Date', 'Float', 'Checkbox', 'String']
+
+def _generated_fields(count:int)->list:
+    """`count` custom fields available on companies and tasks, cycling through the data types"""
+    fields = []
+    for n in range(1, count + 1):
+        field = {"id": n, "name": f"Field {n}", "data_type": _TYPES[(n - 1) % len(_TYPES)],
+                 "available_on": ["company", "task"], "is_filterable": True}
+        if field['data_type'] == 'Dropdown':
+            field['options'] = [{"id": n * 100 + k, "name": f"Option {k}"} for k in range(1, 6)]
+        fields.append(field)
+    return fields
+
+def _mix(*values)->int:
+    """Cheap deterministic hash of a few integers"""
+    h = 2166136261
+    for value in values: h = ((h ^ value) * 16777619) & 0xffffffff
+    return h
+
+def _field_value(field:dict, record_id:int, seed:int = 0):
+    """Value of a custom field on a record, always the same for the same id and seed"""
+    h = _mix(seed, field['id'], record_id)
+    data_type = field.get('data_type')
+    if 'options' in field:
+        options = field['options']
+        k = h % (len(options) + 1)
+        value = options[k]['id'] if k < len(options) else None
+        return ([value] if value else []) if data_type == 'MultiSelect' else value
+    if data_type == 'Date':     return None if h % 7 == 0 else BASE_DATE + (h % 1500 - 750) * 86400
+    if data_type in ('Float', 'Currency', 'Percentage'): return round((h % 100000) / 100, 2)
+    if data_type == 'Checkbox': return bool(h % 2)
+    return f"{field['name']} {record_id}"
+
+# %% ../nbs/API/mock.ipynb 7
+class MockCopper:
+    """
+    An aiohttp app serving `/companies/search`, `/tasks/search`, `/companies/bulk_update`, `/users` and
+    `/custom_field_definitions` from generated records. Start it with `start()` (or a `with` block) and
+    point cu_api at it with `core.set_base_url(server.url)`.
+    """
+    def __init__(self,
+                 companies:int = 1000, # Number of companies in the account
+                 tasks:int = 1000, # Number of tasks in the account
+                 custom_fields = None, # Custom field definitions, or how many to generate. Defaults to `CUSTOM_FIELDS`
+                 users:int = 5, # Number of users records are assigned to
+                 latency = 0.0, # Seconds added to every response, or a (low, high) range
+                 rate_429:float = 0.0, # Share of requests answered with a 429
+                 retry_after:float = 1, # Retry-After header sent with a 429, None to leave it out
+                 seed:int = 0, # Changes every generated value
+                 host:str = '127.0.0.1',
+                 port:int = 0, # 0 picks a free port
+                ):
+        if custom_fields is None:           custom_fields = CUSTOM_FIELDS
+        elif isinstance(custom_fields, int): custom_fields = _generated_fields(custom_fields)
+        self.counts = {'companies': companies, 'tasks': tasks}
+        self.custom_fields = custom_fields
+        self.user_ids = list(range(1001, 1001 + max(1, users)))
+        self.latency, self.rate_429, self.retry_after, self.seed = latency, rate_429, retry_after, seed
+        self.host, self.port = host, port
+        self.updates = {'companies': {}, 'tasks': {}}
+        self.log = []
+        self._random = random.Random(seed)
+        self._matches = {}
+        self._loop = None
+        self._worker = None
+
+    def __repr__(self):
+        return f"MockCopper({self.counts['companies']} companies, {self.counts['tasks']} tasks, url={self.url!r})"
+
+    @property
+    def url(self)->str:
+        """Root of the mock API, to pass to `core.set_base_url`"""
+        return f"http://{self.host}:{self.port}"
+
+    def __enter__(self): return self.start()
+    def __exit__(self, *exc): self.stop()
+
+# %% ../nbs/API/mock.ipynb 9
+def _fields_on(fields:list, kind:str)->list:
+    resource = {'companies': 'company', 'tasks': 'task'}[kind]
+    return [field for field in fields if resource in field.get('available_on', [])]
+
+@patch
+def record(self:MockCopper,
+           kind:str, # 'companies' or 'tasks'
+           record_id:int):
+    """The record `record_id` as Copper would return it, with any values sent to `bulk_update`"""
+    users, h = self.user_ids, _mix(self.seed, record_id)
+    updates = self.updates[kind].get(record_id, {})
+    custom_fields = [{"custom_field_definition_id": field['id'],
+                      "value": updates[field['id']] if field['id'] in updates else _field_value(field, record_id, self.seed)}
+                     for field in _fields_on(self.custom_fields, kind)]
+    modified = updates.get('date_modified', BASE_DATE + record_id)
+
+    if kind == 'companies':
+        return {"id": record_id, "name": f"Company {record_id}", "assignee_id": users[h % len(users)], "contact_type_id": 1 + h % 4,
+                "address": None if h % 10 == 0 else {"street": f"{record_id} Main St", "city": "Springfield", "state": "IL",
+                                                       "postal_code": f"{62700 + h % 100}", "country": "US"},
+                "tags": [], "date_created": BASE_DATE, "date_modified": modified, "custom_fields": custom_fields}
+    return {"id": record_id, "name": f"Task {record_id}", "assignee_id": users[h % len(users)], "tags": [],
+            "related_resource": {"id": 1 + h % max(1, self.counts['companies']), "type": "company"},
+            "due_date": BASE_DATE + (h % 60) * 86400, "reminder_date": None,
+            "completed_date": BASE_DATE + record_id if h % 3 == 0 else None, "status": "Completed" if h % 3 == 0 else "Open",
+            "priority": "None", "date_created": BASE_DATE, "date_modified": modified, "custom_fields": custom_fields}
+
+@patch
+def _matching(self:MockCopper, kind:str, body:dict):
+    """Ids of the records a search matches. Unfiltered searches never build the list"""
+    filters = {key: value for key, value in body.items() if key not in ('page_size', 'page_number', 'sort_by', 'sort_direction')}
+    if not filters: return range(1, self.counts[kind] + 1)
+
+    key = (kind, json.dumps(filters, sort_keys=True, default=str))
+    if key not in self._matches:
+        if len(self._matches) >= 32: self._matches.pop(next(iter(self._matches)))
+        self._matches[key] = [record_id for record_id in filters.get('ids') or range(1, self.counts[kind] + 1)
+                              if 0 < record_id <= self.counts[kind] and _matches(self.record(kind, record_id), filters)]
+    return self._matches[key]
+
+def _matches(record:dict, filters:dict)->bool:
+    if 'assignee_ids' in filters and record['assignee_id'] not in filters['assignee_ids']: return False
+    if 'minimum_modified_date' in filters and record['date_modified'] < filters['minimum_modified_date']: return False
+    if 'name' in filters and str(filters['name']).lower() not in record['name'].lower(): return False
+    values = {field['custom_field_definition_id']: field['value'] for field in record['custom_fields']}
+    for condition in filters.get('custom_fields', []):
+        wanted = condition.get('value')
+        if not isinstance(wanted, list): wanted = [wanted]
+        value = values.get(condition.get('custom_field_definition_id'))
+        if not (set(value) & set(wanted) if isinstance(value, list) else value in wanted): return False
+    return True
+
+# %% ../nbs/API/mock.ipynb 11
+@patch
+async def _respond(self:MockCopper, handler, request:web.Request)->web.Response:
+    """Adds the latency, 429s and the request log around every endpoint"""
+    started = time.perf_counter()
+    if 'X-PW-AccessToken' not in request.headers:
+        response = web.json_response({"success": False, "message": "Invalid credentials"}, status=401)
+    else:
+        latency = self._random.uniform(*self.latency) if isinstance(self.latency, (tuple, list)) else self.latency
+        if latency: await asyncio.sleep(latency)
+        if self.rate_429 and self._random.random() < self.rate_429:
+            headers = {} if self.retry_after is None else {'Retry-After': str(self.retry_after)}
+            response = web.json_response({"success": False, "message": "Rate limit exceeded"}, status=429, headers=headers)
+        else:
+            response = await handler(request)
+    self.log.append((request.method, request.path, response.status, time.perf_counter() - started))
+    return response
+
+@patch
+async def _search(self:MockCopper, kind:str, request:web.Request)->web.Response:
+    body = await request.json()
+    ids = self._matching(kind, body)
+    size, page = min(int(body.get('page_size', 20)), 200), int(body.get('page_number', 1))
+    records = [self.record(kind, record_id) for record_id in ids[(page - 1) * size: page * size]]
+    return web.json_response(records, headers={'X-PW-TOTAL': str(len(ids))})
+
+@patch
+async def _bulk_update(self:MockCopper, kind:str, request:web.Request)->web.Response:
+    body = await request.json()
+    changes = body.get(kind, [])
+    if not all(0 < int(change.get('id', 0)) <= self.counts[kind] for change in changes):
+        return web.json_response({"success": False, "message": "Resource not found"}, status=422)
+    for change in changes:
+        updates = self.updates[kind].setdefault(int(change['id']), {})
+        for field in change.get('custom_fields', []): updates[field['custom_field_definition_id']] = field.get('value')
+        updates['date_modified'] = int(time.time())
+    self._matches.clear()
+    return web.json_response([self.record(kind, int(change['id'])) for change in changes])
+
+@patch
+async def _users(self:MockCopper, request:web.Request)->web.Response:
+    body = await request.json()
+    size, page = min(int(body.get('page_size', 20)), 200), int(body.get('page_number', 1))
+    users = [{"id": user_id, "name": f"User {user_id}", "email": f"user{user_id}@example.com"}
+             for user_id in self.user_ids[(page - 1) * size: page * size]]
+    return web.json_response(users, headers={'X-PW-TOTAL': str(len(self.user_ids))})
+
+@patch
+async def _user(self:MockCopper, request:web.Request)->web.Response:
+    user_id = int(request.match_info['user_id'])
+    if user_id not in self.user_ids: return web.json_response({"success": False, "message": "Resource not found"}, status=404)
+    return web.json_response({"id": user_id, "name": f"User {user_id}", "email": f"user{user_id}@example.com"})
+
+@patch
+async def _stats(self:MockCopper, request:web.Request)->web.Response:
+    """Hands over the request log and starts a new one"""
+    log, self.log = self.log, []
+    return web.json_response(log)
+
+@patch
+def app(self:MockCopper)->web.Application:
+    """The aiohttp application, to run with any aiohttp runner"""
+    def route(handler, *args):
+        async def endpoint(request): return await self._respond(lambda request: handler(*args, request), request)
+        return endpoint
+
+    async def definitions(request): return web.json_response(self.custom_fields)
+
+    app = web.Application(client_max_size=64 * 1024 ** 2)
+    app.add_routes([web.post('/companies/search', route(self._search, 'companies')),
+                    web.post('/tasks/search', route(self._search, 'tasks')),
+                    web.put('/companies/bulk_update', route(self._bulk_update, 'companies')),
+                    web.post('/companies/bulk_update', route(self._bulk_update, 'companies')),
+                    web.post('/users/search', route(self._users)),
+                    web.get('/users/{user_id}', route(self._user)),
+                    web.get('/custom_field_definitions', route(definitions)),
+                    web.get('/_mock/stats', self._stats)])
+    return app
+
+# %% ../nbs/API/mock.ipynb 13
+def _free_port(host:str)->int:
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+@patch
+def _serve(self:MockCopper, ready):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    runner = web.AppRunner(self.app(), access_log=None)
+    loop.run_until_complete(runner.setup())
+    loop.run_until_complete(web.TCPSite(runner, self.host, self.port).start())
+    self._loop = loop
+    ready.set()
+    try:     loop.run_forever()
+    finally:
+        loop.run_until_complete(runner.cleanup())
+        loop.close()
+
+@patch
+def start(self:MockCopper,
+          process:bool = False, # Run the server in a child process instead of a thread
+          timeout:float = 30, # Seconds to wait for the server to come up
+         )->MockCopper:
+    """Starts serving in the background and returns the server"""
+    if self._worker is not None: return self
+    if not self.port: self.port = _free_port(self.host)
+    if process:
+        ready = multiprocessing.Event()
+        worker = multiprocessing.Process(target=self._serve, args=(ready,), daemon=True)
+    else:
+        ready = threading.Event()
+        worker = threading.Thread(target=self._serve, args=(ready,), daemon=True)
+    worker.start()
+    self._worker = worker
+    if not ready.wait(timeout):
+        self.stop()
+        raise RuntimeError(f"Mock Copper server did not start on {self.url}")
+    return self
+
+@patch
+def stop(self:MockCopper):
+    """Stops the server"""
+    if self._worker is None: return
+    if isinstance(self._worker, threading.Thread):
+        if self._loop is not None: self._loop.call_soon_threadsafe(self._loop.stop)
+    else:
+        self._worker.terminate()
+    self._worker.join()
+    self._worker, self._loop = None, None
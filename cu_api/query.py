@@ -4,8 +4,9 @@
 __all__ = ['Query']
 
 # %% ../nbs/API/query.ipynb 3
-from . import config
-from .core import get_cf_options, prc_get_cf_fields
+from . import config, events
+import time
+from .core import get_cf_options, cf_option_id, prc_get_cf_fields
 import pandas as pd
 from fastcore.basics import patch
 from typing import Union, List
@@ -67,29 +68,26 @@ def _check_value(key:int, value):
     Function to convert provided custom field values to their corresponding IDs.
 
     This function ensures that the provided 'values' are the IDs for the given custom field key 'key'.
+    Option names are matched with the reverse index built by `prc_clean_cf_data`, so long
+    value lists against large dropdowns stay linear.
     """
     if isinstance(value, str): value = [value]
     if isinstance(value, int): value = [value]
 
-    def find_key_by_value(dictionary, search_value):
-
-        for key, value in dictionary.items():
-            if value == search_value:
-                return key
-
     cf_options = get_cf_options(key)
     Updated_List = []
 
     for item in value:
-        if isinstance(item,str) and item in cf_options.values():
-            id_value = find_key_by_value(cf_options, item)
+        id_value = cf_option_id(key, item) if isinstance(item,str) else None
+
+        if id_value is not None:
             Updated_List.append(id_value)
-        elif isinstance(item,int) and item in cf_options.keys():
+        elif isinstance(item,int) and item in cf_options:
             Updated_List.append(item)
         elif isinstance(item,str):
             try:
                 int_key = int(item)
-                if int_key in cf_options.keys():
+                if int_key in cf_options:
                     Updated_List.append(int_key)
             except ValueError:
                 continue
@@ -101,7 +99,7 @@ def _check_value(key:int, value):
 def _process_input(self:Query, key, value):
     """Default processing function that stores the length of the value."""
 
-    if isinstance(key,list) or key not in ['id','name','address','assignee_ids','contact_type_id',
+    if isinstance(key,list) or key not in ['id','ids','name','address','assignee_ids','contact_type_id',
                 'phone_number','city','state','postal_code','email_domains','tags','due_date','reminder_date','completed_date']:
         self.outputs.append(key)
         key = _check_key(key) 
@@ -177,6 +175,7 @@ def _process_query(Query):
 
     Output_CFs - list of desired custom fields for the output dataframe
     """
+    started = time.perf_counter()
     Native_Params = {}
     CF_Params = []
     Outputs = Query.keys()
@@ -193,5 +192,6 @@ def _process_query(Query):
     
     for item in Query.outputs:
         Outputs.append(_check_key(item))
-        
+
+    events.emit('stage', name='query', seconds=time.perf_counter() - started)
     return Native_Params, CF_Params, Outputs
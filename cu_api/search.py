@@ -3,99 +3,603 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/search.ipynb.
 
 # %% auto 0
-__all__ = ['search_over_field', 'get_owners']
+__all__ = ['iter_search', 'search_async', 'search_over_field', 'iter_search_over_field', 'search_over_field_async',
+           'set_sync_marks', 'get_sync_mark', 'reset_sync_mark', 'set_checkpoint_dir', 'SearchCache',
+           'set_search_cache', 'get_search_cache', 'invalidate_search_cache', 'get_owners', 'get_owners_async']
 
 # %% ../nbs/API/search.ipynb 5
-import requests, time
-from . import core, config
+import requests, time, asyncio, copy, json, hashlib, os, gzip, shutil, threading, contextvars
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from . import core, config, users, events
 from .query import _process_query
 from tqdm.autonotebook import tqdm
 
 # %% ../nbs/API/search.ipynb 6
+def _page_params(page:int, # Page number to request
+                 Native_Params:dict, # Search parameters for native fields
+                 CF_Parms:list, # Search parameters for custom fields
+                )->dict:
+    """Builds the payload for a single page of a search"""
+    params = {
+        "page_size": 100,
+        "page_number": page,
+        }
+    
+    if Native_Params: params.update(Native_Params)
+
+    if CF_Parms:     params.update({"custom_fields":CF_Parms}) 
+    return params
+
+def _search_options(kwargs:dict)->dict:
+    """Picks the options meant for the search loop out of the keyword arguments a `search` was called with"""
+    return {key: kwargs[key] for key in ('max_workers', 'sync_marks', 'checkpoint', 'cache') if key in kwargs}
+
+def _request_page(url:str, # Copper API url
+                  page_params:dict, # Payload for the page
+                  max_retries:int = 5, # Maximum retry attempts
+                  retry_delay:float = 2.0, # Delay in seconds after a 429 without a Retry-After header
+                 ):
+    """Requests a single page of search results, retrying when rate limited"""
+    result = core.request('POST', url, max_retries=max_retries, retry_delay=retry_delay, json=page_params)
+
+    if result.status_code == 200:
+        return result
+    elif result.status_code == 429:
+        raise Exception(f"Rate limit retries exhausted on page {page_params['page_number']}")
+    else:
+        print(f"Issue with page {page_params['page_number']}")
+        raise Exception(f"Error {result.status_code} retrieved from API")
+
+def _parse_page(url:str, # Copper API url
+                page:int, # Page number
+                content, # Body of the response, as bytes or text
+                parse, # Decodes the body
+               )->list:
+    """Decodes a page of records, reporting how long it took as a `page_parsed` event"""
+    started = time.perf_counter()
+    records = parse()
+    if events.listening('page_parsed'):
+        events.emit('page_parsed', url=url, page=page, records=len(records), bytes=core._size(content), seconds=time.perf_counter() - started)
+    return records
+
+def iter_search(search_query, # Instance of Query object
+                url, # Copper API url,
+                max_retries:int = 5, # Maximum retry attempts
+                retry_delay:float = 2.0, # Delay in seconds between retries,
+                max_workers:int = None, # Pages requested at once after the first page
+                incremental:bool = False, # Only fetch records modified since the last incremental search, see `get_sync_mark`
+                sync_marks:dict = None, # Where to keep high-water marks, defaults to the shared store from `set_sync_marks`
+                checkpoint:str = None, # Directory to save pages in so an interrupted search can resume, see `set_checkpoint_dir`
+                cache:bool = True, # Use the result cache when one is set up with `set_search_cache`, False to bypass it
+                **kwags
+               ):
+    """Streaming version of `_search_loop`.
+
+    Returns `(pages, Outputs)` where `pages` is a generator that yields the records of 
+    each page, in page order, as they arrive. The first page is requested on its own to 
+    learn the total number of pages from the `X-PW-TOTAL` header. At most `max_workers` 
+    of the remaining pages are in flight or waiting to be consumed at any time, so memory 
+    stays flat however many pages the search has.
+
+    With `incremental`, only records modified since the query's high-water mark are 
+    requested. Once every page has been consumed the mark moves up to the time the 
+    search started, less `config.SYNC_OVERLAP` seconds, so records modified while the 
+    pages were being read are picked up by the next run.
+
+    With a `checkpoint` directory every page is saved as it arrives, and a rerun of the 
+    same search reads the saved pages instead of requesting them again.
+
+    When the result cache is on, an identical search made within its `ttl` gets the 
+    cached raw pages back without any requests.
+    """
+    if 'debug' in kwags.keys(): debug = kwags['debug']
+    else:                       debug = False
+
+    if 'tqmd' in kwags.keys(): tqmd_msg = f"Searching Copper: {kwags['tqmd']}"
+    else:                      tqmd_msg = "Searching Copper"
+
+    if max_workers is None: max_workers = getattr(config, 'SEARCH_WORKERS', 4)
+    max_workers = max(1, max_workers)
+
+    Native_Params, CF_Parms, Outputs  = _process_query(search_query)
+    next_mark = None
+    if incremental: Native_Params, key, next_mark = _modified_since(Native_Params, CF_Parms, url, sync_marks)
+    if debug: print(f"Native_Params: {Native_Params}")
+    if debug: print(f"CF_Params: {CF_Parms}")
+
+    def page_params(page):
+        params = _page_params(page, Native_Params, CF_Parms)
+        if debug: print(f'Payload: {params}')
+        return params
+
+    if checkpoint is None: checkpoint = _checkpoint_dir()
+    # Incremental searches depend on the sync mark, so they always go to Copper
+    result_cache = get_search_cache() if cache and not incremental else None
+    saved = os.path.join(checkpoint, _query_key(Native_Params, CF_Parms, url)) if checkpoint else None
+
+    def fetch(page):
+        result = _request_page(url, page_params(page), max_retries, retry_delay)
+        page_results = _parse_page(url, page, result.content, result.json)
+        if saved: _save_page(saved, page, page_results)
+        return result, page_results
+
+    def pages():
+        mark = next_mark
+        meta = core._read_json(os.path.join(saved, 'meta.json')) if saved else None
+        if meta and os.path.exists(_page_path(saved, 1)):
+            total_pages = meta['total_pages']
+            # The saved pages were read when the interrupted run started, so its mark is the one to keep
+            mark = meta.get('next_mark', mark)
+            page_results = _load_page(saved, 1)
+            if debug: print(f"Resuming from checkpoint {saved}")
+        else:
+            result, page_results = fetch(1)
+            total_pages = (int(result.headers['X-PW-TOTAL'])//100)+1
+            if saved: core._write_json(os.path.join(saved, 'meta.json'), {'url': url, 'total_pages': total_pages, 'next_mark': next_mark})
+
+        # Creatig Progress Bar:
+        progress_bar = tqdm(total=total_pages,desc=tqmd_msg,leave=False)
+        progress_bar.update(1)
+        yield page_results
+
+        # Remaining pages are fetched concurrently, in the caller's context so its `events.Profile` sees them, and handed back in page order
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            next_page = 2
+            while next_page <= total_pages or pending:
+                while next_page <= total_pages and len(pending) < max_workers:
+                    # Pages saved by an earlier run are read back instead of requested
+                    if saved and os.path.exists(_page_path(saved, next_page)): pending.append((next_page, None))
+                    else: pending.append((next_page, executor.submit(contextvars.copy_context().run, fetch, next_page)))
+                    next_page += 1
+
+                page, future = pending.popleft()
+                page_results = _load_page(saved, page) if future is None else future.result()[1]
+                progress_bar.update(1)  # Update the progress bar
+                yield page_results
+
+        progress_bar.close()  # Close the progress bar when done
+        if incremental: _set_sync_mark(key, mark, sync_marks)
+        # The search finished, so the next run should fetch fresh results
+        if saved: shutil.rmtree(saved, ignore_errors=True)
+
+    def cached_pages():
+        key = _cache_key(Native_Params, CF_Parms, url)
+        hit = result_cache.get(key)
+        if hit is not None:
+            if debug: print("Returning cached pages")
+            yield from hit
+            return
+
+        collected = []
+        for page_results in pages():
+            collected.append(page_results)
+            yield page_results
+        result_cache.put(key, collected)
+
+    return (cached_pages() if result_cache else pages()), Outputs
+
 def _search_loop(search_query, # Instance of Query object
                  url, # Copper API url,
                  max_retries:int = 5, # Maximum retry attempts
                  retry_delay:float = 2.0, # Delay in seconds between retries,
+                 max_workers:int = None, # Pages requested at once after the first page
+                 incremental:bool = False, # Only fetch records modified since the last incremental search
+                 sync_marks:dict = None, # Where to keep high-water marks, defaults to the shared store
+                 checkpoint:str = None, # Directory to save pages in so an interrupted search can resume
+                 cache:bool = True, # Use the result cache when one is set up, False to bypass it
                  **kwags
                 ):
     """Standard search loop used across all Copper record types
+
+    Collects every page from `iter_search` into one list.
+    """
+    pages, Outputs = iter_search(search_query, url, max_retries, retry_delay, max_workers, incremental, sync_marks, checkpoint, cache, **kwags)
+
+    combined_results = []
+    for page_results in pages:
+        combined_results.extend(page_results)
+    
+    return combined_results, Outputs
+
+
+async def _request_page_async(session, # aiohttp.ClientSession used for the call
+                              url:str, # Copper API url
+                              page_params:dict, # Payload for the page
+                              max_retries:int = 5, # Maximum retry attempts
+                              retry_delay:float = 2.0, # Delay in seconds after a 429 without a Retry-After header
+                             ):
+    """Async version of `_request_page`. Returns the `X-PW-TOTAL` header and the page's records"""
+    result = await core.request_async('POST', url, session=session, max_retries=max_retries, retry_delay=retry_delay, json=page_params)
+
+    if result.status == 200:
+        text = await result.text()
+        return int(result.headers['X-PW-TOTAL']), _parse_page(url, page_params['page_number'], text, lambda: json.loads(text))
+    elif result.status == 429:
+        raise Exception(f"Rate limit retries exhausted on page {page_params['page_number']}")
+    else:
+        print(f"Issue with page {page_params['page_number']}")
+        raise Exception(f"Error {result.status} retrieved from API")
+
+async def search_async(search_query, # Instance of Query object
+                       url, # Copper API url,
+                       max_retries:int = 5, # Maximum retry attempts
+                       retry_delay:float = 2.0, # Delay in seconds between retries,
+                       max_workers:int = None, # Pages requested at once after the first page
+                       session = None, # aiohttp.ClientSession to use, defaults to core.get_async_session()
+                       incremental:bool = False, # Only fetch records modified since the last incremental search
+                       sync_marks:dict = None, # Where to keep high-water marks, defaults to the shared store
+                       cache:bool = True, # Use the result cache when one is set up, False to bypass it
+                       **kwags
+                      ):
+    """Async version of `_search_loop` that can be awaited from inside your own event loop.
+
+    Requests go through one pooled `aiohttp.ClientSession`, so many searches can run 
+    concurrently without blocking a thread each. Returns the same `(results, Outputs)` 
+    pair as `_search_loop`. Checkpoints aren't supported, use `iter_search` to resume.
     """
+    if kwags.get('checkpoint') is not None: raise TypeError("search_async doesn't support checkpoint, use iter_search or search")
+
     if 'debug' in kwags.keys(): debug = kwags['debug']
     else:                       debug = False
 
     if 'tqmd' in kwags.keys(): tqmd_msg = f"Searching Copper: {kwags['tqmd']}"
     else:                      tqmd_msg = "Searching Copper"
 
-    Sess = core.get_session()
+    if max_workers is None: max_workers = getattr(config, 'SEARCH_WORKERS', 4)
+    if session is None:     session = core.get_async_session()
 
     Native_Params, CF_Parms, Outputs  = _process_query(search_query)
+    if incremental: Native_Params, key, next_mark = _modified_since(Native_Params, CF_Parms, url, sync_marks)
     if debug: print(f"Native_Params: {Native_Params}")
     if debug: print(f"CF_Params: {CF_Parms}")
 
-    total_pages = page = 1
-    combined_results = []
-    
-    while page <= total_pages:
-        page_params = {
-            "page_size": 100,
-            "page_number": page,
-            }
-        
-        if Native_Params: page_params.update(Native_Params)
-
-        if CF_Parms:     page_params.update({"custom_fields":CF_Parms}) 
-        if debug: print(f'Payload: {page_params}')
-
-        retries = 0
-        while retries < max_retries:
-            result = Sess.post(url,json=page_params)
-    
-            if result.status_code == 200:
-                total_pages = (int(result.headers['X-PW-TOTAL'])//100)+1
-                
-                # Creatig Progress Bar:
-                if page == 1: progress_bar = tqdm(total=total_pages,desc=tqmd_msg,leave=False)
-                progress_bar.update(1)  # Update the progress bar
-                
-                result_json = result.json()
-                combined_results.extend(result_json)
-                page +=1
-                break
-            elif result.status_code == 429:
-                retries += 1
-                #print(f"Rate limit encountered. Retry {retries}/{max_retries} in {retry_delay} seconds.")
-                time.sleep(retry_delay)
-            else:
-                print(f"Issue with page {page}")
-                raise Exception(f"Error {result.status_code} retrieved from API")
-    
-    progress_bar.close()  # Close the progress bar when done
-    
+    result_cache = get_search_cache() if cache and not incremental else None
+    if result_cache:
+        cache_key = _cache_key(Native_Params, CF_Parms, url)
+        hit = result_cache.get(cache_key)
+        if hit is not None: return [record for page_results in hit for record in page_results], Outputs
+
+    total, first_page = await _request_page_async(session, url, _page_params(1, Native_Params, CF_Parms), max_retries, retry_delay)
+    total_pages = (total//100)+1
+
+    progress_bar = tqdm(total=total_pages,desc=tqmd_msg,leave=False)
+    progress_bar.update(1)
+
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+
+    async def fetch(page):
+        async with semaphore:
+            _, page_results = await _request_page_async(session, url, _page_params(page, Native_Params, CF_Parms), max_retries, retry_delay)
+        progress_bar.update(1)
+        return page_results
+
+    # gather returns the pages in the order they were requested
+    pages = await asyncio.gather(*[fetch(page) for page in range(2, total_pages + 1)])
+    progress_bar.close()
+
+    combined_results = list(first_page)
+    for page_results in pages: combined_results.extend(page_results)
+
+    if result_cache: result_cache.put(cache_key, [first_page, *pages])
+    if incremental: _set_sync_mark(key, next_mark, sync_marks)
     return combined_results, Outputs
 
 
 # %% ../nbs/API/search.ipynb 7
-def search_over_field(field:str,
-                      url:str,
-                      search_query):
-    
+def _unique_records(records:list, # Raw records
+                    seen:set = None, # Ids already returned, updated in place
+                   )->list:
+    """Drops records whose `id` has already been seen, keeping the first copy"""
+    if seen is None: seen = set()
+    unique = []
+    for record in records:
+        record_id = record.get('id')
+        if record_id is not None:
+            if record_id in seen: continue
+            seen.add(record_id)
+        unique.append(record)
+    return unique
+
+def _field_queries(field:str, search_query)->list:
+    """One copy of `search_query` per value of `field`, the caller's Query is left as it is"""
+    values = search_query[field]
+    if not isinstance(values, (list, tuple, set)): values = [values]
+
+    queries = []
+    for value in values:
+        value_query = copy.deepcopy(search_query)
+        value_query[field] = value
+        queries.append((value, value_query))
+    return queries
+
+def search_over_field(field:str, # Field to run a separate search for each value of
+                      url:str, # Copper API url
+                      search_query, # Instance of Query object
+                      max_searches:int = None, # Searches run at once, defaults to all of them up to 16
+                      **kwags):
+    """
+    Runs one search per value of `field` for fields Copper can only match one value of at 
+    a time. The searches run concurrently and share the rate limiter, so the total time is 
+    close to that of the slowest one. Results are merged in value order without duplicates.
+
+    The searches also share the session's connection pool (see `core.set_pool_size`), so 
+    each one gets at most its share of the pool as page workers.
+    """
+    queries = _field_queries(field, search_query)
+    if not queries: return [], []
+    if max_searches is None: max_searches = min(len(queries), 16)
+    pool = core._pool_size()
+    max_searches = max(1, min(max_searches, pool))
+    workers = kwags.get('max_workers') or getattr(config, 'SEARCH_WORKERS', 4)
+    kwags['max_workers'] = max(1, min(workers, pool // max_searches))
+
+    def run(value, value_query):
+        return _search_loop(search_query= value_query, url= url, tqmd= f"'{field}' is '{value}'", **kwags)
+
+    with ThreadPoolExecutor(max_workers=max_searches) as executor:
+        searches = [executor.submit(contextvars.copy_context().run, run, value, value_query) for value, value_query in queries]
+        results = [future.result() for future in searches]
+
+    seen = set()
     combined_results = []
-    list_names = search_query[field]
+    for name_results, Outputs in results:
+        combined_results.extend(_unique_records(name_results, seen))
+    return combined_results, Outputs
+
+def iter_search_over_field(field:str,
+                           url:str,
+                           search_query,
+                           **kwags):
+    """Streaming version of `search_over_field`, returns `(pages, Outputs)` like `iter_search`"""
+
+    searches = [iter_search(search_query= value_query, url= url, tqmd= f"'{field}' is '{value}'", **kwags)
+                for value, value_query in _field_queries(field, search_query)]
+
+    def pages():
+        seen = set()
+        for value_pages, _ in searches:
+            for page_results in value_pages:
+                yield _unique_records(page_results, seen)
 
-    for value in list_names:
-        search_query[field] = value
+    Outputs = searches[-1][1] if searches else []
+    return pages(), Outputs
 
-        name_results, Outputs = _search_loop(search_query= search_query, url= url, tqmd= f"'{field}' is '{value}'")
-        combined_results.extend(name_results)
+async def search_over_field_async(field:str,
+                                  url:str,
+                                  search_query,
+                                  session = None,
+                                  **kwags):
+    """Async version of `search_over_field`, the searches for each value run concurrently"""
+    
+    searches = [search_async(search_query= value_query, url= url, session= session, tqmd= f"'{field}' is '{value}'", **kwags)
+                for value, value_query in _field_queries(field, search_query)]
+
+    seen = set()
+    combined_results, Outputs = [], []
+    for name_results, Outputs in await asyncio.gather(*searches):
+        combined_results.extend(_unique_records(name_results, seen))
     return combined_results, Outputs
 
-# %% ../nbs/API/search.ipynb 9
-def get_owners(assignee_ids:list)-> dict:
-    Sess = core.get_session()
-    assignee_dict = {}
+# %% ../nbs/API/search.ipynb 11
+# The sub-searches of `search_over_field` update the shared marks from several threads at once
+_sync_marks_lock = threading.RLock()
+
+def set_sync_marks(path:str = None, # JSON file to keep high-water marks in between runs
+                  ):
+    """Configures where incremental search high-water marks are saved"""
+    config.SYNC_MARKS_PATH = path
+    config.SYNC_MARKS = None
+
+def _sync_marks_path():
+    return getattr(config, 'SYNC_MARKS_PATH', None) or os.environ.get('CU_API_SYNC_MARKS')
+
+def _sync_marks()->dict:
+    """The shared marks, loaded from the marks file the first time they are needed"""
+    with _sync_marks_lock:
+        if getattr(config, 'SYNC_MARKS', None) is None:
+            config.SYNC_MARKS = core._read_json(_sync_marks_path()) or {}
+        return config.SYNC_MARKS
+
+def _canonical(value):
+    """Sorts lists and dict keys so equivalent searches serialize the same way"""
+    if isinstance(value, dict):         return {str(key): _canonical(item) for key, item in sorted(value.items(), key=lambda pair: str(pair[0]))}
+    if isinstance(value, (list, tuple)): return sorted((_canonical(item) for item in value), key=lambda item: json.dumps(item, default=str))
+    return value
+
+def _query_key(Native_Params:dict, # Search parameters for native fields
+               CF_Parms:list, # Search parameters for custom fields
+               url:str, # Copper API url
+              )->str:
+    """Stable hash identifying a search, whatever order its fields and values were set in"""
+    payload = json.dumps(_canonical({'url': url, 'native': Native_Params or {}, 'custom_fields': CF_Parms or []}), default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+def _modified_since(Native_Params:dict, CF_Parms:list, url:str, sync_marks:dict = None)->tuple:
+    """
+    Adds the query's high-water mark to the search. Returns the new params, the query key and 
+    the mark to save once the search completes.
 
-    for userid in assignee_ids:
-        results = Sess.get(f"https://api.copper.com/developer_api/v1/users/{int(userid)}")
-        assignee_dict[userid] = results.json().get('name', None)
+    The next mark is taken now, before the first page is requested, and not from the newest 
+    `date_modified` seen: a record on an early page that changes while later pages are read 
+    is older than the records on those pages, and would never be fetched again. It is set 
+    back by `config.SYNC_OVERLAP` seconds (60 by default) to allow for clock skew with Copper.
+    """
+    next_mark = int(time.time()) - getattr(config, 'SYNC_OVERLAP', 60)
+    key = _query_key(Native_Params, CF_Parms, url)
+    mark = (_sync_marks() if sync_marks is None else sync_marks).get(key)
+    if mark is not None: Native_Params = {**Native_Params, 'minimum_modified_date': mark}
+    return Native_Params, key, next_mark
+
+def _set_sync_mark(key:str, mark:int, sync_marks:dict = None):
+    if mark is None: return
+    if sync_marks is not None:
+        sync_marks[key] = mark
+        return
+    with _sync_marks_lock:
+        marks = _sync_marks()
+        marks[key] = mark
+        core._write_json(_sync_marks_path(), marks)
+
+def get_sync_mark(search_query, # Instance of Query object
+                  url:str, # Copper API url
+                 )->int:
+    """When the last incremental run of this search started (less `config.SYNC_OVERLAP`), None if it hasn't run yet"""
+    Native_Params, CF_Parms, _ = _process_query(search_query)
+    return _sync_marks().get(_query_key(Native_Params, CF_Parms, url))
+
+def reset_sync_mark(search_query, # Instance of Query object
+                    url:str, # Copper API url
+                   ):
+    """Forgets the search's high-water mark so its next incremental run fetches everything"""
+    Native_Params, CF_Parms, _ = _process_query(search_query)
+    with _sync_marks_lock:
+        marks = _sync_marks()
+        if marks.pop(_query_key(Native_Params, CF_Parms, url), None) is not None:
+            core._write_json(_sync_marks_path(), marks)
+
+# %% ../nbs/API/search.ipynb 15
+def set_checkpoint_dir(path:str = None, # Directory to save search pages in, None to turn checkpoints off
+                      ):
+    """Sets the checkpoint directory used by searches that don't pass their own `checkpoint`"""
+    config.SEARCH_CHECKPOINT_DIR = path
+
+def _checkpoint_dir():
+    return getattr(config, 'SEARCH_CHECKPOINT_DIR', None) or os.environ.get('CU_API_CHECKPOINT_DIR')
+
+def _page_path(folder:str, page:int)->str:
+    return os.path.join(folder, f"page_{page:06d}.json.gz")
+
+def _save_page(folder:str, # Checkpoint folder of the search
+               page:int, # Page number
+               records:list, # Records returned for the page
+              ):
+    """Writes a page through a temporary file so a crash never leaves a partial page behind"""
+    _write_gz(_page_path(folder, page), records)
+
+def _load_page(folder:str, page:int)->list:
+    return _read_gz(_page_path(folder, page))
+
+def _write_gz(path:str, data):
+    """Writes gzipped JSON through a temporary file so readers never see a partial file"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with gzip.open(tmp_path, 'wt') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+def _read_gz(path:str):
+    with gzip.open(path, 'rt') as f:
+        return json.load(f)
+
+# %% ../nbs/API/search.ipynb 18
+def _account()->str:
+    """Identifies the Copper account requests are made as, without keeping the token itself"""
+    headers = getattr(config, 'COPPER_HEADERS', {})
+    token = hashlib.sha1(headers.get('X-PW-AccessToken', '').encode()).hexdigest()
+    return f"{headers.get('X-PW-UserEmail', '')}:{token}"
+
+def _cache_key(Native_Params:dict, # Search parameters for native fields
+               CF_Parms:list, # Search parameters for custom fields
+               url:str, # Copper API url
+              )->str:
+    """`_query_key` for the result cache. Other accounts see other records, so it includes the account as well"""
+    return hashlib.sha1(f"{_account()}|{_query_key(Native_Params, CF_Parms, url)}".encode()).hexdigest()
+
+class SearchCache:
+    """In-memory LRU cache of raw search pages with a TTL and an optional disk tier"""
+    def __init__(self,
+                 ttl:float = 300, # Seconds an entry stays valid, None to keep entries until they are evicted
+                 max_entries:int = 128, # Searches kept in memory
+                 path:str = None, # Directory to also keep entries in as gzipped JSON
+                ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path = path
+        self.entries = OrderedDict() # key -> (stored_at, pages)
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return f"SearchCache(ttl={self.ttl}, max_entries={self.max_entries}, path={self.path!r}, entries={len(self.entries)})"
+
+    def _file(self, key:str)->str:
+        return os.path.join(self.path, f"{key}.json.gz")
+
+    def get(self, key:str)->list:
+        """The cached pages for `key`, None if there are none or they expired"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                if core._is_fresh(entry[0], self.ttl):
+                    self.entries.move_to_end(key)
+                    return entry[1]
+                del self.entries[key]
+
+        if self.path and os.path.exists(self._file(key)):
+            try:
+                stored = _read_gz(self._file(key))
+            except (OSError, ValueError, EOFError):
+                return None
+            if core._is_fresh(stored['stored_at'], self.ttl):
+                self._remember(key, stored['stored_at'], stored['pages'])
+                return stored['pages']
+        return None
+
+    def put(self, key:str, pages:list):
+        """Stores the raw pages of a search"""
+        stored_at = time.time()
+        self._remember(key, stored_at, pages)
+        if self.path: _write_gz(self._file(key), {'stored_at': stored_at, 'pages': pages})
+
+    def _remember(self, key:str, stored_at:float, pages:list):
+        with self.lock:
+            self.entries[key] = (stored_at, pages)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries: self.entries.popitem(last=False)
+
+    def invalidate(self, key:str = None):
+        """Drops one entry, or every entry when `key` is None"""
+        with self.lock:
+            if key is None: self.entries.clear()
+            else:           self.entries.pop(key, None)
+        if self.path and os.path.isdir(self.path):
+            files = [f"{key}.json.gz"] if key else [name for name in os.listdir(self.path) if name.endswith('.json.gz')]
+            for name in files:
+                try:
+                    os.remove(os.path.join(self.path, name))
+                except FileNotFoundError:
+                    pass
+
+def set_search_cache(ttl:float = 300, # Seconds a cached search stays valid
+                     max_entries:int = 128, # Searches kept in memory
+                     path:str = None, # Directory to also keep cached searches in
+                     enabled:bool = True, # False turns the cache off again
+                    ):
+    """Turns the search result cache on (or off) for every search"""
+    config.SEARCH_CACHE = SearchCache(ttl, max_entries, path) if enabled else None
+    return config.SEARCH_CACHE
+
+def get_search_cache()->SearchCache:
+    """The search result cache, None while it is off"""
+    return getattr(config, 'SEARCH_CACHE', None)
+
+def invalidate_search_cache(search_query = None, # Instance of Query object, None to clear every search
+                            url:str = None, # Copper API url the search was made against
+                           ):
+    """Drops a cached search, or everything in the cache"""
+    result_cache = get_search_cache()
+    if result_cache is None: return
+    if search_query is None: return result_cache.invalidate()
+    Native_Params, CF_Parms, _ = _process_query(search_query)
+    result_cache.invalidate(_cache_key(Native_Params, CF_Parms, url))
+
+# %% ../nbs/API/search.ipynb 21
+def get_owners(assignee_ids:list)-> dict:
+    """Returns the name of each assignee, from the cached user directory (see `users.load_users`)"""
+    return users.get_user_names(assignee_ids)
 
-    return assignee_dict
+async def get_owners_async(assignee_ids:list, session = None)-> dict:
+    """Async version of `get_owners`"""
+    return await users.get_user_names_async(assignee_ids, session=session)
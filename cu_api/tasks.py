@@ -3,15 +3,18 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/tasks.ipynb.
 
 # %% auto 0
-__all__ = ['search', 'update']
+__all__ = ['search', 'iter_search', 'search_async', 'update']
 
 # %% ../nbs/tasks.ipynb 3
-from . import core, config
+from . import core, config, events, arrow
 from .query import Query as _Query
 from .core import set_headers as _set_headers
-from .search import _search_loop, get_owners, search_over_field
+from .clean import clean_custom_fields, _clean_date, _clean_dates, _option_names, _merge_by_id
+from .search import _search_loop, _search_options, get_owners, search_over_field
+from .search import search_async as _search_async, search_over_field_async, get_owners_async
+from .search import iter_search as _iter_search, iter_search_over_field
 import pandas as pd
-import pytz
+import time
 from tqdm.autonotebook import tqdm
 import warnings
 from tqdm import TqdmExperimentalWarning
@@ -41,29 +44,14 @@ def _clean_row(row_data:list, #Returned company data as list of dictionaries,
     custom_fields_dict = getattr(config,'CUSTOM_FIELDS_DICT')
     
 
-    def clean_date(date):
-        try:
-            if date is None:
-                return None  # Handle None values (empty rows)
-
-            if isinstance(date, int) and len(str(date)) >= 6 and len(str(date)) <= 10:
-                # If it's an integer with <= 10 digits, assume it's a Unix timestamp
-                ct_timezone = pytz.timezone('US/Central')
-                new_date = pd.to_datetime(date, unit='s',utc=True).tz_convert(ct_timezone)
-                return new_date
-            else:
-                return date
-        except Exception as e:
-            return date
-
     native_items = ['id', 'name', 'assignee_id','tags']
 
     output_dict = {}
     output_dict['related_id'] = row_data.get('related_resource').get('id',None)
     output_dict['related_type'] = row_data.get('related_resource').get('type',None)
-    output_dict['due_date'] = clean_date(row_data['due_date'])
-    output_dict['reminder_date'] = clean_date(row_data['reminder_date'])
-    output_dict['completed_date'] = clean_date(row_data['completed_date'])
+    output_dict['due_date'] = _clean_date(row_data['due_date'])
+    output_dict['reminder_date'] = _clean_date(row_data['reminder_date'])
+    output_dict['completed_date'] = _clean_date(row_data['completed_date'])
 
     for item in native_items:
         output_dict[item] = row_data.get(item, None)
@@ -79,10 +67,11 @@ def _clean_row(row_data:list, #Returned company data as list of dictionaries,
             continue
         elif item_name is not None and ('options' in list(custom_fields[item_id].keys())):
             item_value = dict_item['value']
-            value_name = core.cf_option_name(item_id,item_value)
+            # Multi-selects hold a list of option ids, mapped the same way as `clean_custom_fields` does
+            value_name = _option_names(core.get_cf_options(item_id))(item_value)
             output_dict[item_name] = value_name
         elif data_type == 'Date':
-            cleaned_date = clean_date(dict_item['value'])
+            cleaned_date = _clean_date(dict_item['value'])
             output_dict[item_name] = cleaned_date
         else:
             item_value = dict_item['value']
@@ -91,9 +80,12 @@ def _clean_row(row_data:list, #Returned company data as list of dictionaries,
     return output_dict
 
 # %% ../nbs/tasks.ipynb 9
-def _clean_dataframe(df):
-    list_assign_ids = list(df['assignee_id'].dropna().unique().astype(int))
-    assignee_dict = get_owners(list_assign_ids)
+def _clean_dataframe(df, assignee_dict:dict = None):
+    if assignee_dict is None:
+        started = time.perf_counter()
+        list_assign_ids = list(df['assignee_id'].dropna().unique().astype(int))
+        assignee_dict = get_owners(list_assign_ids)
+        events.emit('stage', name='owners', seconds=time.perf_counter() - started)
 
     df['Owned By'] = df['assignee_id'].apply(lambda value: assignee_dict.get(value))
     df.drop(columns=['assignee_id'])
@@ -107,9 +99,66 @@ def set_headers(AccessToken:str, #Access Token (API Key) provided by Copper
     
 
 # %% ../nbs/tasks.ipynb 11
+def _clean_rows(combined_results:list, # Raw records returned by the search
+                Outputs:list, # Custom fields requested by the Query
+                progress:bool = True, # Whether to show a progress bar
+                **kwargs
+               )->list:
+    """Cleans each raw record with `_clean_row`"""
+
+    # Custom Fields
+    if 'cf_fields' in kwargs:     cf_fields = kwargs.get('cf_fields')
+    else:                         cf_fields = Outputs
+
+    # Processing Rows:
+    started = time.perf_counter()
+    cleaned_rows = []
+    for result in tqdm(combined_results,'Cleaning Data',total=len(combined_results),leave=False,disable=not progress):
+        cleaned_rows.append(_clean_row(result, cf_fields))
+    events.emit('rows_cleaned', resource='tasks', rows=len(cleaned_rows), seconds=time.perf_counter() - started)
+    return cleaned_rows
+
+def _clean_records(combined_results:list, # Raw records returned by the search
+                   Outputs:list, # Custom fields requested by the Query
+                   **kwargs
+                  )->pd.DataFrame:
+    """Cleans every raw record at once, column by column. Gives the same DataFrame as `_clean_row` row by row"""
+
+    # Custom Fields
+    if 'cf_fields' in kwargs:     cf_fields = kwargs.get('cf_fields')
+    else:                         cf_fields = Outputs
+
+    started = time.perf_counter()
+    native_items = ['id', 'name', 'assignee_id','tags']
+    date_items = ['due_date', 'reminder_date', 'completed_date']
+
+    related = [result.get('related_resource') or {} for result in combined_results]
+    native_dict = {'related_id': [item.get('id',None) for item in related],
+                   'related_type': [item.get('type',None) for item in related]}
+    for item in date_items:
+        native_dict[item] = _clean_dates(pd.Series([result[item] for result in combined_results], dtype=object))
+    for item in native_items:
+        native_dict[item] = [result.get(item, None) for result in combined_results]
+
+    native_df = pd.DataFrame(native_dict).infer_objects()
+    cf_df = clean_custom_fields(combined_results, cf_fields)
+
+    assembling = time.perf_counter()
+    cleaning = assembling - started
+    cleaned = pd.concat([native_df, cf_df], axis=1)
+    events.emit('stage', name='dataframe', seconds=time.perf_counter() - assembling)
+    events.emit('rows_cleaned', resource='tasks', rows=len(cleaned), seconds=cleaning)
+    return cleaned
+
 def search(search_query,            # Instance of Query object
             clean_data:bool = True, # Whether to clean results or not
             drop:list = None,       # Columns to drop from final dataframe
+            stream:bool = False,    # Yield results page by page, see `iter_search`
+            incremental:bool = False,   # Only fetch records modified since the last incremental search, see `search.get_sync_mark`
+            previous:pd.DataFrame = None, # Earlier results to merge the changes into, by `id`
+            profile:bool = False, # Also return an `events.Profile` of where the time went
+            output:str = 'pandas', # 'pandas' for a DataFrame, or 'arrow' for a pyarrow Table (always cleaned)
+            sink = None, # With output='arrow', a Parquet file path or `arrow.ParquetSink` to stream the pages into
             **kwargs
             )->pd.DataFrame:
     """Search for task records in Copper!
@@ -119,32 +168,132 @@ def search(search_query,            # Instance of Query object
     returns the data as a pandas dataframe
 
     Supported standard fields for search: name, 
+
+    With `incremental=True` only records modified since the last incremental run of the 
+    same query are requested. They are merged by `id` into `previous` when it is given, 
+    otherwise just the changed records are returned.
+
+    With `profile=True` the result comes back as `(df, profile)`, see `events.Profile`.
+
+    With `output='arrow'` the pages are cleaned straight into a `pyarrow.Table` with a schema 
+    derived from the custom field types, see `arrow.schema`. Given a `sink`, the tables are 
+    written to Parquet as they arrive and the closed `arrow.ParquetSink` is returned instead.
     """
-    
+    if profile:
+        if stream: raise ValueError("profile can't be used with stream, listen to `events` instead")
+        with events.Profile() as report:
+            df = search(search_query, clean_data, drop, stream, incremental, previous, output=output, sink=sink, **kwargs)
+        return df, report
+
+    if output not in ('pandas', 'arrow'): raise ValueError(f"output must be 'pandas' or 'arrow', not {output!r}")
+    if output == 'arrow' and previous is not None: raise ValueError("previous can only be merged into pandas output")
+    if previous is not None and not incremental: raise ValueError("previous needs incremental=True, only the changes are merged into it")
+    if previous is not None and (stream or not clean_data): raise ValueError("previous can only be merged into cleaned results, not streamed or raw ones")
+    if stream:
+        return iter_search(search_query, clean_data, drop, incremental, output=output, **kwargs)
+    if output == 'arrow':
+        if 'name' in search_query._native_fields:
+            pages, Outputs = iter_search_over_field('name',core.api_url('tasks/search'),search_query, incremental= incremental, **_search_options(kwargs))
+        else:
+            pages, Outputs = _iter_search(search_query= search_query, url= core.api_url('tasks/search'), incremental= incremental, **_search_options(kwargs))
+        return arrow.to_arrow(pages, 'tasks', kwargs.get('cf_fields', Outputs), drop, sink)
+
     if 'name' in search_query._native_fields:
-        combined_results, Outputs = search_over_field('name','https://api.copper.com/developer_api/v1/tasks/search',search_query)
+        combined_results, Outputs = search_over_field('name',core.api_url('tasks/search'),search_query, incremental= incremental, **_search_options(kwargs))
     else:
-        combined_results, Outputs = _search_loop(search_query= search_query, url= 'https://api.copper.com/developer_api/v1/tasks/search')
-    
-    # Custom Fields
-    if 'cf_fields' in kwargs:     cf_fields = kwargs.get('cf_fields')
-    else:                         cf_fields = Outputs
-
-    # Processing Rows:
-    cleaned_rows = []
-    for result in tqdm(combined_results,'Cleaning Data',total=len(combined_results),leave=False):
-        cleaned_rows.append(_clean_row(result, cf_fields))
+        combined_results, Outputs = _search_loop(search_query= search_query, url= core.api_url('tasks/search'), incremental= incremental, **_search_options(kwargs))
     
     # To Clean, or not to Clean
     if not clean_data:
         print('Returning raw results')
-        return cleaned_rows
+        return _clean_rows(combined_results, Outputs, **kwargs)
 
-    cleaned_rows_df = pd.DataFrame(cleaned_rows)
+    cleaned_rows_df = _clean_records(combined_results, Outputs, **kwargs)
     cleaned_data_df = _clean_dataframe(cleaned_rows_df)
+    if isinstance(drop,list):      cleaned_data_df = cleaned_data_df.drop(columns=drop)
+
+    if incremental:                return _merge_by_id(previous, cleaned_data_df)
+    else:                          return cleaned_data_df 
+
+def iter_search(search_query, # Instance of Query object
+                clean_data:bool = True, # Whether to clean results or not
+                drop:list = None, # Columns to drop from each dataframe
+                incremental:bool = False, # Only fetch records modified since the last incremental search
+                output:str = 'pandas', # 'pandas' for DataFrames, or 'arrow' for pyarrow Tables
+                **kwargs
+               ):
+    """Stream task records from Copper one page at a time.
+
+    Yields a cleaned DataFrame for every page of results as it arrives (a `pyarrow.Table` 
+    with `output='arrow'`), or the cleaned rows one at a time when `clean_data` is False. 
+    Owners are only looked up the first time an assignee is seen, and memory stays flat 
+    however large the search is.
+    """
+
+    if 'name' in search_query._native_fields:
+        pages, Outputs = iter_search_over_field('name',core.api_url('tasks/search'),search_query, incremental= incremental, **_search_options(kwargs))
+    else:
+        pages, Outputs = _iter_search(search_query= search_query, url= core.api_url('tasks/search'), incremental= incremental, **_search_options(kwargs))
+
+    if output == 'arrow':
+        yield from arrow.iter_tables(pages, 'tasks', kwargs.get('cf_fields', Outputs), drop)
+        return
+
+    assignee_dict = {}
+    for page_results in pages:
+        # To Clean, or not to Clean
+        if not clean_data:
+            yield from _clean_rows(page_results, Outputs, progress=False, **kwargs)
+            continue
+
+        if not page_results: continue
+
+        cleaned_rows_df = _clean_records(page_results, Outputs, **kwargs)
+        new_ids = [userid for userid in cleaned_rows_df['assignee_id'].dropna().unique().astype(int) if userid not in assignee_dict]
+        if new_ids:
+            started = time.perf_counter()
+            assignee_dict.update(get_owners(new_ids))
+            events.emit('stage', name='owners', seconds=time.perf_counter() - started)
+        cleaned_data_df = _clean_dataframe(cleaned_rows_df, assignee_dict)
+
+        if isinstance(drop,list):      yield cleaned_data_df.drop(columns=drop)
+        else:                          yield cleaned_data_df
+
+async def search_async(search_query,            # Instance of Query object
+                       clean_data:bool = True, # Whether to clean results or not
+                       drop:list = None,       # Columns to drop from final dataframe
+                       incremental:bool = False, # Only fetch records modified since the last incremental search
+                       previous:pd.DataFrame = None, # Earlier results to merge the changes into, by `id`
+                       **kwargs
+                      )->pd.DataFrame:
+    """Async version of `search` that can be awaited from inside your own event loop.
+
+    Pages and owners are requested through the pooled `aiohttp.ClientSession` from 
+    `core.get_async_session()`.
+    """
+    if previous is not None and not incremental: raise ValueError("previous needs incremental=True, only the changes are merged into it")
+    if previous is not None and not clean_data: raise ValueError("previous can only be merged into cleaned results, not raw ones")
+
+    if 'name' in search_query._native_fields:
+        combined_results, Outputs = await search_over_field_async('name',core.api_url('tasks/search'),search_query, incremental= incremental, **_search_options(kwargs))
+    else:
+        combined_results, Outputs = await _search_async(search_query= search_query, url= core.api_url('tasks/search'), incremental= incremental, **_search_options(kwargs))
+
+    # To Clean, or not to Clean
+    if not clean_data:
+        print('Returning raw results')
+        return _clean_rows(combined_results, Outputs, **kwargs)
+
+    cleaned_rows_df = _clean_records(combined_results, Outputs, **kwargs)
+    started = time.perf_counter()
+    list_assign_ids = list(cleaned_rows_df['assignee_id'].dropna().unique().astype(int))
+    assignee_dict = await get_owners_async(list_assign_ids)
+    events.emit('stage', name='owners', seconds=time.perf_counter() - started)
+    cleaned_data_df = _clean_dataframe(cleaned_rows_df, assignee_dict)
+    if isinstance(drop,list):      cleaned_data_df = cleaned_data_df.drop(columns=drop)
 
-    if isinstance(drop,list):      return cleaned_data_df.drop(columns=drop,inplace=True)
-    else:                               return cleaned_data_df 
+    if incremental:                return _merge_by_id(previous, cleaned_data_df)
+    else:                          return cleaned_data_df 
 
 # %% ../nbs/tasks.ipynb 13
 def update(df: pd.DataFrame, columns: list, cf_ids: list = None):
@@ -167,7 +316,6 @@ def update(df: pd.DataFrame, columns: list, cf_ids: list = None):
     total_companies = len(df['id'])
     companies_updated = 0
     max_size = 10
-    Sess = core.get_session()
 
     # Initialize the tqdm progress bar
     progress_bar = tqdm(total=total_companies)
@@ -187,7 +335,7 @@ def update(df: pd.DataFrame, columns: list, cf_ids: list = None):
             payload.append(company_json)
 
         json_data = {"companies": payload}
-        request_sent = Sess.post('https://api.copper.com/developer_api/v1/companies/bulk_update', json=json_data)
+        request_sent = core.request('POST', core.api_url('companies/bulk_update'), json=json_data)
 
         if request_sent.status_code != 200:
             print(request_sent.text)
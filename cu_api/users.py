@@ -0,0 +1,133 @@
+"""Looking up the Copper users that own your records"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/users.ipynb.
+
+# %% auto 0
+__all__ = ['set_user_cache', 'load_users', 'load_users_async', 'get_user_names', 'get_user_names_async']
+
+# %% ../nbs/API/users.ipynb 3
+import os, time
+from . import core, config
+
+# %% ../nbs/API/users.ipynb 5
+def set_user_cache(path:str = None, # JSON file to keep the user directory in between runs
+                   ttl:float = 3600, # Seconds before the directory is loaded again, None to never expire
+                  ):
+    """Configures how the user directory is cached"""
+    config.USER_CACHE_PATH = path
+    config.USER_CACHE_TTL = ttl
+
+def _user_cache_path():
+    return getattr(config, 'USER_CACHE_PATH', None) or os.environ.get('CU_API_USER_CACHE')
+
+def _users_are_fresh(fetched_at:float)->bool:
+    return core._is_fresh(fetched_at, getattr(config, 'USER_CACHE_TTL', 3600))
+
+def _store_users(users:dict, # User id -> user record
+                 fetched_at:float, # When the users were loaded from Copper
+                 save:bool = True, # Whether to write the directory to the cache file
+                ):
+    config.USERS = users
+    config.USERS_FETCHED_AT = fetched_at
+    if save: core._write_json(_user_cache_path(), {'fetched_at': fetched_at, 'users': list(users.values())})
+
+def _from_disk()->bool:
+    """Loads the directory from the cache file if it is fresh"""
+    cache = core._read_json(_user_cache_path())
+    if cache is None or not _users_are_fresh(cache.get('fetched_at')): return False
+    _store_users({user['id']: user for user in cache['users']}, cache['fetched_at'], save=False)
+    return True
+
+# %% ../nbs/API/users.ipynb 6
+def load_users(refresh:bool = False, # Load users from Copper even if the cache is fresh
+              )->dict: # User id -> user record
+    """Loads every Copper user in bulk, unless the in-memory or on-disk directory is still fresh"""
+    if not refresh and _users_are_fresh(getattr(config, 'USERS_FETCHED_AT', None)): return config.USERS
+    if not refresh and _from_disk(): return config.USERS
+
+    fetched_at = time.time()
+    users = {}
+    page = 1
+    while True:
+        response = core.request('POST', core.api_url('users/search'), json={'page_size': 200, 'page_number': page})
+        if response.status_code != 200: raise Exception(f"Error {response.status_code} retrieved from API")
+
+        page_users = response.json()
+        for user in page_users: users[user['id']] = user
+        if len(page_users) < 200: break
+        page += 1
+
+    _store_users(users, fetched_at)
+    return users
+
+async def load_users_async(refresh:bool = False, # Load users from Copper even if the cache is fresh
+                           session = None, # aiohttp.ClientSession to use, defaults to core.get_async_session()
+                          )->dict: # User id -> user record
+    """Async version of `load_users`"""
+    if not refresh and _users_are_fresh(getattr(config, 'USERS_FETCHED_AT', None)): return config.USERS
+    if not refresh and _from_disk(): return config.USERS
+
+    fetched_at = time.time()
+    users = {}
+    page = 1
+    while True:
+        response = await core.request_async('POST', core.api_url('users/search'), session=session, json={'page_size': 200, 'page_number': page})
+        if response.status != 200: raise Exception(f"Error {response.status} retrieved from API")
+
+        page_users = await response.json(content_type=None)
+        for user in page_users: users[user['id']] = user
+        if len(page_users) < 200: break
+        page += 1
+
+    _store_users(users, fetched_at)
+    return users
+
+# %% ../nbs/API/users.ipynb 9
+def _add_users(users:list):
+    if not users: return
+    config.USERS.update({user['id']: user for user in users})
+    core._write_json(_user_cache_path(), {'fetched_at': config.USERS_FETCHED_AT, 'users': list(config.USERS.values())})
+
+def _found_user(userid, # Copper user id that was requested
+                status:int, # HTTP status code of the response
+                user:dict = None, # User record, when the request succeeded
+               )->list:
+    """
+    What to add to the directory for a user lookup. Users Copper doesn't know (404) are 
+    remembered as nameless so they aren't requested again; other failures, like a 5xx, 
+    aren't cached so the next lookup tries again.
+    """
+    if status == 200: return [user]
+    if status == 404: return [{'id': int(userid), 'name': None}]
+    return []
+
+def get_user_names(user_ids:list, # Copper user ids
+                  )->dict: # User id -> user name
+    """Returns the name of each user, from the user directory"""
+    users = load_users()
+
+    missing = [userid for userid in user_ids if int(userid) not in users]
+    if missing:
+        found = []
+        for userid in missing:
+            results = core.request('GET', core.api_url(f"users/{int(userid)}"))
+            found.extend(_found_user(userid, results.status_code, results.json() if results.status_code == 200 else None))
+        _add_users(found)
+
+    return {userid: users.get(int(userid), {}).get('name', None) for userid in user_ids}
+
+async def get_user_names_async(user_ids:list, # Copper user ids
+                               session = None, # aiohttp.ClientSession to use, defaults to core.get_async_session()
+                              )->dict: # User id -> user name
+    """Async version of `get_user_names`"""
+    users = await load_users_async(session=session)
+
+    missing = [userid for userid in user_ids if int(userid) not in users]
+    if missing:
+        found = []
+        for userid in missing:
+            results = await core.request_async('GET', core.api_url(f"users/{int(userid)}"), session=session)
+            found.extend(_found_user(userid, results.status, await results.json(content_type=None) if results.status == 200 else None))
+        _add_users(found)
+
+    return {userid: users.get(int(userid), {}).get('name', None) for userid in user_ids}